@@ -16,7 +16,7 @@ import argparse
 import sys
 from pathlib import Path
 
-from ramify_core import iter_targets, process_file
+from ramify_core import iter_targets, process_files
 
 
 def main() -> int:
@@ -27,6 +27,8 @@ def main() -> int:
                     help="Modify files in place (creates .bak once). Otherwise writes *.ram.als")
     ap.add_argument("--dry-run", action="store_true",
                     help="Print what would change, but don’t write anything")
+    ap.add_argument("--workers", type=int, default=None,
+                    help="Files processed in parallel (default: CPU count)")
     args = ap.parse_args()
 
     root = Path(args.path).expanduser()
@@ -36,19 +38,20 @@ def main() -> int:
     total_flips = 0
     failed = 0
 
-    for p in iter_targets(root, args.recursive):
+    results = process_files(
+        iter_targets(root, args.recursive), args.in_place, args.dry_run, args.workers
+    )
+    for p, result in results:
         total_files += 1
-        try:
-            audio_seen, flips, _wrote = process_file(
-                p, in_place=args.in_place, dry_run=args.dry_run
-            )
-            total_audio += audio_seen
-            total_flips += flips
-            action = "DRY" if args.dry_run else ("INPLACE" if args.in_place else "OUT")
-            print(f"[{action}] {p} | AudioClips={audio_seen} | RamFlips={flips}")
-        except Exception as e:
+        if isinstance(result, Exception):
             failed += 1
-            print(f"[FAIL] {p} | {e}", file=sys.stderr)
+            print(f"[FAIL] {p} | {result}", file=sys.stderr)
+            continue
+        audio_seen, flips, _wrote = result
+        total_audio += audio_seen
+        total_flips += flips
+        action = "DRY" if args.dry_run else ("INPLACE" if args.in_place else "OUT")
+        print(f"[{action}] {p} | AudioClips={audio_seen} | RamFlips={flips}")
 
     print(f"\nDone. Files={total_files}, Failed={failed}, AudioClips={total_audio}, RamFlips={total_flips}")
     if args.dry_run and total_flips > 0:
@@ -60,503 +60,608 @@ def insert_many(conn: sqlite3.Connection, sql: str, rows: Iterable[tuple]) -> No
         conn.executemany(sql, batch)
 
 
-def create_schema(conn: sqlite3.Connection) -> None:
-    conn.executescript(
-        """
-        PRAGMA journal_mode=WAL;
-        PRAGMA synchronous=NORMAL;
-
-        CREATE TABLE IF NOT EXISTS ingest_state (
-            source TEXT PRIMARY KEY,
-            offset INTEGER NOT NULL
-        );
-
-        CREATE TABLE IF NOT EXISTS ableton_prefs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            kind TEXT NOT NULL,
-            source TEXT NOT NULL,
-            mtime INTEGER NOT NULL,
-            scanned_at INTEGER NOT NULL,
-            payload_json TEXT NOT NULL
-        );
-
-        CREATE UNIQUE INDEX IF NOT EXISTS uq_ableton_prefs_source ON ableton_prefs(kind, source);
-        """
-    )
-
-    for scope in SCOPES:
-        suffix = scope_suffix(scope)
-        conn.executescript(
-            f"""
-            CREATE TABLE IF NOT EXISTS file_index{suffix} (
-                path TEXT PRIMARY KEY,
-                path_hash TEXT,
-                ext TEXT NOT NULL,
-                size INTEGER NOT NULL,
-                mtime INTEGER NOT NULL,
-                ctime INTEGER,
-                atime INTEGER,
-                inode INTEGER,
-                device INTEGER,
-                mode INTEGER,
-                uid INTEGER,
-                gid INTEGER,
-                is_symlink INTEGER,
-                symlink_target TEXT,
-                name TEXT,
-                parent TEXT,
-                mime TEXT,
-                kind TEXT NOT NULL,
-                scanned_at INTEGER NOT NULL,
-                sha1 TEXT,
-                sha1_error TEXT,
-                audio_duration REAL,
-                audio_sample_rate INTEGER,
-                audio_channels INTEGER,
-                audio_bit_depth INTEGER,
-                audio_codec TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS ableton_docs{suffix} (
-                path TEXT PRIMARY KEY,
-                ext TEXT NOT NULL,
-                kind TEXT NOT NULL,
-                scanned_at INTEGER NOT NULL,
-                error TEXT,
-                tracks_audio INTEGER,
-                tracks_midi INTEGER,
-                tracks_return INTEGER,
-                tracks_master INTEGER,
-                tracks_total INTEGER,
-                clips_audio INTEGER,
-                clips_midi INTEGER,
-                clips_total INTEGER,
-                tempo REAL
-            );
+SCOPE_VIEWS = {
+    "ableton_docs": "path, tracks_total, clips_total, error",
+    "file_index": "path, ext, size, mtime",
+}
 
-            CREATE TABLE IF NOT EXISTS ableton_struct_meta{suffix} (
-                doc_path TEXT PRIMARY KEY,
-                parse_method TEXT,
-                error TEXT
-            );
 
-            CREATE TABLE IF NOT EXISTS ableton_tracks{suffix} (
-                doc_path TEXT NOT NULL,
-                track_index INTEGER NOT NULL,
-                track_type TEXT,
-                name TEXT,
-                is_group INTEGER,
-                is_folded INTEGER,
-                meta_json TEXT,
-                PRIMARY KEY (doc_path, track_index)
-            );
+def create_scope_views(conn: sqlite3.Connection) -> None:
+    """Cross-scope ``v_<table>_all`` views with a literal ``scope`` column."""
+    for statement in _scope_view_statements():
+        conn.execute(statement)
 
-            CREATE TABLE IF NOT EXISTS ableton_clips{suffix} (
-                doc_path TEXT NOT NULL,
-                clip_index INTEGER NOT NULL,
-                track_index INTEGER,
-                clip_type TEXT,
-                name TEXT,
-                length REAL,
-                meta_json TEXT,
-                PRIMARY KEY (doc_path, clip_index)
-            );
 
-            CREATE TABLE IF NOT EXISTS ableton_devices{suffix} (
-                doc_path TEXT NOT NULL,
-                device_index INTEGER NOT NULL,
-                track_index INTEGER,
-                device_type TEXT,
-                name TEXT,
-                meta_json TEXT,
-                PRIMARY KEY (doc_path, device_index)
-            );
+def create_catalog_fts(conn: sqlite3.Connection) -> bool:
+    """External-content FTS5 index over ``catalog_docs.path``, kept in sync by triggers.
 
-            CREATE TABLE IF NOT EXISTS ableton_routing{suffix} (
-                doc_path TEXT NOT NULL,
-                track_index INTEGER,
-                direction TEXT,
-                value TEXT,
-                meta_json TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS ableton_clip_details{suffix} (
-                doc_path TEXT NOT NULL,
-                clip_index INTEGER NOT NULL,
-                track_index INTEGER,
-                clip_type TEXT,
-                name TEXT,
-                details_json TEXT,
-                PRIMARY KEY (doc_path, clip_index)
-            );
-
-            CREATE TABLE IF NOT EXISTS ableton_device_params{suffix} (
-                doc_path TEXT NOT NULL,
-                device_index INTEGER NOT NULL,
-                track_index INTEGER,
-                param_type TEXT,
-                name TEXT,
-                param_json TEXT,
-                PRIMARY KEY (doc_path, device_index, name)
-            );
-
-            CREATE TABLE IF NOT EXISTS ableton_routing_details{suffix} (
-                doc_path TEXT NOT NULL,
-                track_index INTEGER,
-                direction TEXT,
-                value TEXT,
-                meta_json TEXT
-            );
-
-            CREATE TABLE IF NOT EXISTS ableton_xml_nodes{suffix} (
-                doc_path TEXT NOT NULL,
-                ord INTEGER NOT NULL,
-                depth INTEGER,
-                tag TEXT,
-                path_tag TEXT,
-                attrs_json TEXT,
-                text TEXT,
-                text_len INTEGER,
-                text_truncated INTEGER,
-                PRIMARY KEY (doc_path, ord)
-            );
-
-            CREATE TABLE IF NOT EXISTS doc_sample_refs{suffix} (
-                doc_path TEXT NOT NULL,
-                sample_path TEXT NOT NULL,
-                scanned_at INTEGER NOT NULL
-            );
-
-            CREATE TABLE IF NOT EXISTS doc_device_hints{suffix} (
-                doc_path TEXT NOT NULL,
-                device_hint TEXT NOT NULL
+    The trigram tokenizer serves ``path LIKE '%term%'`` from the index, so search keeps
+    plain substring semantics. Returns False when this SQLite build lacks FTS5 or the
+    trigram tokenizer (3.34+); the UI then falls back to LIKE on catalog_docs.
+    """
+    row = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'catalog_fts'"
+    ).fetchone()
+    exists = row is not None and "trigram" in row[0]
+    try:
+        if row is not None and not exists:
+            # Older catalogs carry a word-token index that cannot answer mid-word terms.
+            conn.executescript(
+                """
+                DROP TRIGGER IF EXISTS catalog_docs_fts_ai;
+                DROP TRIGGER IF EXISTS catalog_docs_fts_ad;
+                DROP TRIGGER IF EXISTS catalog_docs_fts_au;
+                DROP TABLE catalog_fts;
+                """
+            )
+        conn.executescript(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS catalog_fts USING fts5(
+                path,
+                content='catalog_docs',
+                content_rowid='rowid',
+                tokenize='trigram'
             );
 
-            CREATE TABLE IF NOT EXISTS doc_device_sequence{suffix} (
-                doc_path TEXT NOT NULL,
-                ord INTEGER NOT NULL,
-                device_name TEXT NOT NULL
-            );
+            CREATE TRIGGER IF NOT EXISTS catalog_docs_fts_ai AFTER INSERT ON catalog_docs BEGIN
+                INSERT INTO catalog_fts(rowid, path) VALUES (new.rowid, new.path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS catalog_docs_fts_ad AFTER DELETE ON catalog_docs BEGIN
+                INSERT INTO catalog_fts(catalog_fts, rowid, path) VALUES ('delete', old.rowid, old.path);
+            END;
+            CREATE TRIGGER IF NOT EXISTS catalog_docs_fts_au AFTER UPDATE ON catalog_docs BEGIN
+                INSERT INTO catalog_fts(catalog_fts, rowid, path) VALUES ('delete', old.rowid, old.path);
+                INSERT INTO catalog_fts(rowid, path) VALUES (new.rowid, new.path);
+            END;
+            """
+        )
+    except sqlite3.OperationalError:
+        return False
+    if not exists:
+        rebuild_catalog_fts(conn)
+    return True
+
+
+def rebuild_catalog_fts(conn: sqlite3.Connection) -> None:
+    """Re-index catalog_fts from catalog_docs (needed after VACUUM renumbers rowids)."""
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'catalog_fts'"
+    ).fetchone():
+        conn.execute("INSERT INTO catalog_fts(catalog_fts) VALUES ('rebuild')")
+
+
+SCHEMA_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+"""
+
+BASE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS ingest_state (
+    source TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ableton_prefs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    source TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    scanned_at INTEGER NOT NULL,
+    payload_json TEXT NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_ableton_prefs_source ON ableton_prefs(kind, source);
+"""
+
+
+def _scope_schema_sql(suffix: str) -> str:
+    return f"""
+    CREATE TABLE IF NOT EXISTS file_index{suffix} (
+        path TEXT PRIMARY KEY,
+        path_hash TEXT,
+        ext TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime INTEGER NOT NULL,
+        ctime INTEGER,
+        atime INTEGER,
+        inode INTEGER,
+        device INTEGER,
+        mode INTEGER,
+        uid INTEGER,
+        gid INTEGER,
+        is_symlink INTEGER,
+        symlink_target TEXT,
+        name TEXT,
+        parent TEXT,
+        mime TEXT,
+        kind TEXT NOT NULL,
+        scanned_at INTEGER NOT NULL,
+        sha1 TEXT,
+        sha1_error TEXT,
+        audio_duration REAL,
+        audio_sample_rate INTEGER,
+        audio_channels INTEGER,
+        audio_bit_depth INTEGER,
+        audio_codec TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_docs{suffix} (
+        path TEXT PRIMARY KEY,
+        ext TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        scanned_at INTEGER NOT NULL,
+        error TEXT,
+        tracks_audio INTEGER,
+        tracks_midi INTEGER,
+        tracks_return INTEGER,
+        tracks_master INTEGER,
+        tracks_total INTEGER,
+        clips_audio INTEGER,
+        clips_midi INTEGER,
+        clips_total INTEGER,
+        tempo REAL
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_struct_meta{suffix} (
+        doc_path TEXT PRIMARY KEY,
+        parse_method TEXT,
+        error TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_tracks{suffix} (
+        doc_path TEXT NOT NULL,
+        track_index INTEGER NOT NULL,
+        track_type TEXT,
+        name TEXT,
+        is_group INTEGER,
+        is_folded INTEGER,
+        meta_json TEXT,
+        PRIMARY KEY (doc_path, track_index)
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_clips{suffix} (
+        doc_path TEXT NOT NULL,
+        clip_index INTEGER NOT NULL,
+        track_index INTEGER,
+        clip_type TEXT,
+        name TEXT,
+        length REAL,
+        meta_json TEXT,
+        PRIMARY KEY (doc_path, clip_index)
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_devices{suffix} (
+        doc_path TEXT NOT NULL,
+        device_index INTEGER NOT NULL,
+        track_index INTEGER,
+        device_type TEXT,
+        name TEXT,
+        meta_json TEXT,
+        PRIMARY KEY (doc_path, device_index)
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_routing{suffix} (
+        doc_path TEXT NOT NULL,
+        track_index INTEGER,
+        direction TEXT,
+        value TEXT,
+        meta_json TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_clip_details{suffix} (
+        doc_path TEXT NOT NULL,
+        clip_index INTEGER NOT NULL,
+        track_index INTEGER,
+        clip_type TEXT,
+        name TEXT,
+        details_json TEXT,
+        PRIMARY KEY (doc_path, clip_index)
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_device_params{suffix} (
+        doc_path TEXT NOT NULL,
+        device_index INTEGER NOT NULL,
+        track_index INTEGER,
+        param_type TEXT,
+        name TEXT,
+        param_json TEXT,
+        PRIMARY KEY (doc_path, device_index, name)
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_routing_details{suffix} (
+        doc_path TEXT NOT NULL,
+        track_index INTEGER,
+        direction TEXT,
+        value TEXT,
+        meta_json TEXT
+    );
+
+    CREATE TABLE IF NOT EXISTS ableton_xml_nodes{suffix} (
+        doc_path TEXT NOT NULL,
+        ord INTEGER NOT NULL,
+        depth INTEGER,
+        tag TEXT,
+        path_tag TEXT,
+        attrs_json TEXT,
+        text TEXT,
+        text_len INTEGER,
+        text_truncated INTEGER,
+        PRIMARY KEY (doc_path, ord)
+    );
+
+    CREATE TABLE IF NOT EXISTS doc_sample_refs{suffix} (
+        doc_path TEXT NOT NULL,
+        sample_path TEXT NOT NULL,
+        scanned_at INTEGER NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS doc_device_hints{suffix} (
+        doc_path TEXT NOT NULL,
+        device_hint TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS doc_device_sequence{suffix} (
+        doc_path TEXT NOT NULL,
+        ord INTEGER NOT NULL,
+        device_name TEXT NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS refs_graph{suffix} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        src TEXT NOT NULL,
+        src_kind TEXT NOT NULL,
+        ref_kind TEXT NOT NULL,
+        ref_path TEXT NOT NULL,
+        scanned_at INTEGER NOT NULL,
+        ref_exists INTEGER
+    );
+
+    CREATE TABLE IF NOT EXISTS scan_state{suffix} (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime INTEGER NOT NULL,
+        ctime INTEGER,
+        sha1 TEXT
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_file_index_kind{suffix} ON file_index{suffix}(kind);
+    CREATE INDEX IF NOT EXISTS idx_file_index_ext{suffix} ON file_index{suffix}(ext);
+    CREATE INDEX IF NOT EXISTS idx_file_index_sha1{suffix} ON file_index{suffix}(sha1);
+    CREATE INDEX IF NOT EXISTS idx_ableton_docs_scanned_at{suffix} ON ableton_docs{suffix}(scanned_at);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_sample_refs{suffix} ON doc_sample_refs{suffix}(doc_path, sample_path);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_device_hints{suffix} ON doc_device_hints{suffix}(doc_path, device_hint);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_device_sequence{suffix} ON doc_device_sequence{suffix}(doc_path, ord, device_name);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_refs_graph{suffix} ON refs_graph{suffix}(src, ref_kind, ref_path);
+    CREATE INDEX IF NOT EXISTS idx_doc_sample_refs_doc_path{suffix} ON doc_sample_refs{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_doc_sample_refs_sample_path{suffix} ON doc_sample_refs{suffix}(sample_path);
+    CREATE INDEX IF NOT EXISTS idx_doc_device_hints_device{suffix} ON doc_device_hints{suffix}(device_hint);
+    CREATE INDEX IF NOT EXISTS idx_doc_device_sequence_doc{suffix} ON doc_device_sequence{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_doc_device_sequence_name{suffix} ON doc_device_sequence{suffix}(device_name);
+    CREATE INDEX IF NOT EXISTS idx_refs_graph_src{suffix} ON refs_graph{suffix}(src);
+    CREATE INDEX IF NOT EXISTS idx_refs_graph_ref_path{suffix} ON refs_graph{suffix}(ref_path);
+    CREATE INDEX IF NOT EXISTS idx_refs_graph_ref_kind{suffix} ON refs_graph{suffix}(ref_kind);
+    CREATE INDEX IF NOT EXISTS idx_ableton_tracks_name{suffix} ON ableton_tracks{suffix}(name);
+    CREATE INDEX IF NOT EXISTS idx_ableton_clips_name{suffix} ON ableton_clips{suffix}(name);
+    CREATE INDEX IF NOT EXISTS idx_ableton_devices_name{suffix} ON ableton_devices{suffix}(name);
+    CREATE INDEX IF NOT EXISTS idx_ableton_tracks_doc{suffix} ON ableton_tracks{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_clips_doc{suffix} ON ableton_clips{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_devices_doc{suffix} ON ableton_devices{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_routing_doc{suffix} ON ableton_routing{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_clip_details_doc{suffix} ON ableton_clip_details{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_device_params_doc{suffix} ON ableton_device_params{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_routing_details_doc{suffix} ON ableton_routing_details{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_xml_nodes_doc{suffix} ON ableton_xml_nodes{suffix}(doc_path);
+    CREATE INDEX IF NOT EXISTS idx_ableton_xml_nodes_tag{suffix} ON ableton_xml_nodes{suffix}(tag);
+    """
+
+
+SHARED_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS audio_analysis (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    duration_sec REAL,
+    sample_rate INTEGER,
+    channels INTEGER,
+    bit_depth INTEGER,
+    codec TEXT,
+    scanned_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS plugin_index (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    name TEXT,
+    vendor TEXT,
+    version TEXT,
+    format TEXT,
+    bundle_id TEXT,
+    scanned_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS catalog_docs (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    ext TEXT,
+    size INTEGER,
+    mtime INTEGER,
+    tracks_total INTEGER,
+    clips_total INTEGER,
+    has_devices INTEGER,
+    has_samples INTEGER,
+    missing_refs INTEGER,
+    scanned_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS device_usage (
+    scope TEXT NOT NULL,
+    device_name TEXT NOT NULL,
+    usage_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, device_name)
+);
+
+CREATE TABLE IF NOT EXISTS device_chain_stats (
+    scope TEXT NOT NULL,
+    chain TEXT NOT NULL,
+    chain_len INTEGER NOT NULL,
+    usage_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, chain)
+);
+
+CREATE TABLE IF NOT EXISTS device_cooccurrence (
+    scope TEXT NOT NULL,
+    device_a TEXT NOT NULL,
+    device_b TEXT NOT NULL,
+    usage_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, device_a, device_b)
+);
+
+CREATE TABLE IF NOT EXISTS doc_complexity (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    tracks_total INTEGER,
+    clips_total INTEGER,
+    devices_count INTEGER,
+    samples_count INTEGER,
+    missing_refs_count INTEGER,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS library_growth (
+    scope TEXT NOT NULL,
+    snapshot_at INTEGER NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    media_bytes INTEGER NOT NULL,
+    doc_count INTEGER NOT NULL,
+    PRIMARY KEY (scope, snapshot_at)
+);
+
+CREATE TABLE IF NOT EXISTS missing_refs_by_path (
+    scope TEXT NOT NULL,
+    ref_parent TEXT NOT NULL,
+    missing_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, ref_parent)
+);
+
+CREATE TABLE IF NOT EXISTS set_health (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    tracks_total INTEGER,
+    clips_total INTEGER,
+    devices_count INTEGER,
+    samples_count INTEGER,
+    missing_refs_count INTEGER,
+    health_score REAL NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS audio_footprint (
+    scope TEXT NOT NULL,
+    total_media_bytes INTEGER NOT NULL,
+    referenced_media_bytes INTEGER NOT NULL,
+    unreferenced_media_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope)
+);
+
+CREATE TABLE IF NOT EXISTS set_storage_summary (
+    scope TEXT NOT NULL,
+    total_sets INTEGER NOT NULL,
+    total_set_bytes INTEGER NOT NULL,
+    non_backup_sets INTEGER NOT NULL,
+    non_backup_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope)
+);
+
+CREATE TABLE IF NOT EXISTS set_activity_stats (
+    scope TEXT NOT NULL,
+    window_days INTEGER NOT NULL,
+    set_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, window_days)
+);
+
+CREATE TABLE IF NOT EXISTS set_size_top (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    mtime INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path)
+);
+
+CREATE TABLE IF NOT EXISTS unreferenced_audio_by_path (
+    scope TEXT NOT NULL,
+    parent_path TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, parent_path)
+);
+
+CREATE TABLE IF NOT EXISTS quality_issues (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    issue TEXT NOT NULL,
+    issue_value INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path, issue)
+);
+
+CREATE TABLE IF NOT EXISTS device_usage_recent (
+    scope TEXT NOT NULL,
+    window_days INTEGER NOT NULL,
+    device_name TEXT NOT NULL,
+    usage_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, window_days, device_name)
+);
+
+CREATE TABLE IF NOT EXISTS set_activity_delta (
+    scope TEXT NOT NULL,
+    window_days INTEGER NOT NULL,
+    current_sets INTEGER NOT NULL,
+    previous_sets INTEGER NOT NULL,
+    current_bytes INTEGER NOT NULL,
+    previous_bytes INTEGER NOT NULL,
+    delta_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, window_days)
+);
+
+CREATE TABLE IF NOT EXISTS set_growth_by_parent (
+    scope TEXT NOT NULL,
+    window_days INTEGER NOT NULL,
+    parent_path TEXT NOT NULL,
+    current_sets INTEGER NOT NULL,
+    previous_sets INTEGER NOT NULL,
+    current_bytes INTEGER NOT NULL,
+    previous_bytes INTEGER NOT NULL,
+    delta_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, window_days, parent_path)
+);
+
+CREATE TABLE IF NOT EXISTS sample_duplicate_groups (
+    scope TEXT NOT NULL,
+    sha1 TEXT NOT NULL,
+    file_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    example_path TEXT,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, sha1)
+);
+
+CREATE TABLE IF NOT EXISTS cold_samples_summary (
+    scope TEXT NOT NULL,
+    cutoff_days INTEGER NOT NULL,
+    sample_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, cutoff_days)
+);
+
+CREATE TABLE IF NOT EXISTS cold_samples_by_path (
+    scope TEXT NOT NULL,
+    cutoff_days INTEGER NOT NULL,
+    parent_path TEXT NOT NULL,
+    sample_count INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, cutoff_days, parent_path)
+);
+
+CREATE TABLE IF NOT EXISTS routing_anomalies (
+    scope TEXT NOT NULL,
+    path TEXT NOT NULL,
+    issue TEXT NOT NULL,
+    issue_value INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, path, issue)
+);
+
+CREATE TABLE IF NOT EXISTS device_pair_anomalies (
+    scope TEXT NOT NULL,
+    device_a TEXT NOT NULL,
+    device_b TEXT NOT NULL,
+    usage_count INTEGER NOT NULL,
+    computed_at INTEGER NOT NULL,
+    PRIMARY KEY (scope, device_a, device_b)
+);
+
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_scope ON catalog_docs(scope);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_missing ON catalog_docs(missing_refs);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_devices ON catalog_docs(has_devices);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_samples ON catalog_docs(has_samples);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_scope_scanned ON catalog_docs(scope, scanned_at DESC);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_scanned ON catalog_docs(scanned_at DESC);
+CREATE INDEX IF NOT EXISTS idx_catalog_docs_scope_mtime ON catalog_docs(scope, mtime DESC);
+CREATE INDEX IF NOT EXISTS idx_ableton_prefs_mtime ON ableton_prefs(mtime DESC);
+CREATE INDEX IF NOT EXISTS idx_device_cooccurrence_count ON device_cooccurrence(usage_count);
+CREATE INDEX IF NOT EXISTS idx_library_growth_scope ON library_growth(scope);
+CREATE INDEX IF NOT EXISTS idx_missing_refs_scope ON missing_refs_by_path(scope);
+CREATE INDEX IF NOT EXISTS idx_set_health_scope ON set_health(scope);
+CREATE INDEX IF NOT EXISTS idx_audio_footprint_scope ON audio_footprint(scope);
+CREATE INDEX IF NOT EXISTS idx_set_storage_summary_scope ON set_storage_summary(scope);
+CREATE INDEX IF NOT EXISTS idx_set_activity_stats_scope ON set_activity_stats(scope);
+CREATE INDEX IF NOT EXISTS idx_set_size_top_scope ON set_size_top(scope);
+CREATE INDEX IF NOT EXISTS idx_unreferenced_audio_by_path_scope ON unreferenced_audio_by_path(scope);
+CREATE INDEX IF NOT EXISTS idx_quality_issues_scope ON quality_issues(scope);
+CREATE INDEX IF NOT EXISTS idx_device_usage_recent_scope ON device_usage_recent(scope);
+CREATE INDEX IF NOT EXISTS idx_set_activity_delta_scope ON set_activity_delta(scope);
+CREATE INDEX IF NOT EXISTS idx_set_growth_by_parent_scope ON set_growth_by_parent(scope);
+CREATE INDEX IF NOT EXISTS idx_sample_duplicate_groups_scope ON sample_duplicate_groups(scope);
+CREATE INDEX IF NOT EXISTS idx_cold_samples_summary_scope ON cold_samples_summary(scope);
+CREATE INDEX IF NOT EXISTS idx_cold_samples_by_path_scope ON cold_samples_by_path(scope);
+CREATE INDEX IF NOT EXISTS idx_routing_anomalies_scope ON routing_anomalies(scope);
+CREATE INDEX IF NOT EXISTS idx_device_pair_anomalies_scope ON device_pair_anomalies(scope);
+"""
+
+
+def _scope_view_statements() -> list[str]:
+    statements = []
+    for table, columns in SCOPE_VIEWS.items():
+        union = " UNION ALL ".join(
+            f"SELECT '{scope}' AS scope, {columns} FROM {scoped_name(table, scope)}"
+            for scope in SCOPES
+        )
+        statements.append(f"CREATE VIEW IF NOT EXISTS v_{table}_all AS {union};")
+    return statements
 
-            CREATE TABLE IF NOT EXISTS refs_graph{suffix} (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                src TEXT NOT NULL,
-                src_kind TEXT NOT NULL,
-                ref_kind TEXT NOT NULL,
-                ref_path TEXT NOT NULL,
-                scanned_at INTEGER NOT NULL,
-                ref_exists INTEGER
-            );
 
-            CREATE TABLE IF NOT EXISTS scan_state{suffix} (
-                path TEXT PRIMARY KEY,
-                size INTEGER NOT NULL,
-                mtime INTEGER NOT NULL,
-                ctime INTEGER,
-                sha1 TEXT
-            );
+# Built once at import; create_schema runs it as a single script and transaction.
+SCHEMA_SQL = "\n".join(
+    [
+        BASE_SCHEMA_SQL,
+        *(_scope_schema_sql(scope_suffix(scope)) for scope in SCOPES),
+        *_scope_view_statements(),
+        SHARED_SCHEMA_SQL,
+    ]
+)
 
-            CREATE INDEX IF NOT EXISTS idx_file_index_kind{suffix} ON file_index{suffix}(kind);
-            CREATE INDEX IF NOT EXISTS idx_file_index_ext{suffix} ON file_index{suffix}(ext);
-            CREATE INDEX IF NOT EXISTS idx_file_index_sha1{suffix} ON file_index{suffix}(sha1);
-            CREATE INDEX IF NOT EXISTS idx_ableton_docs_scanned_at{suffix} ON ableton_docs{suffix}(scanned_at);
-            CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_sample_refs{suffix} ON doc_sample_refs{suffix}(doc_path, sample_path);
-            CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_device_hints{suffix} ON doc_device_hints{suffix}(doc_path, device_hint);
-            CREATE UNIQUE INDEX IF NOT EXISTS uq_doc_device_sequence{suffix} ON doc_device_sequence{suffix}(doc_path, ord, device_name);
-            CREATE UNIQUE INDEX IF NOT EXISTS uq_refs_graph{suffix} ON refs_graph{suffix}(src, ref_kind, ref_path);
-            CREATE INDEX IF NOT EXISTS idx_doc_sample_refs_doc_path{suffix} ON doc_sample_refs{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_doc_sample_refs_sample_path{suffix} ON doc_sample_refs{suffix}(sample_path);
-            CREATE INDEX IF NOT EXISTS idx_doc_device_hints_device{suffix} ON doc_device_hints{suffix}(device_hint);
-            CREATE INDEX IF NOT EXISTS idx_doc_device_sequence_doc{suffix} ON doc_device_sequence{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_doc_device_sequence_name{suffix} ON doc_device_sequence{suffix}(device_name);
-            CREATE INDEX IF NOT EXISTS idx_refs_graph_src{suffix} ON refs_graph{suffix}(src);
-            CREATE INDEX IF NOT EXISTS idx_refs_graph_ref_path{suffix} ON refs_graph{suffix}(ref_path);
-            CREATE INDEX IF NOT EXISTS idx_refs_graph_ref_kind{suffix} ON refs_graph{suffix}(ref_kind);
-            CREATE INDEX IF NOT EXISTS idx_ableton_tracks_name{suffix} ON ableton_tracks{suffix}(name);
-            CREATE INDEX IF NOT EXISTS idx_ableton_clips_name{suffix} ON ableton_clips{suffix}(name);
-            CREATE INDEX IF NOT EXISTS idx_ableton_devices_name{suffix} ON ableton_devices{suffix}(name);
-            CREATE INDEX IF NOT EXISTS idx_ableton_tracks_doc{suffix} ON ableton_tracks{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_clips_doc{suffix} ON ableton_clips{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_devices_doc{suffix} ON ableton_devices{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_routing_doc{suffix} ON ableton_routing{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_clip_details_doc{suffix} ON ableton_clip_details{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_device_params_doc{suffix} ON ableton_device_params{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_routing_details_doc{suffix} ON ableton_routing_details{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_xml_nodes_doc{suffix} ON ableton_xml_nodes{suffix}(doc_path);
-            CREATE INDEX IF NOT EXISTS idx_ableton_xml_nodes_tag{suffix} ON ableton_xml_nodes{suffix}(tag);
-            """
-        )
 
-    conn.executescript(
-        """
-        CREATE TABLE IF NOT EXISTS audio_analysis (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            duration_sec REAL,
-            sample_rate INTEGER,
-            channels INTEGER,
-            bit_depth INTEGER,
-            codec TEXT,
-            scanned_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS plugin_index (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            name TEXT,
-            vendor TEXT,
-            version TEXT,
-            format TEXT,
-            bundle_id TEXT,
-            scanned_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS catalog_docs (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            ext TEXT,
-            size INTEGER,
-            mtime INTEGER,
-            tracks_total INTEGER,
-            clips_total INTEGER,
-            has_devices INTEGER,
-            has_samples INTEGER,
-            missing_refs INTEGER,
-            scanned_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS device_usage (
-            scope TEXT NOT NULL,
-            device_name TEXT NOT NULL,
-            usage_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, device_name)
-        );
-
-        CREATE TABLE IF NOT EXISTS device_chain_stats (
-            scope TEXT NOT NULL,
-            chain TEXT NOT NULL,
-            chain_len INTEGER NOT NULL,
-            usage_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, chain)
-        );
-
-        CREATE TABLE IF NOT EXISTS device_cooccurrence (
-            scope TEXT NOT NULL,
-            device_a TEXT NOT NULL,
-            device_b TEXT NOT NULL,
-            usage_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, device_a, device_b)
-        );
-
-        CREATE TABLE IF NOT EXISTS doc_complexity (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            tracks_total INTEGER,
-            clips_total INTEGER,
-            devices_count INTEGER,
-            samples_count INTEGER,
-            missing_refs_count INTEGER,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS library_growth (
-            scope TEXT NOT NULL,
-            snapshot_at INTEGER NOT NULL,
-            file_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            media_bytes INTEGER NOT NULL,
-            doc_count INTEGER NOT NULL,
-            PRIMARY KEY (scope, snapshot_at)
-        );
-
-        CREATE TABLE IF NOT EXISTS missing_refs_by_path (
-            scope TEXT NOT NULL,
-            ref_parent TEXT NOT NULL,
-            missing_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, ref_parent)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_health (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            tracks_total INTEGER,
-            clips_total INTEGER,
-            devices_count INTEGER,
-            samples_count INTEGER,
-            missing_refs_count INTEGER,
-            health_score REAL NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS audio_footprint (
-            scope TEXT NOT NULL,
-            total_media_bytes INTEGER NOT NULL,
-            referenced_media_bytes INTEGER NOT NULL,
-            unreferenced_media_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_storage_summary (
-            scope TEXT NOT NULL,
-            total_sets INTEGER NOT NULL,
-            total_set_bytes INTEGER NOT NULL,
-            non_backup_sets INTEGER NOT NULL,
-            non_backup_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_activity_stats (
-            scope TEXT NOT NULL,
-            window_days INTEGER NOT NULL,
-            set_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, window_days)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_size_top (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            size_bytes INTEGER NOT NULL,
-            mtime INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path)
-        );
-
-        CREATE TABLE IF NOT EXISTS unreferenced_audio_by_path (
-            scope TEXT NOT NULL,
-            parent_path TEXT NOT NULL,
-            file_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, parent_path)
-        );
-
-        CREATE TABLE IF NOT EXISTS quality_issues (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            issue TEXT NOT NULL,
-            issue_value INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path, issue)
-        );
-
-        CREATE TABLE IF NOT EXISTS device_usage_recent (
-            scope TEXT NOT NULL,
-            window_days INTEGER NOT NULL,
-            device_name TEXT NOT NULL,
-            usage_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, window_days, device_name)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_activity_delta (
-            scope TEXT NOT NULL,
-            window_days INTEGER NOT NULL,
-            current_sets INTEGER NOT NULL,
-            previous_sets INTEGER NOT NULL,
-            current_bytes INTEGER NOT NULL,
-            previous_bytes INTEGER NOT NULL,
-            delta_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, window_days)
-        );
-
-        CREATE TABLE IF NOT EXISTS set_growth_by_parent (
-            scope TEXT NOT NULL,
-            window_days INTEGER NOT NULL,
-            parent_path TEXT NOT NULL,
-            current_sets INTEGER NOT NULL,
-            previous_sets INTEGER NOT NULL,
-            current_bytes INTEGER NOT NULL,
-            previous_bytes INTEGER NOT NULL,
-            delta_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, window_days, parent_path)
-        );
-
-        CREATE TABLE IF NOT EXISTS sample_duplicate_groups (
-            scope TEXT NOT NULL,
-            sha1 TEXT NOT NULL,
-            file_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            example_path TEXT,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, sha1)
-        );
-
-        CREATE TABLE IF NOT EXISTS cold_samples_summary (
-            scope TEXT NOT NULL,
-            cutoff_days INTEGER NOT NULL,
-            sample_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, cutoff_days)
-        );
-
-        CREATE TABLE IF NOT EXISTS cold_samples_by_path (
-            scope TEXT NOT NULL,
-            cutoff_days INTEGER NOT NULL,
-            parent_path TEXT NOT NULL,
-            sample_count INTEGER NOT NULL,
-            total_bytes INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, cutoff_days, parent_path)
-        );
-
-        CREATE TABLE IF NOT EXISTS routing_anomalies (
-            scope TEXT NOT NULL,
-            path TEXT NOT NULL,
-            issue TEXT NOT NULL,
-            issue_value INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, path, issue)
-        );
-
-        CREATE TABLE IF NOT EXISTS device_pair_anomalies (
-            scope TEXT NOT NULL,
-            device_a TEXT NOT NULL,
-            device_b TEXT NOT NULL,
-            usage_count INTEGER NOT NULL,
-            computed_at INTEGER NOT NULL,
-            PRIMARY KEY (scope, device_a, device_b)
-        );
-
-        CREATE INDEX IF NOT EXISTS idx_catalog_docs_scope ON catalog_docs(scope);
-        CREATE INDEX IF NOT EXISTS idx_catalog_docs_missing ON catalog_docs(missing_refs);
-        CREATE INDEX IF NOT EXISTS idx_catalog_docs_devices ON catalog_docs(has_devices);
-        CREATE INDEX IF NOT EXISTS idx_catalog_docs_samples ON catalog_docs(has_samples);
-        CREATE INDEX IF NOT EXISTS idx_device_cooccurrence_count ON device_cooccurrence(usage_count);
-        CREATE INDEX IF NOT EXISTS idx_library_growth_scope ON library_growth(scope);
-        CREATE INDEX IF NOT EXISTS idx_missing_refs_scope ON missing_refs_by_path(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_health_scope ON set_health(scope);
-        CREATE INDEX IF NOT EXISTS idx_audio_footprint_scope ON audio_footprint(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_storage_summary_scope ON set_storage_summary(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_activity_stats_scope ON set_activity_stats(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_size_top_scope ON set_size_top(scope);
-        CREATE INDEX IF NOT EXISTS idx_unreferenced_audio_by_path_scope ON unreferenced_audio_by_path(scope);
-        CREATE INDEX IF NOT EXISTS idx_quality_issues_scope ON quality_issues(scope);
-        CREATE INDEX IF NOT EXISTS idx_device_usage_recent_scope ON device_usage_recent(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_activity_delta_scope ON set_activity_delta(scope);
-        CREATE INDEX IF NOT EXISTS idx_set_growth_by_parent_scope ON set_growth_by_parent(scope);
-        CREATE INDEX IF NOT EXISTS idx_sample_duplicate_groups_scope ON sample_duplicate_groups(scope);
-        CREATE INDEX IF NOT EXISTS idx_cold_samples_summary_scope ON cold_samples_summary(scope);
-        CREATE INDEX IF NOT EXISTS idx_cold_samples_by_path_scope ON cold_samples_by_path(scope);
-        CREATE INDEX IF NOT EXISTS idx_routing_anomalies_scope ON routing_anomalies(scope);
-        CREATE INDEX IF NOT EXISTS idx_device_pair_anomalies_scope ON device_pair_anomalies(scope);
-        """
-    )
+def create_schema(conn: sqlite3.Connection) -> None:
+    # journal_mode cannot change inside a transaction, so the pragmas go first.
+    conn.executescript(SCHEMA_PRAGMAS)
+    try:
+        # One commit for the whole schema instead of one per CREATE statement.
+        conn.executescript(f"BEGIN;\n{SCHEMA_SQL}\nCOMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    create_catalog_fts(conn)
 
 
 def get_ingest_offset(conn: sqlite3.Connection, source: str) -> int:
@@ -596,10 +701,42 @@ def read_jsonl_incremental(
     return start_offset
 
 
-def ensure_column(conn: sqlite3.Connection, table: str, column: str, ddl: str) -> None:
-    cols = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+def table_columns(conn: sqlite3.Connection, table: str) -> set[str]:
+    return {
+        row[0] for row in conn.execute("SELECT name FROM pragma_table_info(?)", (table,))
+    }
+
+
+def ensure_column(
+    conn: sqlite3.Connection,
+    table: str,
+    column: str,
+    ddl: str,
+    existing: set[str] | None = None,
+) -> None:
+    """Add ``column`` if missing; pass ``existing`` to reuse one table_info fetch."""
+    cols = table_columns(conn, table) if existing is None else existing
     if column not in cols:
         conn.execute(f"ALTER TABLE {table} ADD COLUMN {ddl}")
+        cols.add(column)
+
+
+def ensure_query_indexes(conn: sqlite3.Connection, scope: str) -> None:
+    """Covering indexes for the UI set list, detail counts and missing-refs audit.
+
+    Created after column migration because the partial indexes need ref_exists.
+    """
+    suffix = scope_suffix(scope)
+    conn.executescript(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_file_index_mtime{suffix}
+            ON file_index{suffix}(mtime DESC, ext, path);
+        CREATE INDEX IF NOT EXISTS idx_refs_graph_missing{suffix}
+            ON refs_graph{suffix}(ref_path, src) WHERE ref_exists = 0;
+        CREATE INDEX IF NOT EXISTS idx_refs_graph_src_missing{suffix}
+            ON refs_graph{suffix}(src) WHERE ref_exists = 0;
+        """
+    )
 
 
 def ensure_file_index_columns(conn: sqlite3.Connection, table: str) -> None:
@@ -623,8 +760,9 @@ def ensure_file_index_columns(conn: sqlite3.Connection, table: str) -> None:
         "audio_bit_depth": "audio_bit_depth INTEGER",
         "audio_codec": "audio_codec TEXT",
     }
+    existing = table_columns(conn, table)
     for col, ddl in columns.items():
-        ensure_column(conn, table, col, ddl)
+        ensure_column(conn, table, col, ddl, existing)
     conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_path_hash ON {table}(path_hash)")
 
 
@@ -1339,6 +1477,7 @@ def migrate_catalog(catalog: CatalogPaths, db_path: Path, incremental: bool) ->
             ensure_ableton_struct_columns(conn, scope)
             ensure_column(conn, refs_table, "ref_exists", "ref_exists INTEGER")
             ensure_column(conn, scan_state_table, "ctime", "ctime INTEGER")
+            ensure_query_indexes(conn, scope)
 
             file_index_path = catalog.root / f"file_index{suffix}.jsonl"
             docs_path = catalog.root / f"ableton_docs{suffix}.jsonl"
@@ -1376,7 +1515,7 @@ def migrate_catalog(catalog: CatalogPaths, db_path: Path, incremental: bool) ->
         conn.close()
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     ap = argparse.ArgumentParser(
         prog="abletools-catalog-db",
         description="Build a SQLite database from a .abletools_catalog JSONL snapshot.",
@@ -1412,11 +1551,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Run VACUUM after migration to optimize the database.",
     )
-    return ap.parse_args()
+    return ap.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     catalog_dir = Path(args.catalog).expanduser().resolve()
     if not catalog_dir.exists() or not catalog_dir.is_dir():
         raise SystemExit(f"Catalog directory does not exist: {catalog_dir}")
@@ -1452,6 +1591,8 @@ def main() -> int:
         conn = sqlite3.connect(db_path)
         try:
             conn.execute("VACUUM")
+            rebuild_catalog_fts(conn)
+            conn.commit()
         finally:
             conn.close()
 
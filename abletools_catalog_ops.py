@@ -1,99 +1,114 @@
 from __future__ import annotations
 
-import shutil
-from datetime import datetime
+import fnmatch
 import json
+import os
+import shutil
 import sqlite3
+import zipfile
+from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
 from abletools_catalog_db import SCOPES, scope_suffix
 from abletools_scan import ABLETON_DOC_EXTS, MEDIA_EXTS
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+PRUNE_IO_BUFFER = 1024 * 1024
+# Extensions file_index keeps when pruning (JSONL snapshots and DB tables alike).
+PRUNE_KEEP_EXTS = frozenset(ABLETON_DOC_EXTS | MEDIA_EXTS)
+# Already-compressed formats (sets and presets are gzip); zipped with ZIP_STORED.
+PRECOMPRESSED_EXTS = {
+    ".als",
+    ".alc",
+    ".adg",
+    ".adv",
+    ".flac",
+    ".mp3",
+    ".ogg",
+    ".m4a",
+    ".aac",
+    ".zip",
+}
+
+
+CLEANUP_PATTERNS: dict[str, tuple[str, ...]] = {
+    "logs": ("scan_log_*.txt", "scan_log_targeted_*.txt", "missing_refs_audit_*.txt"),
+    "xml_nodes": ("ableton_xml_nodes*.jsonl",),
+    "device_params": ("ableton_device_params*.jsonl",),
+    "refs_graph": ("refs_graph*.jsonl",),
+    "struct": (
+        "ableton_struct*.jsonl",
+        "ableton_clip_details*.jsonl",
+        "ableton_routing_details*.jsonl",
+    ),
+    "scan_state": ("scan_state*.json", "dir_state*.json", "scan_checkpoint*.json"),
+}
+
 
 def cleanup_catalog_dir(catalog_dir: Path, options: dict[str, bool]) -> tuple[int, int]:
     if not catalog_dir.exists():
         return 0, 0
+    patterns = [
+        pattern
+        for option, option_patterns in CLEANUP_PATTERNS.items()
+        if options.get(option)
+        for pattern in option_patterns
+    ]
     removed = 0
     bytes_freed = 0
-
-    def _remove(path: Path) -> None:
-        nonlocal removed, bytes_freed
-        try:
-            bytes_freed += path.stat().st_size
-        except OSError:
-            pass
-        try:
-            path.unlink()
+    if not patterns:
+        return removed, bytes_freed
+    # One directory listing for every selected pattern instead of a glob per pattern.
+    with os.scandir(catalog_dir) as entries:
+        for entry in entries:
+            if not any(fnmatch.fnmatch(entry.name, pattern) for pattern in patterns):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                size = entry.stat(follow_symlinks=False).st_size
+                os.unlink(entry.path)
+            except OSError:
+                continue
             removed += 1
-        except OSError:
-            pass
-
-    if options.get("logs"):
-        for path in catalog_dir.glob("scan_log_*.txt"):
-            _remove(path)
-        for path in catalog_dir.glob("scan_log_targeted_*.txt"):
-            _remove(path)
-        for path in catalog_dir.glob("missing_refs_audit_*.txt"):
-            _remove(path)
-
-    if options.get("xml_nodes"):
-        for path in catalog_dir.glob("ableton_xml_nodes*.jsonl"):
-            _remove(path)
-
-    if options.get("device_params"):
-        for path in catalog_dir.glob("ableton_device_params*.jsonl"):
-            _remove(path)
-
-    if options.get("refs_graph"):
-        for path in catalog_dir.glob("refs_graph*.jsonl"):
-            _remove(path)
-
-    if options.get("struct"):
-        for pattern in (
-            "ableton_struct*.jsonl",
-            "ableton_clip_details*.jsonl",
-            "ableton_routing_details*.jsonl",
-        ):
-            for path in catalog_dir.glob(pattern):
-                _remove(path)
-
-    if options.get("scan_state"):
-        for pattern in ("scan_state*.json", "dir_state*.json", "scan_checkpoint*.json"):
-            for path in catalog_dir.glob(pattern):
-                _remove(path)
-
+            bytes_freed += size
     return removed, bytes_freed
 
 
 def prune_file_index_jsonl(catalog_dir: Path) -> tuple[int, int]:
     removed = 0
     bytes_freed = 0
-    allowed_exts = ABLETON_DOC_EXTS | MEDIA_EXTS
+    loads = orjson.loads if orjson is not None else json.loads
     for path in catalog_dir.glob("file_index*.jsonl"):
         if not path.exists():
             continue
         before_size = path.stat().st_size
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        kept_lines = 0
         removed_lines = 0
-        with path.open("r", encoding="utf-8") as src, tmp_path.open(
-            "w", encoding="utf-8"
+        # Bytes in, bytes out: lines are streamed through without decoding to str.
+        with open(path, "rb", buffering=PRUNE_IO_BUFFER) as src, open(
+            tmp_path, "wb", buffering=PRUNE_IO_BUFFER
         ) as dst:
             for line in src:
                 stripped = line.strip()
                 if not stripped:
                     continue
                 try:
-                    rec = json.loads(stripped)
-                except json.JSONDecodeError:
+                    rec = loads(stripped)
+                except ValueError:
+                    rec = None
+                if not isinstance(rec, dict):
+                    # Keep anything that is not a record; only known-bad extensions go.
                     dst.write(line)
-                    kept_lines += 1
                     continue
                 ext = str(rec.get("ext") or "").lower()
-                if ext in allowed_exts:
+                if ext in PRUNE_KEEP_EXTS:
                     dst.write(line)
-                    kept_lines += 1
                 else:
                     removed_lines += 1
         tmp_path.replace(path)
@@ -103,34 +118,73 @@ def prune_file_index_jsonl(catalog_dir: Path) -> tuple[int, int]:
     return removed, bytes_freed
 
 
-def prune_db_file_index(db_path: Path) -> tuple[int, int]:
+def prune_file_index_rows(conn: sqlite3.Connection) -> int:
+    """Delete file_index rows of unsupported extensions in every scope; returns the count."""
+    allowed_exts = sorted(PRUNE_KEEP_EXTS)
+    placeholders = ",".join("?" for _ in allowed_exts)
     removed = 0
-    bytes_freed = 0
-    allowed_exts = sorted(ABLETON_DOC_EXTS | MEDIA_EXTS)
-    if not db_path.exists():
-        return removed, bytes_freed
-    conn = sqlite3.connect(db_path)
-    try:
+    # One transaction for all scopes; DELETE's rowcount replaces a COUNT(*) pass.
+    with conn:
         for scope in SCOPES:
-            suffix = scope_suffix(scope)
-            table = f"file_index{suffix}"
-            placeholders = ",".join("?" for _ in allowed_exts)
+            table = f"file_index{scope_suffix(scope)}"
             cur = conn.execute(
-                f"SELECT COUNT(*) FROM {table} WHERE ext NOT IN ({placeholders})",
+                f"DELETE FROM {table} WHERE ext NOT IN ({placeholders})",
                 allowed_exts,
             )
-            row = cur.fetchone()
-            to_remove = int(row[0]) if row else 0
-            if to_remove:
-                conn.execute(
-                    f"DELETE FROM {table} WHERE ext NOT IN ({placeholders})",
-                    allowed_exts,
-                )
-            removed += to_remove
-        conn.commit()
+            removed += max(cur.rowcount, 0)
+    return removed
+
+
+def prune_db_file_index(db_path: Path) -> tuple[int, int]:
+    if not db_path.exists():
+        return 0, 0
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        removed = prune_file_index_rows(conn)
+        # Cheap unless the deletes left the planner stats stale.
+        conn.execute("PRAGMA optimize")
     finally:
         conn.close()
-    return removed, bytes_freed
+    return removed, 0
+
+
+def _backup_rel(path: Path, active_root: Path | None) -> Path:
+    if active_root:
+        try:
+            return path.relative_to(active_root)
+        except ValueError:
+            pass
+    return Path(path.name)
+
+
+def _zip_backup(
+    paths: Iterable[Path], archive_path: Path, active_root: Path | None
+) -> tuple[int, int]:
+    """Write sources straight into the archive; no staging copies to create and delete."""
+    copied = 0
+    skipped = 0
+    seen: set[str] = set()
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in paths:
+            arcname = _backup_rel(path, active_root).as_posix()
+            if arcname in seen or not path.exists():
+                skipped += 1
+                continue
+            seen.add(arcname)
+            # Sets and compressed audio do not shrink under DEFLATE; store them as-is.
+            compress = (
+                zipfile.ZIP_STORED
+                if path.suffix.lower() in PRECOMPRESSED_EXTS
+                else zipfile.ZIP_DEFLATED
+            )
+            try:
+                zf.write(path, arcname, compress_type=compress)
+                copied += 1
+            except Exception:
+                skipped += 1
+    return copied, skipped
 
 
 def backup_files(
@@ -146,20 +200,26 @@ def backup_files(
     dest_dir.mkdir(parents=True, exist_ok=True)
     stamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
     base_dir = dest_dir / "Abletools Backup" / f"{kind}_{stamp}"
-    base_dir.mkdir(parents=True, exist_ok=True)
 
+    if cleanup_unzipped:
+        base_dir.parent.mkdir(parents=True, exist_ok=True)
+        archive_path: Path | None = base_dir.with_name(base_dir.name + ".zip")
+        try:
+            copied, skipped = _zip_backup(paths, archive_path, active_root)
+        except Exception:
+            archive_path.unlink(missing_ok=True)
+            return copied, skipped, None
+        if copied == 0:
+            archive_path.unlink(missing_ok=True)
+            archive_path = None
+        return copied, skipped, archive_path
+
+    base_dir.mkdir(parents=True, exist_ok=True)
     for path in paths:
         if not path.exists():
             skipped += 1
             continue
-        if active_root:
-            try:
-                rel = path.relative_to(active_root)
-            except ValueError:
-                rel = Path(path.name)
-        else:
-            rel = Path(path.name)
-        target = base_dir / rel
+        target = base_dir / _backup_rel(path, active_root)
         if target.exists():
             skipped += 1
             continue
@@ -170,14 +230,12 @@ def backup_files(
         except Exception:
             skipped += 1
 
-    archive_path: Path | None = None
+    archive_path = None
     if copied > 0:
         try:
             archive_path = Path(
                 shutil.make_archive(str(base_dir), "zip", root_dir=base_dir)
             )
-            if cleanup_unzipped:
-                shutil.rmtree(base_dir, ignore_errors=True)
         except Exception:
             archive_path = None
     return copied, skipped, archive_path
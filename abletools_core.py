@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
+import re
 import sqlite3
+import subprocess
+import sys
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Optional
 
 
 @dataclass
@@ -59,6 +67,325 @@ def format_bytes(value: object) -> str:
     return f"{size_float:.1f} {units[unit_idx]}"
 
 
+_TIMESTAMP_BRACKET_RE = re.compile(r"\[[0-9][0-9  T:_-]{4,}[0-9]\]")
+
+
+def is_backup_path(path: str) -> bool:
+    """True for paths under a ``Backup`` folder or with a ``[timestamp]`` file name."""
+    if not path:
+        return False
+    # Runs per catalog row: one lowercase substring test instead of splitting components.
+    norm = path.replace("\\", "/").rstrip("/")
+    if "/backup/" in f"/{norm.lower()}/":
+        return True
+    return bool(_TIMESTAMP_BRACKET_RE.search(norm, norm.rfind("/") + 1))
+
+
+READ_PRAGMAS = """
+    PRAGMA query_only=1;
+    PRAGMA cache_size=-20000;
+    PRAGMA mmap_size=1073741824;
+    PRAGMA temp_store=MEMORY;
+"""
+# File, doc, ref and missing-ref totals across all scopes in one statement.
+CATALOG_STATS_SQL = (
+    "SELECT "
+    "(SELECT COUNT(*) FROM file_index) "
+    "+ (SELECT COUNT(*) FROM file_index_user_library) "
+    "+ (SELECT COUNT(*) FROM file_index_preferences), "
+    "(SELECT COUNT(*) FROM ableton_docs) "
+    "+ (SELECT COUNT(*) FROM ableton_docs_user_library) "
+    "+ (SELECT COUNT(*) FROM ableton_docs_preferences), "
+    "(SELECT COUNT(*) FROM refs_graph) "
+    "+ (SELECT COUNT(*) FROM refs_graph_user_library) "
+    "+ (SELECT COUNT(*) FROM refs_graph_preferences), "
+    "(SELECT COUNT(*) FROM refs_graph WHERE ref_exists = 0) "
+    "+ (SELECT COUNT(*) FROM refs_graph_user_library WHERE ref_exists = 0) "
+    "+ (SELECT COUNT(*) FROM refs_graph_preferences WHERE ref_exists = 0)"
+)
+
+# Idle read-only connections kept per DB path.
+READ_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+
+def ensure_wal_mode(db_path: Path) -> None:
+    """Switch an existing DB to WAL so read-only readers never block the writer scripts."""
+    conn = sqlite3.connect(db_path)
+    try:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if str(mode).lower() != "wal":
+            conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+TOP_DEVICES_SQL = (
+    "SELECT device_name, usage_count FROM device_usage "
+    "WHERE scope != 'preferences' "
+    "ORDER BY usage_count DESC LIMIT ?"
+)
+TOP_DEVICE_HINTS_SQL = (
+    "SELECT device_name, COUNT(*) FROM doc_device_hints "
+    "WHERE scope != 'preferences' "
+    "GROUP BY device_name "
+    "ORDER BY COUNT(*) DESC LIMIT ?"
+)
+TOP_PLUGINS_SQL = (
+    "SELECT COALESCE(name, path) AS label, COALESCE(vendor, '') AS vendor, COUNT(*) "
+    "FROM plugin_index "
+    "WHERE scope != 'preferences' "
+    "GROUP BY label, vendor "
+    "ORDER BY COUNT(*) DESC LIMIT ?"
+)
+TOP_CHAINS_SQL = (
+    "SELECT chain, usage_count FROM device_chain_stats "
+    "WHERE scope != 'preferences' "
+    "ORDER BY usage_count DESC LIMIT ?"
+)
+TOP_MISSING_PATHS_SQL = (
+    "SELECT ref_parent, missing_count FROM missing_refs_by_path "
+    "WHERE scope != 'preferences' "
+    "ORDER BY missing_count DESC LIMIT ?"
+)
+
+
+def dashboard_extras(conn: sqlite3.Connection | None) -> dict[str, list[str]]:
+    """Top devices, plugins, chains and missing-ref folders, all read on one connection."""
+    extras: dict[str, list[str]] = {
+        "devices": [],
+        "plugins": [],
+        "chains": [],
+        "missing_paths": [],
+    }
+    if conn is None:
+        return extras
+
+    def _rows(sql: str, limit: int) -> list[tuple]:
+        # Older DBs may lack a table; that list stays empty, the rest still load.
+        try:
+            return conn.execute(sql, (limit,)).fetchall()
+        except sqlite3.Error:
+            return []
+
+    devices = _rows(TOP_DEVICES_SQL, 8) or _rows(TOP_DEVICE_HINTS_SQL, 8)
+    extras["devices"] = [f"{name} ({count})" for name, count in devices]
+    extras["plugins"] = [
+        f"{label} ({vendor}, {count})" if vendor else f"{label} ({count})"
+        for label, vendor, count in _rows(TOP_PLUGINS_SQL, 8)
+    ]
+    extras["chains"] = [f"{chain} ({count})" for chain, count in _rows(TOP_CHAINS_SQL, 6)]
+    extras["missing_paths"] = [
+        f"{path} ({count})" for path, count in _rows(TOP_MISSING_PATHS_SQL, 6)
+    ]
+    return extras
+
+
+def db_file_signature(db_path: Path | None) -> tuple[int, ...]:
+    """Size and mtime of the DB and its WAL; changes whenever any process commits."""
+    if db_path is None:
+        return ()
+    sig: list[int] = []
+    for path in (db_path, db_path.with_name(db_path.name + "-wal")):
+        try:
+            st = path.stat()
+        except OSError:
+            sig.extend((-1, -1))
+        else:
+            sig.extend((st.st_size, st.st_mtime_ns))
+    return tuple(sig)
+
+
+def sqlite_ro_uri(db_path: Path) -> str:
+    # No nolock=1/immutable=1: the scanner CLI, the Qt app and the script worker
+    # can write at any time, and WAL readers need the shm locks to see a
+    # consistent snapshot.
+    return f"{db_path.resolve().as_uri()}?mode=ro"
+
+
+def open_readonly_connection(db_path: Path) -> sqlite3.Connection:
+    # Autocommit: reads never open a transaction that could pin an old WAL snapshot.
+    conn = sqlite3.connect(
+        sqlite_ro_uri(db_path), uri=True, check_same_thread=False, isolation_level=None
+    )
+    conn.executescript(READ_PRAGMAS)
+    return conn
+
+
+class SQLiteConnectionPool:
+    """Reusable read-only connections, keyed by database path.
+
+    This is the reader side of the catalog's one-writer/many-readers setup: the
+    catalog, analytics and maintenance scripts write through ``ScriptWorker``,
+    one job at a time, while UI threads read here under WAL. Each connection is
+    handed to one caller at a time, so pooled connections may move between
+    threads. Call ``invalidate`` after the database file is rewritten so stale
+    handles are not reused; ``generation`` counts those calls, so callers can key
+    result caches on it.
+    """
+
+    def __init__(self, size: int = READ_POOL_SIZE) -> None:
+        self.size = size
+        self._lock = threading.Lock()
+        self._idle: dict[str, list[sqlite3.Connection]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @contextmanager
+    def acquire(self, db_path: Path) -> Iterator[sqlite3.Connection]:
+        key = str(db_path)
+        with self._lock:
+            generation = self._generation
+            idle = self._idle.get(key)
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn = open_readonly_connection(db_path)
+        try:
+            yield conn
+        finally:
+            self._release(key, conn, generation)
+
+    def _release(self, key: str, conn: sqlite3.Connection, generation: int) -> None:
+        conn.row_factory = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if generation == self._generation and len(idle) < self.size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            stale = [conn for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for conn in stale:
+            conn.close()
+
+
+class ScriptWorker:
+    """Run Abletools scripts through one long-lived ``abletools_worker.py`` process.
+
+    Calls are serialized and return ``subprocess.CompletedProcess`` like
+    ``subprocess.run(..., capture_output=True, text=True)``. Scripts the worker
+    does not know, or a worker that cannot be started, fall back to a fresh
+    interpreter.
+    """
+
+    def __init__(self, abletools_dir: Path) -> None:
+        self.abletools_dir = abletools_dir
+        self.worker_script = abletools_dir / "abletools_worker.py"
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen[str] | None = None
+        self._shared_lock = threading.Lock()
+        self._shared: dict[tuple[str, ...], Future[subprocess.CompletedProcess[str]]] = {}
+
+    def start(self) -> None:
+        """Spawn the worker ahead of its first job so startup overlaps other work."""
+        if not self.worker_script.exists():
+            return
+        with self._lock:
+            self._ensure_started()
+
+    def run(self, script: Path, args: list[str]) -> subprocess.CompletedProcess[str]:
+        cmd = [sys.executable, str(script), *args]
+        if script.parent != self.abletools_dir or not self.worker_script.exists():
+            return self._run_subprocess(cmd)
+        request = json.dumps({"script": script.name, "args": args}) + "\n"
+        with self._lock:
+            for _attempt in range(2):
+                proc = self._ensure_started()
+                assert proc.stdin is not None and proc.stdout is not None
+                try:
+                    proc.stdin.write(request)
+                    proc.stdin.flush()
+                except (OSError, ValueError):
+                    # The request never reached this worker; a fresh one can take it.
+                    self._stop()
+                    continue
+                try:
+                    reply = json.loads(proc.stdout.readline())
+                except (OSError, ValueError) as exc:
+                    # The job may have run partway; rerunning could repeat --overwrite
+                    # or --vacuum, so report the failure instead.
+                    self._stop()
+                    return subprocess.CompletedProcess(
+                        cmd, 1, "", f"Abletools worker died during {script.name}: {exc}\n"
+                    )
+                return subprocess.CompletedProcess(
+                    cmd, reply["returncode"], reply["stdout"], reply["stderr"]
+                )
+        return self._run_subprocess(cmd)
+
+    def run_shared(
+        self, script: Path, args: list[str]
+    ) -> subprocess.CompletedProcess[str]:
+        """Like ``run``, but callers asking for an identical job already in flight share its result."""
+        key = (str(script), *args)
+        with self._shared_lock:
+            future = self._shared.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._shared[key] = future
+        if not owner:
+            return future.result()
+        try:
+            result = self.run(script, args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._shared_lock:
+                self._shared.pop(key, None)
+
+    def _run_subprocess(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            cmd,
+            cwd=str(self.abletools_dir),
+            capture_output=True,
+            text=True,
+        )
+
+    def _ensure_started(self) -> subprocess.Popen[str]:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [sys.executable, str(self.worker_script)],
+                cwd=str(self.abletools_dir),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+            )
+        return self._proc
+
+    def _stop(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def close(self) -> None:
+        # Closing stdin lets the worker finish any in-flight script, then exit.
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.stdin:
+            with suppress(OSError):
+                proc.stdin.close()
+
+
 class CatalogService:
     def __init__(
         self,
@@ -67,6 +394,8 @@ class CatalogService:
     ) -> None:
         self.catalog_dir = catalog_dir
         self._log = log
+        self._wal_checked: set[Path] = set()
+        self._pool = SQLiteConnectionPool()
 
     def _log_event(self, kind: str, message: str) -> None:
         if self._log:
@@ -75,128 +404,58 @@ class CatalogService:
     def catalog_db_path(self) -> Path:
         return self.catalog_dir / "abletools_catalog.sqlite"
 
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Pooled read-only connection; the DB is moved to WAL on first use."""
+        db_path = self.catalog_db_path()
+        if db_path not in self._wal_checked:
+            try:
+                ensure_wal_mode(db_path)
+                self._wal_checked.add(db_path)
+            except sqlite3.Error as exc:
+                self._log_event("DB", f"WAL check skipped: {exc}")
+        with self._pool.acquire(db_path) as conn:
+            yield conn
+
+    def invalidate(self) -> None:
+        """Drop pooled connections after the catalog DB is rebuilt or rewritten."""
+        self._pool.invalidate()
+        self._wal_checked.clear()
+
     def load_catalog_stats(self) -> CatalogStats:
         db_path = self.catalog_db_path()
         stats = CatalogStats(last_scan=now_iso())
         if not db_path.exists():
             return stats
         try:
-            with sqlite3.connect(db_path) as conn:
-                stats.file_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM file_index "
-                    "UNION ALL SELECT COUNT(*) FROM file_index_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM file_index_preferences)"
-                ).fetchone()[0] or 0
-                stats.doc_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM ableton_docs "
-                    "UNION ALL SELECT COUNT(*) FROM ableton_docs_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM ableton_docs_preferences)"
-                ).fetchone()[0] or 0
-                stats.refs_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM refs_graph "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_preferences)"
-                ).fetchone()[0] or 0
-                stats.missing_refs = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM refs_graph WHERE ref_exists = 0 "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_user_library WHERE ref_exists = 0 "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_preferences WHERE ref_exists = 0)"
-                ).fetchone()[0] or 0
+            with self._connect() as conn:
+                row = conn.execute(CATALOG_STATS_SQL).fetchone()
+            (
+                stats.file_count,
+                stats.doc_count,
+                stats.refs_count,
+                stats.missing_refs,
+            ) = (int(value or 0) for value in row)
         except Exception:
             return stats
         return stats
 
-    def load_top_devices(self, limit: int = 8) -> list[str]:
-        db_path = self.catalog_db_path()
-        if not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT device_name, usage_count FROM device_usage "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY usage_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            if rows:
-                return [f"{name} ({count})" for name, count in rows]
-            rows = conn.execute(
-                "SELECT device_name, COUNT(*) FROM doc_device_hints "
-                "WHERE scope != 'preferences' "
-                "GROUP BY device_name "
-                "ORDER BY COUNT(*) DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-            return [f"{name} ({count})" for name, count in rows]
-        except Exception:
-            return []
-
-    def load_top_plugins(self, limit: int = 8) -> list[str]:
-        db_path = self.catalog_db_path()
-        if not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT COALESCE(name, path) AS label, COALESCE(vendor, '') AS vendor, COUNT(*) "
-                    "FROM plugin_index "
-                    "WHERE scope != 'preferences' "
-                    "GROUP BY label, vendor "
-                    "ORDER BY COUNT(*) DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            results = []
-            for label, vendor, count in rows:
-                if vendor:
-                    results.append(f"{label} ({vendor}, {count})")
-                else:
-                    results.append(f"{label} ({count})")
-            return results
-        except Exception:
-            return []
-
-    def load_top_chains(self, limit: int = 6) -> list[str]:
-        db_path = self.catalog_db_path()
-        if not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT chain, usage_count FROM device_chain_stats "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY usage_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            return [f"{chain} ({count})" for chain, count in rows]
-        except Exception:
-            return []
-
-    def load_missing_refs_paths(self, limit: int = 6) -> list[str]:
+    def load_dashboard_extras(self) -> dict[str, list[str]]:
         db_path = self.catalog_db_path()
         if not db_path.exists():
-            return []
+            return dashboard_extras(None)
         try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT ref_parent, missing_count FROM missing_refs_by_path "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY missing_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            return [f"{path} ({count})" for path, count in rows]
+            with self._connect() as conn:
+                return dashboard_extras(conn)
         except Exception:
-            return []
+            return dashboard_extras(None)
 
     def load_missing_hotspots(self, scope: str, limit: int = 8) -> list[str]:
         db_path = self.catalog_db_path()
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT ref_parent, missing_count FROM missing_refs_by_path "
                     "WHERE scope = ? ORDER BY missing_count DESC LIMIT ?",
@@ -211,7 +470,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT chain, usage_count FROM device_chain_stats "
                     "WHERE scope = ? ORDER BY usage_count DESC LIMIT ?",
@@ -226,7 +485,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT path, health_score, missing_refs_count, devices_count, samples_count "
                     "FROM set_health WHERE scope = ? "
@@ -248,7 +507,7 @@ class CatalogService:
         if not db_path.exists():
             return {}
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 row = conn.execute(
                     "SELECT total_media_bytes, referenced_media_bytes, unreferenced_media_bytes "
                     "FROM audio_footprint WHERE scope = ?",
@@ -269,7 +528,7 @@ class CatalogService:
         if not db_path.exists():
             return {}
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 row = conn.execute(
                     "SELECT total_sets, total_set_bytes, non_backup_sets, non_backup_bytes "
                     "FROM set_storage_summary WHERE scope = ?",
@@ -291,7 +550,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT window_days, set_count, total_bytes "
                     "FROM set_activity_stats WHERE scope = ? "
@@ -312,7 +571,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT path, size_bytes FROM set_size_top "
                     "WHERE scope = ? ORDER BY size_bytes DESC LIMIT ?",
@@ -327,7 +586,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT parent_path, file_count, total_bytes "
                     "FROM unreferenced_audio_by_path "
@@ -346,7 +605,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT issue, path, issue_value FROM quality_issues "
                     "WHERE scope = ? ORDER BY issue_value DESC LIMIT ?",
@@ -371,7 +630,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT device_name, usage_count FROM device_usage_recent "
                     "WHERE scope = ? AND window_days = ? "
@@ -387,7 +646,7 @@ class CatalogService:
         if not db_path.exists():
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     "SELECT device_a, device_b, usage_count FROM device_cooccurrence "
                     "WHERE scope = ? ORDER BY usage_count DESC LIMIT ?",
@@ -422,7 +681,7 @@ class CatalogService:
             "missing_sets": 0,
         }
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 result["set_count_total"] = (
                     conn.execute(
                         f"SELECT COUNT(*) FROM file_index{suffix} "
@@ -489,7 +748,7 @@ class CatalogService:
         else:
             where = "ext IN ('.als', '.alc')"
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     f"SELECT path FROM file_index{suffix} WHERE {where} AND {backup_clause}",
                     backup_params,
@@ -505,8 +764,7 @@ class CatalogService:
             return []
         items: list[dict[str, str]] = []
         try:
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 scopes = [scope] if scope != "all" else ["live_recordings", "user_library"]
                 for scope_name in scopes:
                     if scope_name not in {"live_recordings", "user_library"}:
@@ -514,24 +772,23 @@ class CatalogService:
                     suffix = "" if scope_name == "live_recordings" else f"_{scope_name}"
                     query = f"""
                         SELECT d.path, d.tracks_total, d.clips_total, f.mtime
-                        FROM ableton_docs{suffix} d
-                        JOIN file_index{suffix} f ON f.path = d.path
+                        FROM file_index{suffix} f
+                        JOIN ableton_docs{suffix} d ON d.path = f.path
                         WHERE f.ext IN ('.als', '.alc')
                         ORDER BY f.mtime DESC
                         LIMIT 2000
                     """
-                    for row in conn.execute(query).fetchall():
-                        path = row["path"]
-                        items.append(
-                            {
-                                "path": path,
-                                "name": Path(path).name,
-                                "mtime": row["mtime"],
-                                "tracks": row["tracks_total"],
-                                "clips": row["clips_total"],
-                                "scope": scope_name,
-                            }
-                        )
+                    items.extend(
+                        {
+                            "path": path,
+                            "name": Path(path).name,
+                            "mtime": mtime,
+                            "tracks": tracks_total,
+                            "clips": clips_total,
+                            "scope": scope_name,
+                        }
+                        for path, tracks_total, clips_total, mtime in conn.execute(query)
+                    )
         except Exception as exc:
             self._log_event("ERROR", f"get_known_sets: {exc}")
         return items
@@ -543,8 +800,7 @@ class CatalogService:
         issues: list[str] = []
         log_path = self.catalog_dir / "audit_log.txt"
         try:
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 for scope, suffix in (
                     ("live_recordings", ""),
                     ("user_library", "_user_library"),
@@ -558,14 +814,12 @@ class CatalogService:
                         LIMIT 50
                         """
                     ).fetchall()
-                    for row in rows:
-                        reason = "no track tags found"
-                        if row["error"]:
-                            reason = f"parse error: {row['error']}"
+                    for path, tracks_total, clips_total, error, size in rows:
+                        reason = f"parse error: {error}" if error else "no track tags found"
                         entry = (
-                            f"{scope}: {row['path']} "
-                            f"(tracks={row['tracks_total']}, clips={row['clips_total']}, "
-                            f"size={row['size']}, {reason})"
+                            f"{scope}: {path} "
+                            f"(tracks={tracks_total}, clips={clips_total}, "
+                            f"size={size}, {reason})"
                         )
                         issues.append(entry)
                         self._log_event("AUDIT", entry)
@@ -584,7 +838,7 @@ class CatalogService:
             return []
         items: list[tuple[str, str, int]] = []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 for row in conn.execute(
                     "SELECT kind, source, mtime FROM ableton_prefs ORDER BY mtime DESC"
                 ):
@@ -598,7 +852,7 @@ class CatalogService:
         if not db_path.exists():
             return None
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 row = conn.execute(
                     "SELECT payload_json FROM ableton_prefs WHERE kind = ? AND source = ?",
                     (kind, source),
@@ -647,7 +901,7 @@ class CatalogService:
 
         rows: list[dict[str, str]] = []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._connect() as conn:
                 if scope == "preferences":
                     sql = (
                         "SELECT kind, source, mtime "
@@ -6,6 +6,8 @@ import sqlite3
 import sys
 from pathlib import Path
 
+from abletools_catalog_db import rebuild_catalog_fts
+
 
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser(description="Run maintenance on Abletools catalog DB.")
@@ -30,6 +32,7 @@ def main(argv: list[str]) -> int:
             conn.execute("PRAGMA optimize")
         if args.vacuum:
             conn.execute("VACUUM")
+            rebuild_catalog_fts(conn)
 
     return 0
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import html
 import json
 import os
 import plistlib
 import re
 import time
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -29,7 +31,10 @@ def _load_cache(cache_dir: Path) -> dict:
 def _save_cache(cache_dir: Path, data: dict) -> None:
     cache_dir.mkdir(parents=True, exist_ok=True)
     cache_path = cache_dir / CACHE_FILENAME
-    cache_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    # Replace atomically: the UI and the prefs refresh worker read this concurrently.
+    tmp_path = cache_path.with_name(f"{CACHE_FILENAME}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp_path, cache_path)
 
 
 def get_scan_root(cache_dir: Path) -> Path | None:
@@ -118,8 +123,6 @@ def get_key_paths(cache_dir: Path) -> dict[str, list[str]]:
     prefs_path = Path(cache.get("prefs_path", "")) if cache.get("prefs_path") else None
     if not prefs_path or not prefs_path.exists():
         return {}
-    data = parse_preferences(prefs_path)
-    values = data.get("values", {})
     keys = [
         "UserLibraryPath",
         "LibraryPath",
@@ -130,7 +133,8 @@ def get_key_paths(cache_dir: Path) -> dict[str, list[str]]:
         "Vst3PlugInCustomFolder",
         "AuPlugInCustomFolder",
     ]
-    return {k: values.get(k, []) for k in keys if values.get(k)}
+    values = read_preference_values(prefs_path, keys)
+    return {k: values[k] for k in keys if values.get(k)}
 
 
 def _default_plugin_dirs() -> list[Path]:
@@ -175,6 +179,26 @@ def parse_preferences(path: Path) -> dict:
     return {"raw": text, "lines": lines, "values": values}
 
 
+def read_preference_values(path: Path, keys: Iterable[str]) -> dict[str, list[str]]:
+    """``parse_preferences(path)["values"]`` restricted to ``keys``.
+
+    Works on the raw bytes and only decodes lines that start with a wanted key, so
+    callers that need a few paths skip building the full line list.
+    """
+    wanted = set(keys)
+    prefixes = tuple(key.encode("utf-8") for key in wanted)
+    values: dict[str, list[str]] = {}
+    if not prefixes:
+        return values
+    for raw in path.read_bytes().splitlines():
+        if not raw.lstrip().startswith(prefixes):
+            continue
+        key, value = _parse_kv(raw.decode("utf-8", errors="replace").strip())
+        if key in wanted:
+            values.setdefault(key, []).append(value or "")
+    return values
+
+
 def parse_options(path: Path) -> dict:
     text = path.read_text(encoding="utf-8", errors="replace")
     options = []
@@ -223,6 +247,39 @@ def load_prefs_payloads(cache_dir: Path) -> list[dict[str, Any]]:
     return payloads
 
 
+PLIST_KEYS = (
+    "CFBundleName",
+    "CFBundleIdentifier",
+    "CFBundleShortVersionString",
+    "CFBundleVersion",
+    "CFBundleGetInfoString",
+)
+_PLIST_STRING_RE = re.compile(
+    rb"<key>\s*(" + b"|".join(key.encode() for key in PLIST_KEYS) + rb")\s*</key>"
+    rb"\s*(?:<string>([^<]*)</string>|<string\s*/>)"
+)
+
+
+def _read_plist_strings(raw: bytes) -> dict[str, str]:
+    """The PLIST_KEYS string values of an Info.plist without building the whole plist.
+
+    XML plists are scanned for just those keys (first occurrence wins, stopping once
+    all are seen); binary plists still go through plistlib.
+    """
+    if raw[:8] == b"bplist00":
+        data = plistlib.loads(raw)
+        return {key: data[key] for key in PLIST_KEYS if isinstance(data.get(key), str)}
+    found: dict[str, str] = {}
+    for match in _PLIST_STRING_RE.finditer(raw):
+        key = match.group(1).decode("ascii")
+        if key in found:
+            continue
+        found[key] = html.unescape((match.group(2) or b"").decode("utf-8", errors="replace"))
+        if len(found) == len(PLIST_KEYS):
+            break
+    return found
+
+
 def _scan_plugin_dir(path: Path) -> list[dict[str, Any]]:
     plugins: list[dict[str, Any]] = []
     if not path.exists() or not path.is_dir():
@@ -243,7 +300,7 @@ def _scan_plugin_dir(path: Path) -> list[dict[str, Any]]:
                 }
                 if info_plist.exists():
                     try:
-                        data = plistlib.loads(info_plist.read_bytes())
+                        data = _read_plist_strings(info_plist.read_bytes())
                         meta.update(
                             {
                                 "name": data.get("CFBundleName") or meta["name"],
@@ -266,13 +323,13 @@ def load_plugin_payloads(cache_dir: Path) -> list[dict[str, Any]]:
     prefs_path = Path(cache.get("prefs_path", "")) if cache.get("prefs_path") else None
     plugin_dirs = set(_default_plugin_dirs())
     if prefs_path and prefs_path.exists():
-        data = parse_preferences(prefs_path)
-        values = data.get("values", {})
-        for key in (
+        plugin_keys = (
             "VstPlugInCustomFolder",
             "Vst3PlugInCustomFolder",
             "AuPlugInCustomFolder",
-        ):
+        )
+        values = read_preference_values(prefs_path, plugin_keys)
+        for key in plugin_keys:
             for val in values.get(key, []):
                 if not val:
                     continue
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import random
-import re
 import subprocess
 import sys
 from pathlib import Path
@@ -43,22 +42,17 @@ from PyQt6.QtWidgets import (
 )
 
 from abletools_catalog_ops import backup_files, cleanup_catalog_dir
-from abletools_core import CatalogService, format_bytes, format_mtime, safe_read_json
-from ramify_core import iter_targets, process_file
+from abletools_core import (
+    CatalogService,
+    format_bytes,
+    format_mtime,
+    is_backup_path,
+    safe_read_json,
+)
+from ramify_core import iter_targets, process_files
 
 ABLETOOLS_DIR = Path(__file__).resolve().parent
 
-_TIMESTAMP_BRACKET_RE = re.compile(r"\[[0-9][0-9  T:_-]{4,}[0-9]\]")
-
-
-def is_backup_path(path: str) -> bool:
-    if not path:
-        return False
-    p = Path(path)
-    if any(part.lower() == "backup" for part in p.parts):
-        return True
-    return bool(_TIMESTAMP_BRACKET_RE.search(p.name))
-
 
 def _set_combo_width(combo: QComboBox, padding: int = 44, minimum: int | None = None) -> None:
     metrics = QFontMetrics(combo.font())
@@ -443,24 +437,27 @@ class RamifyWorker(QThread):
 
     def run(self) -> None:
         total_files = total_audio = total_flips = failed = 0
-        for f in iter_targets(self._target, self._recursive):
+        results = process_files(
+            iter_targets(self._target, self._recursive), self._inplace, self._dry
+        )
+        for f, result in results:
             total_files += 1
-            try:
-                audio_seen, flips, wrote = process_file(f, self._inplace, self._dry)
-                total_audio += audio_seen
-                total_flips += flips
-                action = "DRY" if self._dry else ("INPLACE" if self._inplace else "OUT")
-                if wrote:
-                    self.output.emit(
-                        f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips} | wrote={wrote}"
-                    )
-                else:
-                    self.output.emit(
-                        f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips}"
-                    )
-            except Exception as exc:
+            if isinstance(result, Exception):
                 failed += 1
-                self.output.emit(f"[FAIL] {f} | {exc}")
+                self.output.emit(f"[FAIL] {f} | {result}")
+                continue
+            audio_seen, flips, wrote = result
+            total_audio += audio_seen
+            total_flips += flips
+            action = "DRY" if self._dry else ("INPLACE" if self._inplace else "OUT")
+            if wrote:
+                self.output.emit(
+                    f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips} | wrote={wrote}"
+                )
+            else:
+                self.output.emit(
+                    f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips}"
+                )
         self.output.emit("")
         self.output.emit(
             "Done. Files={files} Failed={failed} AudioClips={audio} RamFlips={flips}".format(
@@ -661,17 +658,12 @@ class DashboardView(QWidget):
             lines.append("No scan summary found.")
         self.activity_text.setPlainText("\n".join(lines))
 
-        self.top_devices.setPlainText(
-            "\n".join(self.catalog.load_top_devices() or ["No data yet."])
-        )
-        self.top_plugins.setPlainText(
-            "\n".join(self.catalog.load_top_plugins() or ["No data yet."])
-        )
-        self.top_chains.setPlainText(
-            "\n".join(self.catalog.load_top_chains() or ["No data yet."])
-        )
+        extras = self.catalog.load_dashboard_extras()
+        self.top_devices.setPlainText("\n".join(extras["devices"] or ["No data yet."]))
+        self.top_plugins.setPlainText("\n".join(extras["plugins"] or ["No data yet."]))
+        self.top_chains.setPlainText("\n".join(extras["chains"] or ["No data yet."]))
         self.top_missing.setPlainText(
-            "\n".join(self.catalog.load_missing_refs_paths() or ["No data yet."])
+            "\n".join(extras["missing_paths"] or ["No data yet."])
         )
 
     def _backup_sets(self) -> None:
@@ -756,6 +748,7 @@ class DashboardView(QWidget):
                     text=True,
                 )
                 maintenance_msg = " Optimized DB." if proc.returncode == 0 else f" Optimize failed: {proc.stderr.strip()}"
+            self.catalog.invalidate()
             QMessageBox.information(
                 self,
                 "Clean Catalog",
@@ -1220,6 +1213,7 @@ class ScanView(QWidget):
         self.log.appendPlainText(line)
 
     def _finish_worker(self, code: int) -> None:
+        self.catalog.invalidate()
         self.status_label.setText("Done" if code == 0 else f"Failed ({code})")
         self.run_full_btn.setEnabled(True)
         self.run_targeted_btn.setEnabled(True)
@@ -1893,6 +1887,7 @@ class SettingsView(QWidget):
             self.output.appendPlainText(text)
 
     def _finish_command(self, code: int) -> None:
+        self.catalog.invalidate()
         self._append_output(f"Done (exit={code}).")
         self._toggle_buttons(True)
 
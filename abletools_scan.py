@@ -35,20 +35,20 @@ MEDIA_EXTS = {".wav", ".aif", ".aiff", ".flac", ".mp3", ".m4a", ".ogg"}
 DEFAULT_INDEX_EXTS = sorted(ABLETON_DOC_EXTS | ABLETON_ARTIFACT_EXTS)
 SCOPES = {"live_recordings", "user_library", "preferences"}
 SKIP_DIRS = {".git", ".venv", "venv", "__pycache__", ".DS_Store"}
+GZIP_READ_BUFFER = 128 * 1024
 _TIMESTAMP_BRACKET_RE = re.compile(r"\[[0-9][0-9  T:_-]{4,}[0-9]\]")
 
 # Ableton docs are typically gzipped XML.
 # We'll parse in a "schema-agnostic" way (heuristics) for MVP.
-RE_TRACK_AUDIO = re.compile(r"<(?:\w+:)?AudioTrack\b", re.IGNORECASE)
-RE_TRACK_MIDI = re.compile(r"<(?:\w+:)?MidiTrack\b", re.IGNORECASE)
-RE_TRACK_RETURN = re.compile(r"<(?:\w+:)?ReturnTrack\b", re.IGNORECASE)
-RE_TRACK_MASTER = re.compile(r"<(?:\w+:)?MasterTrack\b", re.IGNORECASE)
-RE_TRACK_GROUP = re.compile(r"<(?:\w+:)?GroupTrack\b", re.IGNORECASE)
-RE_TRACK_FOLD = re.compile(r"<(?:\w+:)?FoldedGroupTrack\b", re.IGNORECASE)
 RE_TRACK_GENERIC = re.compile(r"<(?:\w+:)?Track\b", re.IGNORECASE)
 
-RE_CLIP_AUDIO = re.compile(r"<(?:\w+:)?AudioClip\b", re.IGNORECASE)
-RE_CLIP_MIDI = re.compile(r"<(?:\w+:)?MidiClip\b", re.IGNORECASE)
+# Track and clip tags counted by parse_ableton_doc, in one alternation so a document
+# is scanned once rather than once per tag.
+RE_DOC_TAGS = re.compile(
+    r"<(?:\w+:)?(AudioTrack|MidiTrack|ReturnTrack|MasterTrack|GroupTrack|FoldedGroupTrack"
+    r"|AudioClip|MidiClip)\b",
+    re.IGNORECASE,
+)
 
 # Paths inside XML can show up in lots of forms; grab common absolute-ish patterns.
 RE_PATHS = re.compile(
@@ -268,22 +268,25 @@ def read_text_maybe_gzip(path: Path, max_bytes: int = 200_000_000) -> str:
     Try to read as gzipped text first; fall back to plain text.
     max_bytes is a safety cap to prevent accidental huge decompressions.
     """
-    raw = path.read_bytes()
-    if len(raw) == 0:
-        return ""
-
-    # gzip magic: 1F 8B
-    if len(raw) >= 2 and raw[0] == 0x1F and raw[1] == 0x8B:
-        with gzip.GzipFile(fileobj=io.BytesIO(raw)) as gz:
-            out = gz.read(max_bytes + 1)
+    # Sniff the magic from the buffered handle and decompress straight from it,
+    # so the compressed file is never held in memory alongside the XML.
+    with open(path, "rb", buffering=GZIP_READ_BUFFER) as fh:
+        head = fh.peek(2)[:2]
+        if not head:
+            return ""
+
+        # gzip magic: 1F 8B
+        if head == b"\x1f\x8b":
+            with gzip.GzipFile(fileobj=fh) as gz:
+                out = gz.read(max_bytes + 1)
             if len(out) > max_bytes:
                 raise RuntimeError(
                     f"Decompressed data exceeds max_bytes ({max_bytes}) for {path}"
                 )
             return _decode_ableton_bytes(out)
 
-    # plain text fallback
-    return _decode_ableton_bytes(raw)
+        # plain text fallback
+        return _decode_ableton_bytes(fh.read())
 
 
 def classify(ext: str) -> str:
@@ -297,6 +300,14 @@ def classify(ext: str) -> str:
     return "other"
 
 
+def _name_suffix(name: str) -> str:
+    """``Path(name).suffix`` for a bare file name, without building a Path."""
+    idx = name.rfind(".")
+    if 0 < idx < len(name) - 1:
+        return name[idx:]
+    return ""
+
+
 def iter_files(
     root: Path,
     dir_state: dict[str, int],
@@ -364,9 +375,7 @@ def count_files(
         sort_entries=sort_entries,
         skip_backups=skip_backups,
     ):
-        p = Path(entry.path)
-        ext = p.suffix.lower()
-        if not all_files and ext not in wanted_exts:
+        if not all_files and _name_suffix(entry.name).lower() not in wanted_exts:
             continue
         total += 1
     return total
@@ -402,15 +411,16 @@ def parse_ableton_doc(text: str) -> dict:
     - extract likely sample paths
     - extract device/plugin name hints
     """
-    tracks_audio = len(RE_TRACK_AUDIO.findall(text))
-    tracks_midi = len(RE_TRACK_MIDI.findall(text))
-    tracks_return = len(RE_TRACK_RETURN.findall(text))
-    tracks_master = len(RE_TRACK_MASTER.findall(text))
-    tracks_group = len(RE_TRACK_GROUP.findall(text))
-    tracks_fold = len(RE_TRACK_FOLD.findall(text))
+    tag_counts = Counter(tag.lower() for tag in RE_DOC_TAGS.findall(text))
+    tracks_audio = tag_counts["audiotrack"]
+    tracks_midi = tag_counts["miditrack"]
+    tracks_return = tag_counts["returntrack"]
+    tracks_master = tag_counts["mastertrack"]
+    tracks_group = tag_counts["grouptrack"]
+    tracks_fold = tag_counts["foldedgrouptrack"]
 
-    clips_audio = len(RE_CLIP_AUDIO.findall(text))
-    clips_midi = len(RE_CLIP_MIDI.findall(text))
+    clips_audio = tag_counts["audioclip"]
+    clips_midi = tag_counts["midiclip"]
 
     sample_refs = sorted(set(m.group(1) for m in RE_PATHS.finditer(text)))
 
@@ -627,15 +637,22 @@ def parse_ableton_xml(text: str) -> dict:
 
 
 def iter_ableton_xml_nodes(text: str, text_limit: int = 2000) -> Iterable[dict]:
-    stack: list[str] = []
+    tags: list[str] = []
+    # paths[i] is the joined path at depth i + 1, so no node re-joins the whole stack.
+    paths: list[str] = []
+    open_elems: list[ET.Element] = []
     order = 0
     for event, elem in ET.iterparse(io.StringIO(text), events=("start", "end")):
         if event == "start":
-            stack.append(_local_tag(elem.tag))
+            tag = _local_tag(elem.tag)
+            tags.append(tag)
+            open_elems.append(elem)
+            paths.append(f"{paths[-1]}/{tag}" if paths else tag)
             continue
-        tag = _local_tag(elem.tag)
-        path = "/".join(stack)
-        depth = len(stack)
+        tag = tags.pop()
+        path = paths.pop()
+        open_elems.pop()
+        depth = len(paths) + 1
         attrs = {k: str(v) for k, v in elem.attrib.items()}
         raw_text = (elem.text or "").strip()
         text_len = len(raw_text)
@@ -654,7 +671,12 @@ def iter_ableton_xml_nodes(text: str, text_limit: int = 2000) -> Iterable[dict]:
             "text_truncated": truncated,
         }
         order += 1
-        stack.pop()
+        # Children were already yielded. Detaching each finished element from its
+        # parent keeps only the open ancestors alive, so memory tracks nesting depth
+        # rather than document size.
+        elem.clear()
+        if open_elems:
+            open_elems[-1].remove(elem)
 
 
 def analyze_audio(path: Path, ext: str) -> dict:
@@ -934,12 +956,16 @@ def main(argv: list[str]) -> int:
             continue
         scanned += 1
         if isinstance(entry, os.DirEntry):
+            # Filter on the cached entry name; only wanted files get a Path.
+            ext = _name_suffix(entry.name).lower()
+            if not all_files and ext not in wanted_exts:
+                continue
             p = Path(entry.path)
         else:
             p = Path(entry)
-        ext = p.suffix.lower()
-        if not all_files and ext not in wanted_exts:
-            continue
+            ext = p.suffix.lower()
+            if not all_files and ext not in wanted_exts:
+                continue
 
         try:
             if isinstance(entry, os.DirEntry):
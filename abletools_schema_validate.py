@@ -11,53 +11,71 @@ def _load_schema(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def _type_matches(expected: str, value: Any) -> bool:
-    mapping = {
-        "string": str,
-        "integer": int,
-        "number": (int, float),
-        "object": dict,
-        "array": list,
-        "boolean": bool,
-        "null": type(None),
-    }
-    py_type = mapping.get(expected)
-    if py_type is None:
-        return True
-    return isinstance(value, py_type)
-
-
-def _validate_value(schema: dict, value: Any, errors: list[str], ctx: str) -> None:
-    if "type" in schema:
-        expected = schema["type"]
-        if isinstance(expected, list):
-            if not any(_type_matches(t, value) for t in expected):
-                errors.append(f"{ctx}: type mismatch (expected {expected}, got {type(value).__name__})")
-                return
-        else:
-            if not _type_matches(expected, value):
-                errors.append(f"{ctx}: type mismatch (expected {expected}, got {type(value).__name__})")
-                return
-    if "enum" in schema and value not in schema["enum"]:
-        errors.append(f"{ctx}: value {value} not in enum {schema['enum']}")
-
-
-def validate_record(schema: dict, record: dict, ignore_required: set[str] | None = None) -> list[str]:
-    errors: list[str] = []
-    required = schema.get("required", [])
-    for key in required:
-        if ignore_required and key in ignore_required:
-            continue
-        if key not in record:
-            errors.append(f"missing required key: {key}")
-    properties = schema.get("properties", {})
-    for key, prop in properties.items():
+_TYPE_MAP: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "object": dict,
+    "array": list,
+    "boolean": bool,
+    "null": type(None),
+}
+
+# (key, isinstance types or None, schema "type" for messages, enum or None)
+PropertyCheck = tuple[str, tuple[type, ...] | None, Any, list | None]
+
+
+def _compile_types(expected: Any) -> tuple[type, ...] | None:
+    """One isinstance() tuple for a schema "type"; None when any type is unchecked."""
+    names = expected if isinstance(expected, list) else [expected]
+    types: list[type] = []
+    for name in names:
+        py_type = _TYPE_MAP.get(name)
+        if py_type is None:
+            return None
+        types.extend(py_type if isinstance(py_type, tuple) else (py_type,))
+    return tuple(types)
+
+
+def compile_schema(
+    schema: dict, ignore_required: set[str] | None = None
+) -> tuple[list[str], list[PropertyCheck]]:
+    """Resolve a schema once into required keys and per-property checks."""
+    required = [
+        key
+        for key in schema.get("required", [])
+        if not (ignore_required and key in ignore_required)
+    ]
+    checks: list[PropertyCheck] = []
+    for key, prop in schema.get("properties", {}).items():
+        types = _compile_types(prop["type"]) if "type" in prop else None
+        checks.append((key, types, prop.get("type"), prop.get("enum")))
+    return required, checks
+
+
+def _validate_compiled(
+    compiled: tuple[list[str], list[PropertyCheck]], record: dict
+) -> list[str]:
+    required, checks = compiled
+    errors = [f"missing required key: {key}" for key in required if key not in record]
+    for key, types, expected, enum in checks:
         if key not in record:
             continue
-        _validate_value(prop, record[key], errors, key)
+        value = record[key]
+        if types is not None and not isinstance(value, types):
+            errors.append(
+                f"{key}: type mismatch (expected {expected}, got {type(value).__name__})"
+            )
+            continue
+        if enum is not None and value not in enum:
+            errors.append(f"{key}: value {value} not in enum {enum}")
     return errors
 
 
+def validate_record(schema: dict, record: dict, ignore_required: set[str] | None = None) -> list[str]:
+    return _validate_compiled(compile_schema(schema, ignore_required), record)
+
+
 def iter_jsonl(path: Path):
     with path.open("r", encoding="utf-8") as handle:
         for line_no, line in enumerate(handle, start=1):
@@ -93,8 +111,9 @@ def validate_jsonl(
 ) -> tuple[list[str], int]:
     errors: list[str] = []
     end_offset = start_offset
+    compiled = compile_schema(schema, ignore_required)
     for line_no, record, end_offset in iter_jsonl_from_offset(path, start_offset):
-        for err in validate_record(schema, record, ignore_required=ignore_required):
+        for err in _validate_compiled(compiled, record):
             errors.append(f"{path.name}:{line_no}: {err}")
             if len(errors) >= max_errors:
                 return errors, end_offset
@@ -128,12 +147,12 @@ def build_targets(catalog_dir: Path) -> list[tuple[Path, Path, str, set[str] | N
     return targets
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description="Validate Abletools JSON/JSONL outputs against schemas.")
     ap.add_argument("catalog", nargs="?", default=".abletools_catalog", help="Catalog directory")
     ap.add_argument("--max-errors", type=int, default=50, help="Stop after this many errors")
     ap.add_argument("--incremental", action="store_true", help="Validate only new JSONL data")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     catalog_dir = Path(args.catalog)
     if not catalog_dir.exists():
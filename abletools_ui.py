@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import atexit
+import contextlib
+import hashlib
+import heapq
+import io
 import json
 import logging
+import logging.handlers
+import os
 import queue
 import random
 import re
@@ -10,17 +17,28 @@ import sqlite3
 import subprocess
 import sys
 import threading
+import time
 import traceback
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import tempfile
-from typing import Optional
+from collections.abc import Callable, Iterable, Iterator
+from typing import Optional, TypeVar
 
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import filedialog, messagebox, ttk
 
+from abletools_core import (
+    CATALOG_STATS_SQL,
+    ScriptWorker,
+    SQLiteConnectionPool,
+    dashboard_extras,
+    db_file_signature,
+    ensure_wal_mode,
+    is_backup_path,
+)
 from abletools_catalog_ops import (
     backup_files,
     cleanup_catalog_dir,
@@ -28,9 +46,38 @@ from abletools_catalog_ops import (
     prune_file_index_jsonl,
 )
 from abletools_prefs import get_key_paths, get_preferences_folder, get_scan_root, set_scan_root, suggest_scan_root
-from ramify_core import iter_targets, process_file
+from ramify_core import iter_targets, process_files
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    from PIL import Image, ImageSequence, ImageTk  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    Image = ImageSequence = ImageTk = None
+
+_T = TypeVar("_T")
 
 ABLETOOLS_DIR = Path(__file__).resolve().parent
+LOG_FLUSH_MS = 1000
+LOG_TAIL_BYTES = 64 * 1024
+LOG_STAMP_LEN = len("[00:00:00] ")
+# Parallel "all" scans tag each output line with its scope: "[live_recordings] ...".
+_SCOPE_PREFIX_RE = re.compile(r"\[(\w+)\] (?=\[progress\])")
+SCAN_LOG_BUFFER = 64 * 1024
+SCAN_LOG_FLUSH_LINES = 64
+REFRESH_DEBOUNCE_MS = 250
+AUTOSIZE_SAMPLE_ROWS = 50
+MEASURE_CACHE_SIZE = 4096
+FETCH_BATCH_ROWS = 200
+# The catalog list is a newest-first window, not a full listing; rows past this
+# are reached by searching or filtering.
+CATALOG_LIST_LIMIT = 500
+PIPE_READ_BYTES = 64 * 1024
+SEARCH_DEBOUNCE_MS = 100
+DB_EXISTS_TTL = 0.5
 
 BG = "#05070b"
 BG_NAV = "#060b12"
@@ -50,6 +97,129 @@ H2_FONT = ("Menlo", 12, "bold")
 BODY_FONT = ("Menlo", 11)
 MONO_FONT = ("Menlo", 10)
 
+THEME_NAME = "abletools"
+THEME_SETTINGS: dict[str, dict[str, dict[str, object]]] = {
+    "TLabel": {"configure": {"background": BG, "foreground": TEXT}},
+    "TFrame": {"configure": {"background": BG}},
+    "TLabelFrame": {
+        "configure": {"background": PANEL, "foreground": TEXT, "borderwidth": 1}
+    },
+    "TLabelFrame.Label": {"configure": {"background": PANEL, "foreground": TEXT}},
+    "TButton": {
+        "configure": {
+            "font": BODY_FONT,
+            "foreground": TEXT,
+            "background": PANEL_ALT,
+            "borderwidth": 1,
+            "focusthickness": 1,
+            "focuscolor": ACCENT_SOFT,
+        },
+        "map": {
+            "background": [("active", "#1b2736")],
+            "foreground": [("active", TEXT)],
+        },
+    },
+    "Accent.TButton": {
+        "configure": {
+            "foreground": "#001014",
+            "background": ACCENT,
+            "borderwidth": 1,
+            "focusthickness": 1,
+            "focuscolor": ACCENT_2,
+            "padding": (10, 6),
+        },
+        "map": {
+            "background": [("active", ACCENT_2)],
+            "foreground": [("active", "#001014")],
+        },
+    },
+    "Ghost.TButton": {
+        "configure": {
+            "foreground": TEXT,
+            "background": BG_NAV,
+            "borderwidth": 1,
+            "focusthickness": 1,
+            "focuscolor": ACCENT_SOFT,
+            "padding": (10, 6),
+        },
+        "map": {
+            "background": [("active", "#0f1a26")],
+            "foreground": [("active", TEXT)],
+        },
+    },
+    "Nav.TButton": {
+        "configure": {
+            "foreground": MUTED,
+            "background": BG_NAV,
+            "borderwidth": 1,
+            "focusthickness": 1,
+            "focuscolor": ACCENT_SOFT,
+            "padding": (6, 10),
+        },
+        "map": {
+            "background": [("active", "#0f1a26")],
+            "foreground": [("active", TEXT)],
+        },
+    },
+    "NavActive.TButton": {
+        "configure": {
+            "foreground": "#001014",
+            "background": ACCENT_2,
+            "borderwidth": 1,
+            "focusthickness": 1,
+            "focuscolor": ACCENT,
+            "padding": (6, 10),
+        },
+        "map": {
+            "background": [("active", ACCENT)],
+            "foreground": [("active", "#001014")],
+        },
+    },
+    "TCheckbutton": {
+        "configure": {"background": PANEL, "foreground": TEXT},
+        "map": {
+            "foreground": [("active", TEXT)],
+            "background": [("active", PANEL)],
+        },
+    },
+    "Panel.TFrame": {"configure": {"background": PANEL}},
+    "Panel.TLabel": {"configure": {"background": PANEL, "foreground": TEXT}},
+    "Panel.TLabelframe": {
+        "configure": {"background": PANEL, "foreground": TEXT, "borderwidth": 1}
+    },
+    "Panel.TLabelframe.Label": {"configure": {"background": PANEL, "foreground": TEXT}},
+    "Panel.TEntry": {
+        "configure": {
+            "fieldbackground": PANEL_ALT,
+            "foreground": TEXT,
+            "background": PANEL_ALT,
+            "insertcolor": TEXT,
+        }
+    },
+    "Panel.TCombobox": {
+        "configure": {
+            "fieldbackground": PANEL_ALT,
+            "foreground": TEXT,
+            "background": PANEL_ALT,
+        },
+        "map": {
+            "fieldbackground": [("readonly", PANEL_ALT)],
+            "background": [("readonly", PANEL_ALT)],
+            "foreground": [("readonly", TEXT)],
+        },
+    },
+    "Panel.TCheckbutton": {
+        "configure": {"background": PANEL, "foreground": TEXT},
+        "map": {
+            "foreground": [("active", TEXT)],
+            "background": [("active", PANEL)],
+        },
+    },
+    "Panel.Horizontal.TProgressbar": {
+        "configure": {"troughcolor": PANEL_ALT, "background": ACCENT}
+    },
+}
+
 
 def format_mtime(value: object) -> str:
     try:
@@ -89,9 +259,66 @@ def truncate_path(path: str, max_len: int = 60) -> str:
     return f"{path[:keep]}…{path[-keep:]}"
 
 
+PAYLOAD_KEY_SORT_LIMIT = 200
+PAYLOAD_KEY_PREVIEW = 64
+PAYLOAD_SUMMARY_KEYS = 50
+
+
+def _leading_keys(payload: dict) -> list[str]:
+    if len(payload) < PAYLOAD_KEY_SORT_LIMIT:
+        return sorted(payload)
+    return heapq.nsmallest(PAYLOAD_KEY_PREVIEW, payload)
+
+
+def join_keys_preview(payload: object, max_len: int) -> str:
+    if not isinstance(payload, dict):
+        return ""
+    parts: list[str] = []
+    total = 0
+    for key in _leading_keys(payload):
+        total += len(key) + (2 if parts else 0)
+        if total > max_len:
+            break
+        parts.append(key)
+    return ", ".join(parts)
+
+
+def add_detail_row(frame: tk.Misc, detail_rows: list[tuple[tk.Label, tk.Label]]) -> None:
+    label = tk.Label(
+        frame,
+        text="",
+        font=BODY_FONT,
+        fg=MUTED,
+        bg=PANEL,
+        anchor="e",
+        width=12,
+    )
+    value = tk.Label(
+        frame,
+        text="",
+        font=BODY_FONT,
+        fg=TEXT,
+        bg=PANEL,
+        anchor="w",
+        justify="left",
+        wraplength=260,
+    )
+    row = len(detail_rows)
+    label.grid(row=row, column=0, sticky="e", padx=(0, 6), pady=2)
+    value.grid(row=row, column=1, sticky="w", pady=2)
+    detail_rows.append((label, value))
+
+
 def set_detail_fields(
-    detail_rows: list[tuple[tk.Label, tk.Label]], fields: list[tuple[str, str]]
+    detail_rows: list[tuple[tk.Label, tk.Label]],
+    fields: list[tuple[str, str]],
+    frame: tk.Misc | None = None,
+    max_rows: int = 12,
 ) -> None:
+    """Show fields in the label pairs, growing rows in frame (up to max_rows) on demand."""
+    if frame is not None:
+        while len(detail_rows) < min(len(fields), max_rows):
+            add_detail_row(frame, detail_rows)
     for idx, (label, value) in enumerate(detail_rows):
         if idx < len(fields):
             label.configure(text=f"{fields[idx][0]}:")
@@ -146,18 +373,6 @@ class HoverTooltip:
         self._hide()
 
 
-_TIMESTAMP_BRACKET_RE = re.compile(r"\[[0-9][0-9  T:_-]{4,}[0-9]\]")
-
-
-def is_backup_path(path: str) -> bool:
-    if not path:
-        return False
-    p = Path(path)
-    if any(part.lower() == "backup" for part in p.parts):
-        return True
-    return bool(_TIMESTAMP_BRACKET_RE.search(p.name))
-
-
 def select_set_paths_dialog(
     parent: tk.Widget,
     app: "AbletoolsUI",
@@ -315,6 +530,46 @@ def select_set_paths_dialog(
     return (result["paths"] or [], names)
 
 
+_GIF_CACHE: dict[tuple[str, int], list[tk.PhotoImage]] = {}
+
+
+def load_gif_frames(path: Path, subsample: int = 1) -> list[tk.PhotoImage]:
+    """Decode every frame of a GIF once per (path, subsample); widgets share the list."""
+    key = (str(path), subsample)
+    cached = _GIF_CACHE.get(key)
+    if cached is not None:
+        return cached
+    if not path.exists():
+        return []
+    frames: list[tk.PhotoImage] = []
+    if Image is not None:
+        # One sequential decode; Tk's "gif -index N" re-decodes from frame 0 each time.
+        try:
+            with Image.open(path) as img:
+                for frame in ImageSequence.Iterator(img):
+                    frame = frame.convert("RGBA")
+                    if subsample > 1:
+                        frame = frame.reduce(subsample)
+                    frames.append(ImageTk.PhotoImage(frame))
+        except (OSError, tk.TclError):
+            frames = []
+        if frames:
+            _GIF_CACHE[key] = frames
+            return frames
+    idx = 0
+    while True:
+        try:
+            frame = tk.PhotoImage(file=str(path), format=f"gif -index {idx}")
+        except tk.TclError:
+            break
+        if subsample > 1:
+            frame = frame.subsample(subsample, subsample)
+        frames.append(frame)
+        idx += 1
+    _GIF_CACHE[key] = frames
+    return frames
+
+
 class AnimatedGif:
     def __init__(
         self,
@@ -333,18 +588,7 @@ class AnimatedGif:
         self._load_frames()
 
     def _load_frames(self) -> None:
-        if not self.path.exists():
-            return
-        idx = 0
-        while True:
-            try:
-                frame = tk.PhotoImage(file=str(self.path), format=f"gif -index {idx}")
-            except tk.TclError:
-                break
-            if self.subsample > 1:
-                frame = frame.subsample(self.subsample, self.subsample)
-            self.frames.append(frame)
-            idx += 1
+        self.frames = load_gif_frames(self.path, self.subsample)
 
     def start(self) -> None:
         if not self.frames:
@@ -387,18 +631,7 @@ class AnimatedGifCanvas:
         self._load_frames()
 
     def _load_frames(self) -> None:
-        if not self.path.exists():
-            return
-        idx = 0
-        while True:
-            try:
-                frame = tk.PhotoImage(file=str(self.path), format=f"gif -index {idx}")
-            except tk.TclError:
-                break
-            if self.subsample > 1:
-                frame = frame.subsample(self.subsample, self.subsample)
-            self.frames.append(frame)
-            idx += 1
+        self.frames = load_gif_frames(self.path, self.subsample)
 
     def place_centered(self, width: int, height: int) -> None:
         if not self.frames:
@@ -465,11 +698,31 @@ def _now_iso() -> str:
     return datetime.now().astimezone().isoformat(timespec="seconds")
 
 
+def json_loads(text: str | bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+JSON_CACHE_SIZE = 64
+_JSON_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
 def _safe_read_json(path: Path) -> dict:
+    """Parse a JSON file, reusing the last result while its mtime and size are unchanged."""
+    key = str(path)
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        st = path.stat()
+        cached = _JSON_CACHE.get(key)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+        data = json_loads(path.read_bytes())
     except Exception:
         return {}
+    if len(_JSON_CACHE) >= JSON_CACHE_SIZE:
+        _JSON_CACHE.pop(next(iter(_JSON_CACHE)))
+    _JSON_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 class DashboardPanel(tk.Frame):
@@ -477,6 +730,7 @@ class DashboardPanel(tk.Frame):
         super().__init__(master, bg=BG)
         self.app = app
         self.stats = CatalogStats()
+        self._shown_text: dict[str, str] = {}
 
         self._build()
 
@@ -672,6 +926,13 @@ class DashboardPanel(tk.Frame):
             do_rebuild = rebuild_var.get()
 
             def worker() -> None:
+                self.app._job_started("Cleaning catalog")
+                try:
+                    _clean()
+                finally:
+                    self.app._job_finished("Cleaning catalog")
+
+            def _clean() -> None:
                 removed, bytes_freed = self.app.cleanup_catalog(selected)
                 pruned_files = 0
                 pruned_bytes = 0
@@ -691,6 +952,7 @@ class DashboardPanel(tk.Frame):
                         db_path = self.app.resolve_catalog_db_path()
                         if db_path and db_path.exists():
                             pruned_rows, _ = prune_db_file_index(db_path)
+                            self.app._db_pool.invalidate()
                 elif do_rebuild:
                     ok, msg = self.app.rebuild_catalog_db()
                     maintenance_msg = " Rebuilt DB." if ok else f" Rebuild failed: {msg}"
@@ -769,7 +1031,9 @@ class DashboardPanel(tk.Frame):
     def refresh(self) -> None:
         scope = self._current_scope()
         self.scope_label.configure(text=f"Scope: {scope}")
-        focus = self.app.load_dashboard_focus(scope)
+        focus = self.app.db_cached(
+            f"dashboard_focus:{scope}", lambda: self.app.load_dashboard_focus(scope)
+        )
         total_sets = int(focus.get("set_count_total", 0))
         non_backup_sets = int(focus.get("set_count_non_backup", 0))
         backup_sets = max(0, total_sets - non_backup_sets)
@@ -791,39 +1055,170 @@ class DashboardPanel(tk.Frame):
             lines.append(f"Duration sec: {summary.get('duration_sec', 0)}")
         else:
             lines.append("No scan summary found.")
-        self.activity_text.configure(state="normal")
-        self.activity_text.delete("1.0", "end")
-        self.activity_text.insert("end", "\n".join(lines))
-        self.activity_text.configure(state="disabled")
-
-        devices = self.app.load_top_devices()
-        plugins = self.app.load_top_plugins()
-        chains = self.app.load_top_chains()
-        missing_paths = self.app.load_missing_refs_paths()
-        self.top_devices_text.configure(state="normal")
-        self.top_devices_text.delete("1.0", "end")
-        self.top_devices_text.insert("end", "\n".join(devices) if devices else "No data yet.")
-        self.top_devices_text.configure(state="disabled")
-
-        self.top_plugins_text.configure(state="normal")
-        self.top_plugins_text.delete("1.0", "end")
-        self.top_plugins_text.insert("end", "\n".join(plugins) if plugins else "No data yet.")
-        self.top_plugins_text.configure(state="disabled")
-
-        self.top_chains_text.configure(state="normal")
-        self.top_chains_text.delete("1.0", "end")
-        self.top_chains_text.insert("end", "\n".join(chains) if chains else "No data yet.")
-        self.top_chains_text.configure(state="disabled")
-
-        self.missing_paths_text.configure(state="normal")
-        self.missing_paths_text.delete("1.0", "end")
-        self.missing_paths_text.insert(
-            "end", "\n".join(missing_paths) if missing_paths else "No data yet."
+        self._set_text(self.activity_text, "\n".join(lines))
+
+        extras = self.app.db_cached("dashboard_extras", self.app.load_dashboard_extras)
+        devices = extras["devices"]
+        plugins = extras["plugins"]
+        chains = extras["chains"]
+        missing_paths = extras["missing_paths"]
+        self._set_text(self.top_devices_text, "\n".join(devices) if devices else "No data yet.")
+        self._set_text(self.top_plugins_text, "\n".join(plugins) if plugins else "No data yet.")
+        self._set_text(self.top_chains_text, "\n".join(chains) if chains else "No data yet.")
+        self._set_text(
+            self.missing_paths_text, "\n".join(missing_paths) if missing_paths else "No data yet."
         )
-        self.missing_paths_text.configure(state="disabled")
+
+    def _set_text(self, widget: tk.Text, content: str) -> None:
+        """Replace a read-only Text widget's content, skipping Tk calls when unchanged."""
+        key = str(widget)
+        if self._shown_text.get(key) == content:
+            return
+        widget.configure(state="normal")
+        widget.delete("1.0", "end")
+        widget.insert("end", content)
+        widget.configure(state="disabled")
+        self._shown_text[key] = content
+
+
+def _as_is(value: object) -> object:
+    return value
+
+
+def _yes_no(value: object) -> str:
+    return "yes" if value else "no"
+
+
+def _blank_or_str(value: object) -> str:
+    return "" if value is None else str(value)
+
+
+PATH_NAME_CACHE_SIZE = 4096
+DETAIL_CACHE_SIZE = 256
+_PATH_NAME_CACHE: dict[str, str] = {}
+
+
+def _path_name(value: object) -> str:
+    """Truncated file name of a catalog path, memoized across refreshes."""
+    path = str(value)
+    name = _PATH_NAME_CACHE.get(path)
+    if name is None:
+        name = truncate_path(path.rpartition("/")[2].rpartition("\\")[2])
+        if len(_PATH_NAME_CACHE) >= PATH_NAME_CACHE_SIZE:
+            _PATH_NAME_CACHE.clear()
+        _PATH_NAME_CACHE[path] = name
+    return name
+
+
+# Catalog list columns -> (index into the query row, formatter).
+CATALOG_DOC_COLUMNS: dict[str, tuple[int, Callable[[object], object]]] = {
+    "name": (0, _path_name),
+    "path_full": (0, _as_is),
+    "ext": (1, _as_is),
+    "size": (2, format_bytes),
+    "mtime": (3, format_mtime),
+    "tracks": (4, _blank_or_str),
+    "clips": (5, _blank_or_str),
+    "devices": (6, _yes_no),
+    "samples": (7, _yes_no),
+    "missing": (8, _yes_no),
+    "scanned_at": (9, format_mtime),
+    "scope": (10, _as_is),
+}
+CATALOG_PREF_COLUMNS: dict[str, tuple[int, Callable[[object], object]]] = {
+    "kind": (0, _as_is),
+    "source": (1, _as_is),
+    "mtime": (2, format_mtime),
+    "scope": (0, lambda _value: "preferences"),
+}
+
+
+def format_catalog_rows(
+    scope: str, rows: list[tuple], columns: Iterable[str]
+) -> list[dict[str, object]]:
+    """Format only the requested columns of raw catalog query rows."""
+    colmap = CATALOG_PREF_COLUMNS if scope == "preferences" else CATALOG_DOC_COLUMNS
+    wanted = {"scope", *columns}
+    if scope != "preferences":
+        wanted.add("path_full")
+    if scope == "user_library":
+        # File rows reuse mtime in the scanned_at slot; the list never showed it.
+        wanted.discard("scanned_at")
+    fields = [(name, *colmap[name]) for name in wanted if name in colmap]
+    return [{name: fmt(row[idx]) for name, idx, fmt in fields} for row in rows]
+
+
+def fts_can_narrow(term: str) -> bool:
+    """Whether the trigram index can serve LIKE for term (needs 3 non-wildcard chars)."""
+    return re.search(r"[^%_]{3}", term) is not None
+
+
+FILE_AUDIO_COLUMNS = ("audio_duration", "audio_sample_rate", "audio_channels")
+
+
+def catalog_detail_sql(suffix: str, audio_columns: bool) -> str:
+    """One-row detail query for a document: doc fields, file stats and ref counts.
+
+    Columns, in order: path, tracks_total, clips_total, tempo, has_file, ext,
+    size, mtime, the FILE_AUDIO_COLUMNS, n_samples, n_devices, n_missing.
+    """
+    if audio_columns:
+        audio_sql = ", ".join(f"f.{name}" for name in FILE_AUDIO_COLUMNS)
+    else:
+        audio_sql = ", ".join("NULL" for _name in FILE_AUDIO_COLUMNS)
+    return (
+        "SELECT d.path, d.tracks_total, d.clips_total, d.tempo, f.path IS NOT NULL, "
+        f"f.ext, f.size, f.mtime, {audio_sql}, "
+        f"(SELECT COUNT(*) FROM doc_sample_refs{suffix} WHERE doc_path = d.path) AS n_samples, "
+        f"(SELECT COUNT(*) FROM doc_device_hints{suffix} WHERE doc_path = d.path) AS n_devices, "
+        f"(SELECT COUNT(*) FROM refs_graph{suffix} "
+        "WHERE src = d.path AND ref_exists = 0) AS n_missing "
+        f"FROM ableton_docs{suffix} d LEFT JOIN file_index{suffix} f ON f.path = d.path "
+        "WHERE d.path = ?"
+    )
 
 
 class CatalogPanel(tk.Frame):
+    _DOC_COLUMNS = (
+        "SELECT path, ext, size, mtime, tracks_total, clips_total, "
+        "has_devices, has_samples, missing_refs, scanned_at, scope "
+        "FROM catalog_docs "
+    )
+    _SQL_PREFS = (
+        "SELECT kind, source, mtime, scanned_at "
+        "FROM ableton_prefs "
+        "WHERE {where} "
+        f"ORDER BY mtime DESC LIMIT {CATALOG_LIST_LIMIT}"
+    )
+    _SQL_USER_LIB = (
+        _DOC_COLUMNS + "WHERE scope = 'user_library' "
+        "AND {where} "
+        "UNION ALL "
+        "SELECT path, ext, size, mtime, NULL, NULL, 0, 0, 0, mtime, 'user_library' "
+        "FROM file_index_user_library "
+        "WHERE kind != 'ableton_doc' "
+        "AND {file_where} "
+        f"ORDER BY mtime DESC LIMIT {CATALOG_LIST_LIMIT}"
+    )
+    _SQL_ALL = (
+        _DOC_COLUMNS + "WHERE {where} "
+        f"ORDER BY scanned_at DESC LIMIT {CATALOG_LIST_LIMIT}"
+    )
+    _SQL_SCOPED = (
+        _DOC_COLUMNS + "WHERE scope = ? AND ext IN ('.als', '.alc') AND "
+        "{where} "
+        f"ORDER BY scanned_at DESC LIMIT {CATALOG_LIST_LIMIT}"
+    )
+    _SQL_PREF_DETAIL = (
+        "SELECT kind, source, mtime, payload_json FROM ableton_prefs WHERE source = ?"
+    )
+    # Every scope with catalog docs has a key here, so clicks never assemble SQL.
+    _SQL_DETAIL = {
+        (suffix, audio): catalog_detail_sql(suffix, audio)
+        for suffix in ("", "_user_library")
+        for audio in (True, False)
+    }
+
     def __init__(self, master: tk.Misc, app: "AbletoolsUI") -> None:
         super().__init__(master, bg=BG)
         self.app = app
@@ -835,10 +1230,25 @@ class CatalogPanel(tk.Frame):
         self.show_backups = tk.BooleanVar(value=False)
         self.visible_columns: list[str] = []
         self._sort_state: dict[str, bool] = {}
-        self._last_rows: list[dict[str, str]] = []
+        self._last_rows: list[dict[str, object]] = []
+        self._last_raw_rows: list[tuple] = []
+        self._row_items: list[str] = []
+        self._row_by_iid: dict[str, dict[str, object]] = {}
+        self._query_cache: tuple[tuple, list[tuple]] | None = None
+        self._last_scope = ""
+        self._refresh_token = 0
+        self._applied_token = 0
+        self._refresh_job: str | None = None
+        self._searched_term = ""
+        self._measure_cache: dict[str, int] = {}
+        self._col_widths: dict[str, int] = {}
+        self._audio_columns: dict[tuple[Path, int, str], bool] = {}
+        self._detail_token = 0
+        self._detail_cache: dict[tuple, tuple[list[tuple[str, str]], str]] = {}
         self._build()
 
     def _build(self) -> None:
+        self._body_font = tkfont.Font(font=BODY_FONT)
         header = tk.Frame(self, bg=BG)
         header.pack(fill="x", padx=16, pady=(16, 8))
 
@@ -868,11 +1278,12 @@ class CatalogPanel(tk.Frame):
             relief="flat",
         )
         search_entry.pack(side="left", padx=(0, 8))
-        search_entry.bind("<Return>", lambda _event: self.refresh())
+        search_entry.bind("<Return>", self._schedule_refresh)
+        search_entry.bind("<KeyRelease>", self._on_search_key)
         ttk.Button(
             search,
             text="Search",
-            command=self.refresh,
+            command=self._schedule_refresh,
             style="Accent.TButton",
         ).pack(side="left")
         ttk.Button(
@@ -927,7 +1338,7 @@ class CatalogPanel(tk.Frame):
             activebackground=PANEL,
             activeforeground=TEXT,
             selectcolor=BG_NAV,
-            command=self.refresh,
+            command=self._schedule_refresh,
         )
         self.filter_buttons["missing"].pack(anchor="w", padx=12, pady=2)
         self.filter_buttons["devices"] = tk.Checkbutton(
@@ -939,7 +1350,7 @@ class CatalogPanel(tk.Frame):
             activebackground=PANEL,
             activeforeground=TEXT,
             selectcolor=BG_NAV,
-            command=self.refresh,
+            command=self._schedule_refresh,
         )
         self.filter_buttons["devices"].pack(anchor="w", padx=12, pady=2)
         self.filter_buttons["samples"] = tk.Checkbutton(
@@ -951,7 +1362,7 @@ class CatalogPanel(tk.Frame):
             activebackground=PANEL,
             activeforeground=TEXT,
             selectcolor=BG_NAV,
-            command=self.refresh,
+            command=self._schedule_refresh,
         )
         self.filter_buttons["samples"].pack(anchor="w", padx=12, pady=2)
         self.filter_buttons["backups"] = tk.Checkbutton(
@@ -963,7 +1374,7 @@ class CatalogPanel(tk.Frame):
             activebackground=PANEL,
             activeforeground=TEXT,
             selectcolor=BG_NAV,
-            command=self.refresh,
+            command=self._schedule_refresh,
         )
         self.filter_buttons["backups"].pack(anchor="w", padx=12, pady=(2, 12))
 
@@ -989,7 +1400,8 @@ class CatalogPanel(tk.Frame):
         )
         self.pref_summary.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
         self.pref_summary.grid_remove()
-        self._build_tree(self._default_columns_for_scope("live_recordings"))
+        self._init_tree()
+        self._apply_columns(self._default_columns_for_scope("live_recordings"))
 
         detail = tk.Frame(body, bg=PANEL, highlightbackground=BORDER, highlightthickness=1)
         detail.grid(row=0, column=2, sticky="ns", padx=(12, 0))
@@ -1001,30 +1413,6 @@ class CatalogPanel(tk.Frame):
         self.detail_frame = tk.Frame(detail, bg=PANEL)
         self.detail_frame.grid(row=1, column=0, sticky="nsew", padx=12, pady=(0, 12))
         self.detail_rows: list[tuple[tk.Label, tk.Label]] = []
-        for _ in range(12):
-            label = tk.Label(
-                self.detail_frame,
-                text="",
-                font=BODY_FONT,
-                fg=MUTED,
-                bg=PANEL,
-                anchor="e",
-                width=12,
-            )
-            value = tk.Label(
-                self.detail_frame,
-                text="",
-                font=BODY_FONT,
-                fg=TEXT,
-                bg=PANEL,
-                anchor="w",
-                justify="left",
-                wraplength=260,
-            )
-            row = len(self.detail_rows)
-            label.grid(row=row, column=0, sticky="e", padx=(0, 6), pady=2)
-            value.grid(row=row, column=1, sticky="w", pady=2)
-            self.detail_rows.append((label, value))
         self._configure_filters(self.scope_var.get())
 
     def _reset_filters(self) -> None:
@@ -1061,9 +1449,7 @@ class CatalogPanel(tk.Frame):
         return ["tracks", "clips", "devices", "samples", "missing", "ext", "size"]
 
     def _set_columns_for_scope(self, scope: str) -> None:
-        base = self._default_columns_for_scope(scope)
-        self.visible_columns = base
-        self._build_tree(self.visible_columns)
+        self._apply_columns(self._default_columns_for_scope(scope))
 
     def _configure_filters(self, scope: str) -> None:
         state = "normal" if scope in {"live_recordings", "all"} else "disabled"
@@ -1096,8 +1482,8 @@ class CatalogPanel(tk.Frame):
                 else:
                     if c in self.visible_columns:
                         self.visible_columns.remove(c)
-                self._build_tree(self.visible_columns)
-                self.refresh()
+                self._apply_columns(self.visible_columns)
+                self._rerender_rows()
 
             menu.add_checkbutton(label=col.replace("_", " ").title(), variable=var, command=_toggle)
         menu.tk_popup(self.winfo_pointerx(), self.winfo_pointery())
@@ -1136,26 +1522,31 @@ class CatalogPanel(tk.Frame):
     def _open_full_table(self) -> None:
         scope = self.scope_var.get()
         if not self._last_rows:
-            self.refresh()
+            self.refresh(wait=True)
         win = tk.Toplevel(self)
         win.title("Catalog - Full Table")
         win.geometry("900x600")
         frame = tk.Frame(win, bg=BG)
         frame.pack(fill="both", expand=True)
+        columns = self._full_columns_for_scope(scope)
         tree = ttk.Treeview(
             frame,
-            columns=self._full_columns_for_scope(scope),
+            columns=columns,
             show="headings",
             height=20,
         )
-        for col in tree["columns"]:
+        for col in columns:
             heading = col.replace("_", " ").title()
             tree.heading(col, text=heading, command=lambda c=col: None)
             tree.column(col, anchor="w")
-        tree.pack(fill="both", expand=True)
-        for values in self._last_rows:
-            row_values = [values.get(col, "") for col in tree["columns"]]
+        # Fill the tree before it is mapped so Tk lays it out once.
+        rows = [
+            [values.get(col, "") for col in columns]
+            for values in format_catalog_rows(self._last_scope, self._last_raw_rows, columns)
+        ]
+        for row_values in rows:
             tree.insert("", "end", values=row_values)
+        tree.pack(fill="both", expand=True)
         win.focus_set()
 
     def _scan_selected(self) -> None:
@@ -1250,82 +1641,131 @@ class CatalogPanel(tk.Frame):
             "Catalog Audit",
             "Found sets with 0 tracks:\n" + "\n".join(issues[:8]),
         )
-    def _build_tree(self, columns: list[str]) -> None:
-        for child in self.tree_frame.winfo_children():
-            child.destroy()
+    _COLUMN_WIDTHS = {
+        "name": 280,
+        "path_full": 0,
+        "ext": 70,
+        "size": 90,
+        "mtime": 140,
+        "tracks": 70,
+        "clips": 70,
+        "devices": 70,
+        "samples": 70,
+        "missing": 70,
+        "scope": 90,
+        "kind": 90,
+        "source": 260,
+    }
+    _COLUMN_ANCHORS = {
+        "size": "e",
+        "tracks": "center",
+        "clips": "center",
+        "devices": "center",
+        "samples": "center",
+        "missing": "center",
+        "ext": "center",
+    }
+
+    def _init_tree(self) -> None:
+        self.tree = ttk.Treeview(self.tree_frame, columns=(), show="headings", height=14)
+        self.tree.pack(fill="both", expand=True)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def _apply_columns(self, columns: list[str]) -> None:
+        """Reconfigure the one Treeview in place; existing rows are cleared."""
         self.visible_columns = columns
-        self.tree = ttk.Treeview(
-            self.tree_frame,
-            columns=columns,
-            show="headings",
-            height=14,
-        )
+        self._col_widths = {}
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = tuple(columns)
+        self.tree["displaycolumns"] = tuple(columns)
         for col in columns:
             heading = col.replace("_", " ").title()
             self.tree.heading(col, text=heading, command=lambda c=col: self._sort_by(c))
-        widths = {
-            "name": 280,
-            "path_full": 0,
-            "ext": 70,
-            "size": 90,
-            "mtime": 140,
-            "tracks": 70,
-            "clips": 70,
-            "devices": 70,
-            "samples": 70,
-            "missing": 70,
-            "scope": 90,
-            "kind": 90,
-            "source": 260,
-        }
-        anchors = {
-            "size": "e",
-            "tracks": "center",
-            "clips": "center",
-            "devices": "center",
-            "samples": "center",
-            "missing": "center",
-            "ext": "center",
-        }
-        for col in columns:
-            width = widths.get(col, 120)
-            stretch = col not in {"path_full"}
-            self.tree.column(col, width=width, anchor=anchors.get(col, "w"), stretch=stretch)
-        self.tree.pack(fill="both", expand=True)
-        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+            self.tree.column(
+                col,
+                width=self._COLUMN_WIDTHS.get(col, 120),
+                anchor=self._COLUMN_ANCHORS.get(col, "w"),
+                stretch=col != "path_full",
+            )
+
+    def _rerender_rows(self) -> None:
+        """Re-emit the last query's rows for the current columns without re-querying."""
+        scope = self.scope_var.get()
+        stale = self._applied_token != self._refresh_token or scope != self._last_scope
+        if stale or scope == "preferences":
+            self.refresh()
+            return
+        self._last_rows = format_catalog_rows(scope, self._last_raw_rows, self.visible_columns)
+        self._insert_rows(self._last_rows)
+
+    def _insert_rows(self, rows: list[dict[str, object]]) -> None:
+        """Fill the tree and size its columns while they are hidden, so Tk lays out once."""
+        columns = tuple(self.visible_columns)
+        tree = self.tree
+        insert = tree.insert
+        tree["displaycolumns"] = ()
+        try:
+            self._row_items = [
+                insert("", "end", values=[values.get(col, "") for col in columns])
+                for values in rows
+            ]
+            self._row_by_iid = dict(zip(self._row_items, rows, strict=True))
+            self._autosize_columns()
+        finally:
+            tree["displaycolumns"] = columns
+
+    _NUMERIC_SORT_COLUMNS = frozenset(
+        {"size", "mtime", "tracks", "clips", "devices", "samples", "missing", "scanned_at"}
+    )
 
     def _sort_by(self, column: str) -> None:
-        items = [(self.tree.set(k, column), k) for k in self.tree.get_children("")]
         reverse = self._sort_state.get(column, False)
-
-        def to_number(val: str) -> float:
-            try:
-                return float(val)
-            except Exception:
-                return 0.0
-
-        if column in {"size"}:
-            items.sort(key=lambda t: self._parse_size_display(t[0]), reverse=reverse)
-        elif column in {"mtime"}:
-            items.sort(key=lambda t: self._parse_mtime_display(t[0]), reverse=reverse)
-        elif column in {"tracks", "clips"}:
-            items.sort(key=lambda t: to_number(t[0]), reverse=reverse)
+        items = self._row_items
+        raw_rows = self._last_raw_rows
+        rows = self._last_rows
+        if self._last_scope == "preferences" or not (
+            len(items) == len(raw_rows) == len(rows)
+        ):
+            return
+        if column in self._NUMERIC_SORT_COLUMNS:
+            # Sort on the stored SQLite values instead of re-parsing display strings.
+            idx = CATALOG_DOC_COLUMNS[column][0]
+            keys = [row[idx] or 0 for row in raw_rows]
         else:
-            items.sort(key=lambda t: t[0].lower(), reverse=reverse)
-        for index, (_, k) in enumerate(items):
-            self.tree.move(k, "", index)
+            keys = [str(values.get(column, "")).lower() for values in rows]
+        order = sorted(range(len(items)), key=keys.__getitem__, reverse=reverse)
+        move = self.tree.move
+        for index, pos in enumerate(order):
+            move(items[pos], "", index)
+        self._row_items = [items[pos] for pos in order]
+        self._last_raw_rows = [raw_rows[pos] for pos in order]
+        self._last_rows = [rows[pos] for pos in order]
         self._sort_state[column] = not reverse
 
+    def _measure(self, text: str) -> int:
+        width = self._measure_cache.get(text)
+        if width is None:
+            if len(self._measure_cache) >= MEASURE_CACHE_SIZE:
+                self._measure_cache.clear()
+            width = self._body_font.measure(text)
+            self._measure_cache[text] = width
+        return width
+
     def _autosize_columns(self) -> None:
-        font = tkfont.Font(font=BODY_FONT)
+        # Rows arrive newest-first; the head of the list is a good enough width sample.
+        sample = self._last_rows[:AUTOSIZE_SAMPLE_ROWS]
+        applied = self._col_widths
         for col in self.visible_columns:
             if col == "path_full":
                 continue
-            max_width = font.measure(col.replace("_", " ").title()) + 20
-            for item in self.tree.get_children("")[:200]:
-                value = self.tree.set(item, col)
-                max_width = max(max_width, font.measure(value) + 20)
-            self.tree.column(col, width=min(max_width, 420))
+            max_width = self._measure(col.replace("_", " ").title()) + 20
+            for values in sample:
+                max_width = max(max_width, self._measure(str(values.get(col, ""))) + 20)
+            width = min(max_width, 420)
+            # Most refreshes land on the same widths; skip the Tk round-trip for those.
+            if applied.get(col) != width:
+                self.tree.column(col, width=width)
+                applied[col] = width
 
     def _format_bytes(self, value: object) -> str:
         try:
@@ -1344,37 +1784,10 @@ class CatalogPanel(tk.Frame):
             return f"{int(size_float)} {units[unit_idx]}"
         return f"{size_float:.1f} {units[unit_idx]}"
 
-    def _parse_size_display(self, value: str) -> float:
-        if not value:
-            return 0.0
-        parts = value.strip().split()
-        if not parts:
-            return 0.0
-        try:
-            num = float(parts[0])
-        except Exception:
-            return 0.0
-        unit = parts[1].upper() if len(parts) > 1 else "B"
-        scale = {
-            "B": 1.0,
-            "KB": 1024.0,
-            "MB": 1024.0**2,
-            "GB": 1024.0**3,
-            "TB": 1024.0**4,
-        }.get(unit, 1.0)
-        return num * scale
-
-    def _parse_mtime_display(self, value: str) -> float:
-        if not value:
-            return 0.0
-        try:
-            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timestamp()
-        except Exception:
-            return 0.0
-
     def _set_detail_message(self, message: str) -> None:
+        self._detail_token += 1  # drop any detail lookup still in flight
         self._reset_detail_row_interactions()
-        set_detail_fields(self.detail_rows, [("Info", message)])
+        set_detail_fields(self.detail_rows, [("Info", message)], self.detail_frame)
 
     def _render_pref_summary(self) -> None:
         self.pref_summary.configure(state="normal")
@@ -1389,7 +1802,7 @@ class CatalogPanel(tk.Frame):
         self.pref_summary.insert("end", "Preferences Summary\n\n")
         for kind, count in sorted(kinds.items()):
             self.pref_summary.insert("end", f"{kind}: {count}\n")
-        self.pref_summary.insert("\nSources:\n")
+        self.pref_summary.insert("end", "\nSources:\n")
         for row in self._last_rows[:12]:
             self.pref_summary.insert("end", f"- {row.get('source', '')}\n")
         self.pref_summary.configure(state="disabled")
@@ -1418,23 +1831,58 @@ class CatalogPanel(tk.Frame):
         tooltip = HoverTooltip(value, path)
         setattr(value, "_hover_tooltip", tooltip)
 
-    def refresh(self) -> None:
+    def _schedule_refresh(self, _event: object = None) -> None:
+        """Coalesce filter toggles and search input within SEARCH_DEBOUNCE_MS into one refresh."""
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+        self._refresh_job = self.after(SEARCH_DEBOUNCE_MS, self.refresh)
+
+    def _on_search_key(self, _event: object) -> None:
+        if self.search_var.get().strip() != self._searched_term:
+            self._schedule_refresh()
+
+    def _create_db_then_refresh(self, token: int) -> None:
+        self.app.ensure_catalog_db()
+
+        def _done() -> None:
+            if token == self._refresh_token:
+                self.refresh(created=True)
+
+        self.after(0, _done)
+
+    def refresh(self, wait: bool = False, created: bool = False) -> None:
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        self._refresh_token += 1
+        token = self._refresh_token
         if self.app.current_scope and self.scope_var.get() != "all":
             if self.scope_var.get() != self.app.current_scope:
                 self.scope_var.set(self.app.current_scope)
         db_path = self.app.resolve_catalog_db_path()
         self.tree.delete(*self.tree.get_children())
+        self._row_by_iid = {}
         self._set_detail_message("Select an item to view details.")
         if not db_path or not db_path.exists():
-            self.app.ensure_catalog_db()
-            db_path = self.app.resolve_catalog_db_path()
-            if not db_path or not db_path.exists():
+            if not created and not wait:
+                # Creating the DB runs a worker script; keep it off the Tk thread.
+                self._set_detail_message("Creating catalog database...")
+                threading.Thread(
+                    target=self._create_db_then_refresh, args=(token,), daemon=True
+                ).start()
+                return
+            if not created:
+                self.app.ensure_catalog_db()
+            db_path = self.app.existing_catalog_db_path()
+            if not db_path:
                 self._set_detail_message(
-                    f"No database found at {db_path}. Run a scan to populate data."
+                    f"No database found at {self.app.resolve_catalog_db_path()}. "
+                    "Run a scan to populate data."
                 )
                 return
 
         term = self.search_var.get().strip()
+        self._searched_term = term
         scope = self.scope_var.get()
         self.pref_summary.grid_remove()
         self.tree_frame.grid()
@@ -1447,6 +1895,12 @@ class CatalogPanel(tk.Frame):
                 clauses.append("(source LIKE ? OR kind LIKE ?)")
                 params.extend([f"%{term}%", f"%{term}%"])
             else:
+                if fts_can_narrow(term) and self.app.catalog_fts_available(db_path):
+                    # Trigram LIKE matches exactly what path LIKE does, from the index.
+                    clauses.append(
+                        "rowid IN (SELECT rowid FROM catalog_fts WHERE path LIKE ?)"
+                    )
+                    params.append(f"%{term}%")
                 clauses.append("path LIKE ?")
                 params.append(f"%{term}%")
                 file_clauses.append("path LIKE ?")
@@ -1473,109 +1927,113 @@ class CatalogPanel(tk.Frame):
         if scope == "preferences":
             self.tree_frame.grid_remove()
             self.pref_summary.grid()
-            sql = (
-                "SELECT kind, source, mtime, scanned_at "
-                "FROM ableton_prefs "
-                f"WHERE {where_sql} "
-                "ORDER BY mtime DESC LIMIT 500"
-            )
+            sql = self._SQL_PREFS.format(where=where_sql)
         elif scope == "user_library":
-            sql = (
-                "SELECT path, ext, size, mtime, tracks_total, clips_total, "
-                "has_devices, has_samples, missing_refs, scanned_at, scope "
-                "FROM catalog_docs "
-                "WHERE scope = 'user_library' "
-                f"AND {where_sql} "
-                "UNION ALL "
-                "SELECT path, ext, size, mtime, NULL, NULL, 0, 0, 0, mtime, 'user_library' "
-                "FROM file_index_user_library "
-                "WHERE kind != 'ableton_doc' "
-                f"AND {file_where_sql} "
-                "ORDER BY mtime DESC LIMIT 500"
-            )
+            sql = self._SQL_USER_LIB.format(where=where_sql, file_where=file_where_sql)
         elif scope == "all":
-            sql = (
-                "SELECT path, ext, size, mtime, tracks_total, clips_total, "
-                "has_devices, has_samples, missing_refs, scanned_at, scope "
-                "FROM catalog_docs "
-                f"WHERE {where_sql} "
-                "ORDER BY scanned_at DESC LIMIT 500"
-            )
+            sql = self._SQL_ALL.format(where=where_sql)
         else:
-            sql = (
-                "SELECT path, ext, size, mtime, tracks_total, clips_total, "
-                "has_devices, has_samples, missing_refs, scanned_at, scope "
-                "FROM catalog_docs "
-                "WHERE scope = ? AND ext IN ('.als', '.alc') AND "
-                f"{where_sql} "
-                "ORDER BY scanned_at DESC LIMIT 500"
-            )
+            sql = self._SQL_SCOPED.format(where=where_sql)
             params = [scope, *params]
+        run_params = params if scope != "user_library" else params + file_params
+        self._last_rows = []
+        self._last_raw_rows = []
+        show_backups = self.show_backups.get()
+        columns = tuple(self.visible_columns)
+        # Generation covers in-app writes; the file stats catch CLI and external scans.
+        key = (
+            db_path,
+            self.app._db_pool.generation,
+            db_file_signature(db_path),
+            sql,
+            tuple(run_params),
+            show_backups,
+        )
+        if self._query_cache is not None and self._query_cache[0] == key:
+            raw_rows = self._query_cache[1]
+            rows = format_catalog_rows(scope, raw_rows, columns)
+            self._apply_rows(token, key, scope, raw_rows, rows)
+            return
+        fetch_args = (
+            token,
+            key,
+            db_path,
+            scope,
+            sql,
+            run_params,
+            show_backups,
+            columns,
+        )
+        if wait:
+            self._fetch_rows(*fetch_args)
+            return
+        threading.Thread(target=self._fetch_rows, args=fetch_args, daemon=True).start()
+
+    def _fetch_rows(
+        self,
+        token: int,
+        key: tuple,
+        db_path: Path,
+        scope: str,
+        sql: str,
+        params: list[str],
+        show_backups: bool,
+        columns: tuple[str, ...],
+    ) -> None:
+        keep_backups = scope == "preferences" or show_backups
+        raw_rows: list[tuple] = []
+        extend = raw_rows.extend
         try:
-            with sqlite3.connect(db_path) as conn:
-                self._last_rows = []
-                run_params = params if scope != "user_library" else params + file_params
-                for row in conn.execute(sql, run_params):
-                    if scope == "preferences":
-                        values = {
-                            "kind": row[0],
-                            "source": row[1],
-                            "mtime": format_mtime(row[2]),
-                            "scope": "preferences",
-                        }
-                        self._last_rows.append(values)
-                        continue
-                    elif scope == "user_library":
-                        name = truncate_path(Path(row[0]).name)
-                        values = {
-                            "name": name,
-                            "path_full": row[0],
-                            "ext": row[1],
-                            "size": self._format_bytes(row[2]),
-                            "mtime": format_mtime(row[3]),
-                            "tracks": "" if row[4] is None else str(row[4]),
-                            "clips": "" if row[5] is None else str(row[5]),
-                            "devices": "yes" if row[6] else "no",
-                            "samples": "yes" if row[7] else "no",
-                            "missing": "yes" if row[8] else "no",
-                            "scope": "user_library",
-                        }
+            with self.app._db_pool.acquire(db_path) as conn:
+                cur = conn.execute(sql, params)
+                while batch := cur.fetchmany(FETCH_BATCH_ROWS):
+                    if keep_backups:
+                        extend(batch)
                     else:
-                        name = truncate_path(Path(row[0]).name)
-                        values = {
-                            "name": name,
-                            "path_full": row[0],
-                            "ext": row[1],
-                            "size": self._format_bytes(row[2]),
-                            "mtime": format_mtime(row[3]),
-                            "tracks": "" if row[4] is None else str(row[4]),
-                            "clips": "" if row[5] is None else str(row[5]),
-                            "devices": "yes" if row[6] else "no",
-                            "samples": "yes" if row[7] else "no",
-                            "missing": "yes" if row[8] else "no",
-                            "scanned_at": format_mtime(row[9]),
-                            "scope": row[10],
-                        }
-                    if not self.show_backups.get() and is_backup_path(values.get("path_full", "")):
-                        continue
-                    row_values = [values.get(col, "") for col in self.visible_columns]
-                    self.tree.insert("", "end", values=row_values)
-                    self._last_rows.append(values)
-            self._autosize_columns()
-            if scope == "preferences":
-                self._render_pref_summary()
-        except sqlite3.OperationalError as exc:
-            if "no such table" in str(exc):
-                self._set_detail_message(
-                    "Catalog database missing tables. Run a scan or refresh the catalog."
-                )
-                self.app.log_ui_error(f"catalog refresh: {exc}")
-                return
-            self._set_detail_message(f"Failed to load catalog: {exc}")
-            self.app.log_ui_error(f"catalog refresh: {exc}")
+                        extend(row for row in batch if not is_backup_path(row[0]))
         except Exception as exc:
+            self._dispatch(self._apply_refresh_error, token, exc)
+            return
+        rows = format_catalog_rows(scope, raw_rows, columns)
+        self._dispatch(self._apply_rows, token, key, scope, raw_rows, rows)
+
+    def _dispatch(self, callback: Callable[..., None], *args: object) -> None:
+        if threading.current_thread() is threading.main_thread():
+            callback(*args)
+        else:
+            self.after(0, callback, *args)
+
+    def _apply_rows(
+        self,
+        token: int,
+        key: tuple,
+        scope: str,
+        raw_rows: list[tuple],
+        rows: list[dict[str, object]],
+    ) -> None:
+        if token != self._refresh_token:
+            return
+        self._applied_token = token
+        self._query_cache = (key, raw_rows)
+        self._last_scope = scope
+        self._last_raw_rows = raw_rows
+        self._last_rows = rows
+        if scope != "preferences":
+            self._insert_rows(rows)
+        else:
+            self._autosize_columns()
+            self._render_pref_summary()
+
+    def _apply_refresh_error(self, token: int, exc: Exception) -> None:
+        if token != self._refresh_token:
+            return
+        if isinstance(exc, sqlite3.OperationalError) and "no such table" in str(exc):
+            self._set_detail_message(
+                "Catalog database missing tables. Run a scan or refresh the catalog."
+            )
+        else:
             self._set_detail_message(f"Failed to load catalog: {exc}")
-            self.app.log_ui_error(f"catalog refresh: {exc}")
+        self.app.log_ui_error(f"catalog refresh: {exc}")
 
     def _set_detail(self, text: str) -> None:
         self.detail_text.configure(state="normal")
@@ -1587,76 +2045,98 @@ class CatalogPanel(tk.Frame):
         selection = self.tree.selection()
         if not selection:
             return
-        values = self.tree.item(selection[0], "values")
-        if not values:
+        values_map = self._row_by_iid.get(selection[0])
+        if not values_map:
             return
-        self._reset_detail_row_interactions()
-        values_map = {col: values[idx] for idx, col in enumerate(self.visible_columns)}
-        scope = values_map.get("scope", "live_recordings")
+        scope = str(values_map.get("scope") or "live_recordings")
         path = values_map.get("path_full") or values_map.get("source") or values_map.get("name")
-        suffix = "" if scope == "live_recordings" else f"_{scope}"
-        db_path = self.app.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        self._detail_token += 1
+        token = self._detail_token
+        db_path = self.app.existing_catalog_db_path()
+        if not db_path:
             self._set_detail_message("No database found.")
             return
+        # Generation plus file stats, so writes from outside the app also miss.
+        signature = db_file_signature(db_path)
+        key = (db_path, self.app._db_pool.generation, signature, scope, path)
+        cached = self._detail_cache.get(key)
+        if cached is not None:
+            self._apply_detail(token, *cached)
+            return
+        threading.Thread(
+            target=self._fetch_detail,
+            args=(token, key, db_path, scope, path, values_map),
+            daemon=True,
+        ).start()
+
+    def _fetch_detail(
+        self,
+        token: int,
+        key: tuple,
+        db_path: Path,
+        scope: str,
+        path: str,
+        values_map: dict[str, object],
+    ) -> None:
         try:
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                if scope == "preferences":
-                    row = conn.execute(
-                        "SELECT kind, source, mtime, payload_json FROM ableton_prefs WHERE source = ?",
-                        (values_map.get("source"),),
-                    ).fetchone()
-                    if not row:
-                        self._set_detail_message("Preference not found.")
-                        return
-                    payload = json.loads(row["payload_json"]) if row["payload_json"] else {}
-                    value_keys = ""
-                    if isinstance(payload, dict):
-                        values = payload.get("values")
-                        if isinstance(values, dict):
-                            value_keys = str(len(values))
-                    fields = [
-                        ("Kind", row["kind"]),
-                        ("Source", truncate_path(row["source"], 80)),
-                        ("Modified", format_mtime(row["mtime"])),
-                        ("Keys", ", ".join(sorted(payload.keys()))[:80]),
-                    ]
-                    if value_keys:
-                        fields.append(("Value keys", value_keys))
-                    set_detail_fields(self.detail_rows, fields)
-                    return
-
-                doc = conn.execute(
-                    f"SELECT * FROM ableton_docs{suffix} WHERE path = ?", (path,)
-                ).fetchone()
-                try:
-                    file_row = conn.execute(
-                        f"SELECT ext, size, mtime, audio_duration, audio_sample_rate, audio_channels "
-                        f"FROM file_index{suffix} WHERE path = ?",
-                        (path,),
-                    ).fetchone()
-                except sqlite3.OperationalError as exc:
-                    self._set_detail_message(
-                        "Catalog schema missing audio columns. Rebuild the catalog database."
-                    )
-                    self.app.log_ui_error(f"catalog schema mismatch: {exc}")
-                    return
-                samples = conn.execute(
-                    f"SELECT COUNT(*) FROM doc_sample_refs{suffix} WHERE doc_path = ?",
-                    (path,),
-                ).fetchone()[0]
-                devices = conn.execute(
-                    f"SELECT COUNT(*) FROM doc_device_hints{suffix} WHERE doc_path = ?",
-                    (path,),
-                ).fetchone()[0]
-                missing = conn.execute(
-                    f"SELECT COUNT(*) FROM refs_graph{suffix} WHERE src = ? AND ref_exists = 0",
-                    (path,),
-                ).fetchone()[0]
+            fields, link = self._load_detail(db_path, scope, path, values_map)
         except Exception as exc:
-            self._set_detail_message(f"Failed to load details: {exc}")
+            fields, link = [("Info", f"Failed to load details: {exc}")], ""
+        else:
+            if len(self._detail_cache) >= DETAIL_CACHE_SIZE:
+                self._detail_cache.clear()
+            self._detail_cache[key] = (fields, link)
+        self.after(0, self._apply_detail, token, fields, link)
+
+    def _apply_detail(self, token: int, fields: list[tuple[str, str]], link: str) -> None:
+        if token != self._detail_token:
             return
+        self._reset_detail_row_interactions()
+        set_detail_fields(self.detail_rows, fields, self.detail_frame)
+        if link:
+            self._apply_path_link(1, link)
+
+    def _load_detail(
+        self, db_path: Path, scope: str, path: str, values_map: dict[str, object]
+    ) -> tuple[list[tuple[str, str]], str]:
+        """Detail fields and Finder link path for one row; runs on a worker thread."""
+        suffix = "" if scope == "live_recordings" else f"_{scope}"
+        with self.app._db_pool.acquire(db_path) as conn:
+            if scope == "preferences":
+                row = conn.execute(self._SQL_PREF_DETAIL, (values_map.get("source"),)).fetchone()
+                if not row:
+                    return [("Info", "Preference not found.")], ""
+                kind, source, mtime, payload_json = row
+                payload = json_loads(payload_json) if payload_json else {}
+                value_keys = ""
+                if isinstance(payload, dict):
+                    values = payload.get("values")
+                    if isinstance(values, dict):
+                        value_keys = str(len(values))
+                fields = [
+                    ("Kind", kind),
+                    ("Source", truncate_path(source, 80)),
+                    ("Modified", format_mtime(mtime)),
+                    ("Keys", join_keys_preview(payload, 80)),
+                ]
+                if value_keys:
+                    fields.append(("Value keys", value_keys))
+                return fields, ""
+
+            audio_key = (
+                db_path,
+                self.app._db_pool.generation,
+                db_file_signature(db_path),
+                suffix,
+            )
+            audio_columns = self._audio_columns.get(audio_key)
+            if audio_columns is None:
+                names = {
+                    info[1] for info in conn.execute(f"PRAGMA table_info(file_index{suffix})")
+                }
+                audio_columns = set(FILE_AUDIO_COLUMNS) <= names
+                self._audio_columns[audio_key] = audio_columns
+            doc = conn.execute(self._SQL_DETAIL[suffix, audio_columns], (path,)).fetchone()
 
         if not doc and scope == "user_library":
             fields = [
@@ -1666,39 +2146,43 @@ class CatalogPanel(tk.Frame):
                 ("Size", values_map.get("size", "")),
                 ("Modified", values_map.get("mtime", "")),
             ]
-            set_detail_fields(self.detail_rows, fields)
-            self._apply_path_link(1, path)
-            return
+            return fields, path
 
         if not doc:
-            self._set_detail_message("Document not found in database.")
-            return
-
-        audio_duration = ""
-        audio_rate = ""
-        audio_channels = ""
-        if file_row and "audio_duration" in file_row.keys():
-            audio_duration = file_row["audio_duration"] or ""
-            audio_rate = file_row["audio_sample_rate"] or ""
-            audio_channels = file_row["audio_channels"] or ""
-
+            return [("Info", "Document not found in database.")], ""
+
+        (
+            doc_path,
+            tracks_total,
+            clips_total,
+            tempo,
+            has_file,
+            ext,
+            size,
+            mtime,
+            audio_duration,
+            audio_rate,
+            _audio_channels,
+            n_samples,
+            n_devices,
+            n_missing,
+        ) = doc
         fields = [
-            ("Name", Path(doc["path"]).stem),
+            ("Name", Path(doc_path).stem),
             ("Path", ""),
-            ("Ext", file_row["ext"] if file_row else ""),
-            ("Size", self._format_bytes(file_row["size"]) if file_row else ""),
-            ("Modified", format_mtime(file_row["mtime"]) if file_row else ""),
-            ("Tracks", str(doc["tracks_total"])),
-            ("Clips", str(doc["clips_total"])),
-            ("Devices", str(devices)),
-            ("Samples", str(samples)),
-            ("Missing", str(missing)),
-            ("Tempo", str(doc["tempo"])),
-            ("Audio dur", str(audio_duration)),
-            ("Audio rate", str(audio_rate)),
+            ("Ext", ext if has_file else ""),
+            ("Size", self._format_bytes(size) if has_file else ""),
+            ("Modified", format_mtime(mtime) if has_file else ""),
+            ("Tracks", str(tracks_total)),
+            ("Clips", str(clips_total)),
+            ("Devices", str(n_devices)),
+            ("Samples", str(n_samples)),
+            ("Missing", str(n_missing)),
+            ("Tempo", str(tempo)),
+            ("Audio dur", str(audio_duration or "")),
+            ("Audio rate", str(audio_rate or "")),
         ]
-        set_detail_fields(self.detail_rows, fields)
-        self._apply_path_link(1, doc["path"])
+        return fields, doc_path
 
 
 class ScanPanel(ttk.LabelFrame):
@@ -1730,12 +2214,13 @@ class ScanPanel(ttk.LabelFrame):
         self.targeted_refs_var = tk.BooleanVar(value=True)
         self.targeted_summary_var = tk.StringVar(value="No targeted sets selected.")
 
-        self._proc: subprocess.Popen | None = None
-        self._q: queue.Queue[str] = queue.Queue()
+        self._procs: list[subprocess.Popen] = []
+        self._q: queue.Queue[list[str]] = queue.Queue()
         self._stop_requested = False
+        self._drain_posted = False
 
         self._build_ui()
-        self._pump_queue()
+        self.bind("<<ScanLog>>", self._pump_queue)
 
     def _build_ui(self) -> None:
         header = ttk.Frame(self, style="Panel.TFrame")
@@ -2023,8 +2508,12 @@ class ScanPanel(ttk.LabelFrame):
         self.log_text.bind("<Control-v>", lambda _event: "break")
         self.log_text.bind("<Command-v>", lambda _event: "break")
 
-        self._log_file = None
+        self._log_file: io.BufferedWriter | None = None
         self._log_file_path: Optional[Path] = None
+        self._log_lock = threading.Lock()
+        self._log_unflushed = 0
+        self._log_flushed_at = 0.0
+        self._log_flush_job: str | None = None
 
         self.columnconfigure(1, weight=1)
         self.rowconfigure(3, weight=1)
@@ -2034,6 +2523,7 @@ class ScanPanel(ttk.LabelFrame):
         self._matrix_rows = 14
         self._matrix_cols = 20
         self._progress_total: Optional[int] = None
+        self._scope_progress: dict[str, float] = {}
         self.set_log_visible(True)
         self._apply_presets_focus()
 
@@ -2053,7 +2543,7 @@ class ScanPanel(ttk.LabelFrame):
             self.log_frame.grid()
             self.log_visible.set(True)
             self.log_toggle.configure(text="Hide Log")
-            if self._proc is not None:
+            if self._procs:
                 self._start_matrix()
                 self.scanner_gif.start()
         else:
@@ -2104,6 +2594,9 @@ class ScanPanel(ttk.LabelFrame):
         if not self._log_file_path or not self._log_file_path.exists():
             messagebox.showinfo("Scan Log", "No log file available yet.")
             return
+        with self._log_lock:
+            if self._log_file:
+                self._log_file.flush()
         try:
             self.app.tk.call("exec", "open", str(self._log_file_path))
         except Exception:
@@ -2166,16 +2659,82 @@ class ScanPanel(ttk.LabelFrame):
                 self._enqueue(f"Targeted sets selected ({len(selected_names)}): {preview}")
 
     def _append_log(self, line: str) -> None:
-        self._handle_progress_line(line)
+        stamped = self._stamp_lines([line])
+        self._log_to_file(stamped)
+        self._write_log(stamped)
+
+    @staticmethod
+    def _stamp_lines(lines: list[str]) -> list[str]:
+        """Prefix lines with the current time; producers call this off the Tk thread."""
         stamp = datetime.now().strftime("%H:%M:%S")
-        formatted = f"[{stamp}] {line.rstrip('\n')}"
-        self.log_text.insert("end", formatted + "\n")
+        return [f"[{stamp}] {line}".rstrip("\n") for line in lines]
+
+    def _log_to_file(self, stamped: list[str]) -> None:
+        """Encode and write a batch to the scan log; called from the producing thread."""
+        data = ("\n".join(stamped) + "\n").encode("utf-8")
+        with self._log_lock:
+            log_file = self._log_file
+            if log_file is None:
+                return
+            log_file.write(data)
+            self._log_unflushed += len(stamped)
+            now = time.monotonic()
+            if (
+                self._log_unflushed >= SCAN_LOG_FLUSH_LINES
+                or now - self._log_flushed_at >= LOG_FLUSH_MS / 1000
+            ):
+                log_file.flush()
+                self._log_unflushed = 0
+                self._log_flushed_at = now
+
+    def _open_log_file(self, log_path: Path) -> None:
+        try:
+            log_file = log_path.open("wb", buffering=SCAN_LOG_BUFFER)
+        except Exception:
+            log_file = None
+        with self._log_lock:
+            self._log_file = log_file
+            self._log_file_path = log_path if log_file else None
+        if log_file and self._log_flush_job is None:
+            self._log_flush_job = self.after(LOG_FLUSH_MS, self._flush_log_tick)
+
+    def _flush_log_tick(self) -> None:
+        """Flush lines a quiet scan left in the buffer; re-arms while the log is open."""
+        with self._log_lock:
+            log_file = self._log_file
+            if log_file is None:
+                self._log_flush_job = None
+                return
+            if self._log_unflushed:
+                log_file.flush()
+                self._log_unflushed = 0
+                self._log_flushed_at = time.monotonic()
+        self._log_flush_job = self.after(LOG_FLUSH_MS, self._flush_log_tick)
+
+    def _close_log_file(self) -> None:
+        if self._log_flush_job is not None:
+            self.after_cancel(self._log_flush_job)
+            self._log_flush_job = None
+        with self._log_lock:
+            log_file, self._log_file = self._log_file, None
+            if log_file:
+                log_file.close()
+
+    def _write_log(self, stamped: list[str]) -> None:
+        """Append stamped lines to the log widget with one insert."""
+        if not stamped:
+            return
+        for line in stamped:
+            self._handle_progress_line(line[LOG_STAMP_LEN:])
+        self.log_text.insert("end", "\n".join(stamped) + "\n")
         self.log_text.see("end")
-        if self._log_file:
-            self._log_file.write(formatted + "\n")
-            self._log_file.flush()
 
     def _handle_progress_line(self, line: str) -> None:
+        scope = None
+        match = _SCOPE_PREFIX_RE.match(line)
+        if match:
+            scope = match.group(1)
+            line = line[match.end() :]
         if not line.startswith("[progress]"):
             return
         parts = line.replace("[progress]", "").strip().split()
@@ -2207,54 +2766,119 @@ class ScanPanel(ttk.LabelFrame):
                 pct = float(percent)
             except ValueError:
                 return
+            if scope is not None:
+                # One bar for the whole run: the mean over every scope in it.
+                self._scope_progress[scope] = pct
+                pct = sum(self._scope_progress.values()) / len(self._scope_progress)
             self.progress.stop()
             self.progress.configure(mode="determinate", maximum=100)
             self.progress["value"] = pct
             self.status_var.set(f"Running... {pct:.1f}%")
 
     def _enqueue(self, s: str) -> None:
-        self._q.put(s)
+        self._post_log(self._stamp_lines([s]))
 
-    def _pump_queue(self) -> None:
+    def _post_log(self, stamped: list[str]) -> None:
+        """Log stamped lines to file, queue them and wake the Tk loop once until the next drain."""
+        self._log_to_file(stamped)
+        self._q.put(stamped)
+        if self._drain_posted:
+            return
+        self._drain_posted = True
+        # TclError: the window is being destroyed.
+        with contextlib.suppress(tk.TclError):
+            self.event_generate("<<ScanLog>>", when="tail")
+
+    def _pump_queue(self, _event: object = None) -> None:
+        # Clear first: lines queued after this point post a fresh event.
+        self._drain_posted = False
+        pending: list[str] = []
         try:
             while True:
-                s = self._q.get_nowait()
-                self._append_log(s)
+                pending.extend(self._q.get_nowait())
         except queue.Empty:
             pass
-        self.after(100, self._pump_queue)
+        self._write_log(pending)
+
+    def _stream_output(self, proc: subprocess.Popen, prefix: str = "") -> None:
+        """Forward proc's stdout to the log queue one pipe read (many lines) at a time."""
+        assert proc.stdout is not None
+        fd = proc.stdout.fileno()
+        pending = b""
+        while not self._stop_requested:
+            chunk = os.read(fd, PIPE_READ_BYTES)
+            if not chunk:
+                break
+            *complete, pending = (pending + chunk).split(b"\n")
+            if complete:
+                self._post_log(
+                    self._stamp_lines(
+                        [
+                            prefix + line.decode("utf-8", "replace").rstrip("\r")
+                            for line in complete
+                        ]
+                    )
+                )
+        if pending and not self._stop_requested:
+            self._enqueue(prefix + pending.decode("utf-8", "replace").rstrip("\r"))
+
+    def _run_scan_cmd(self, cmd: list[str], cwd: Path, prefix: str = "") -> int:
+        self._enqueue(f"{prefix}$ {' '.join(cmd)}")
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(cwd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+        )
+        self._procs.append(proc)
+        self._stream_output(proc, prefix)
+        try:
+            return proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            return proc.wait(timeout=5)
+
+    def _run_scans_parallel(self, cmds: list[list[str]], cwd: Path) -> int:
+        """Run one scanner per scope at once; each scope writes its own output files."""
+        results: list[int] = [0] * len(cmds)
+        scopes = [cmd[cmd.index("--scope") + 1] for cmd in cmds]
+        self._scope_progress = dict.fromkeys(scopes, 0.0)
+
+        def _run(idx: int, cmd: list[str]) -> None:
+            scope = scopes[idx]
+            try:
+                results[idx] = self._run_scan_cmd(cmd, cwd, f"[{scope}] ")
+            except Exception as exc:
+                self._enqueue(f"[{scope}] ERROR: {exc}")
+                results[idx] = 1
+
+        self._enqueue("-----")
+        threads = [
+            threading.Thread(target=_run, args=(idx, cmd), daemon=True)
+            for idx, cmd in enumerate(cmds)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return next((rc for rc in results if rc != 0), 0)
 
-    def _scan_thread(self, cmds: list[list[str]], cwd: Path) -> None:
+    def _scan_thread(self, cmds: list[list[str]], cwd: Path, parallel: bool = False) -> None:
         try:
+            # Warm the script worker while the scan runs; _build_db uses it next.
+            self.app._worker.start()
             rc = 0
-            for cmd in cmds:
-                if self._stop_requested:
-                    break
-                self._enqueue("-----")
-                self._enqueue(f"$ {' '.join(cmd)}")
-                self._proc = subprocess.Popen(
-                    cmd,
-                    cwd=str(cwd),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                )
-
-                assert self._proc.stdout is not None
-                for line in self._proc.stdout:
-                    self._enqueue(line.rstrip("\n"))
+            if parallel and len(cmds) > 1:
+                rc = self._run_scans_parallel(cmds, cwd)
+            else:
+                for cmd in cmds:
                     if self._stop_requested:
                         break
-
-                try:
-                    rc = self._proc.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self._proc.kill()
-                    rc = self._proc.wait(timeout=5)
-                if rc != 0:
-                    break
+                    self._enqueue("-----")
+                    rc = self._run_scan_cmd(cmd, cwd)
+                    if rc != 0:
+                        break
 
             if self._stop_requested:
                 self._enqueue("Scan cancelled.")
@@ -2266,7 +2890,7 @@ class ScanPanel(ttk.LabelFrame):
                 self.status_var.set("Done")
                 self.app.set_active_root(Path(self.root_var.get()))
                 self.app.set_current_scope(self.scope_var.get())
-                self.app.refresh_dashboard()
+                self.app.after(0, self.app.request_refresh, "dashboard")
             else:
                 self._enqueue(f"Scan failed (exit={rc})")
                 self.status_var.set("Error")
@@ -2275,29 +2899,23 @@ class ScanPanel(ttk.LabelFrame):
             self._enqueue(f"ERROR: {e}")
             self.status_var.set("Error")
         finally:
-            self._proc = None
+            self._procs = []
             self._stop_requested = False
             self._set_running(False)
 
     def _build_db(self) -> None:
-        if not self.app._db_refresh_lock.acquire(blocking=False):
+        if not self.app._begin_db_update():
             self._enqueue("DB update already running; skipping.")
             return
         catalog_dir = self.app.catalog_dir()
         db_script = self.app.abletools_dir / "abletools_catalog_db.py"
         if not db_script.exists():
             self._enqueue("WARN: abletools_catalog_db.py missing; DB not updated.")
-            self.app._db_refresh_lock.release()
+            self.app._end_db_update()
             return
         self._enqueue(f"DB update: {db_script}")
-        cmd = [sys.executable, str(db_script), str(catalog_dir), "--append"]
         try:
-            proc = subprocess.run(
-                cmd,
-                cwd=str(self.app.abletools_dir),
-                capture_output=True,
-                text=True,
-            )
+            proc = self.app._worker.run(db_script, [str(catalog_dir), "--append"])
             if proc.stdout:
                 self._enqueue(proc.stdout.strip())
             if proc.returncode != 0:
@@ -2307,11 +2925,8 @@ class ScanPanel(ttk.LabelFrame):
             validator = self.app.abletools_dir / "abletools_schema_validate.py"
             if validator.exists():
                 try:
-                    proc = subprocess.run(
-                        [sys.executable, str(validator), str(catalog_dir), "--incremental"],
-                        cwd=str(self.app.abletools_dir),
-                        capture_output=True,
-                        text=True,
+                    proc = self.app._worker.run(
+                        validator, [str(catalog_dir), "--incremental"]
                     )
                     if proc.stdout:
                         self._enqueue(proc.stdout.strip())
@@ -2324,12 +2939,7 @@ class ScanPanel(ttk.LabelFrame):
             db_path = self.app.resolve_catalog_db_path()
             if analytics.exists() and db_path:
                 try:
-                    proc = subprocess.run(
-                        [sys.executable, str(analytics), str(db_path)],
-                        cwd=str(self.app.abletools_dir),
-                        capture_output=True,
-                        text=True,
-                    )
+                    proc = self.app._worker.run(analytics, [str(db_path)])
                     if proc.returncode != 0:
                         self._enqueue(proc.stderr.strip() or "Analytics update failed.")
                 except Exception as exc:
@@ -2337,7 +2947,7 @@ class ScanPanel(ttk.LabelFrame):
         except Exception as exc:
             self._enqueue(f"DB update failed: {exc}")
         finally:
-            self.app._db_refresh_lock.release()
+            self.app._end_db_update()
 
     def _set_running(self, running: bool) -> None:
         def _apply() -> None:
@@ -2355,14 +2965,12 @@ class ScanPanel(ttk.LabelFrame):
                 self.gif.stop()
                 self._stop_matrix()
                 self.scanner_gif.stop()
-                if self._log_file:
-                    self._log_file.close()
-                    self._log_file = None
+                self._close_log_file()
 
         self.after(0, _apply)
 
     def start_scan(self) -> None:
-        if self._proc is not None:
+        if self._procs:
             return
 
         root = Path(self.root_var.get()).expanduser()
@@ -2417,27 +3025,24 @@ class ScanPanel(ttk.LabelFrame):
         self._set_running(True)
         self.progress.configure(mode="indeterminate")
         self._progress_total = None
+        self._scope_progress = {}
 
         if self.log_visible.get():
             self.log_text.delete("1.0", "end")
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_path = self.app.catalog_dir() / f"scan_log_{timestamp}.txt"
-        try:
-            self._log_file = log_path.open("w", encoding="utf-8")
-            self._log_file_path = log_path
-        except Exception:
-            self._log_file = None
-            self._log_file_path = None
+        self._open_log_file(log_path)
         self._enqueue(f"Logging to: {log_path}")
 
+        # Scopes write separate output files, so an "all" scan runs them side by side.
         t = threading.Thread(
-            target=self._scan_thread, args=(cmds, self.app.abletools_dir), daemon=True
+            target=self._scan_thread, args=(cmds, self.app.abletools_dir, True), daemon=True
         )
         t.start()
 
     def start_targeted_scan(self) -> None:
-        if self._proc is not None:
+        if self._procs:
             return
         if not self.targeted_paths:
             messagebox.showinfo("Targeted Scan", "No sets selected yet.")
@@ -2489,17 +3094,13 @@ class ScanPanel(ttk.LabelFrame):
         self._set_running(True)
         self.progress.configure(mode="indeterminate")
         self._progress_total = None
+        self._scope_progress = {}
         if self.log_visible.get():
             self.log_text.delete("1.0", "end")
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_path = self.app.catalog_dir() / f"scan_log_targeted_{timestamp}.txt"
-        try:
-            self._log_file = log_path.open("w", encoding="utf-8")
-            self._log_file_path = log_path
-        except Exception:
-            self._log_file = None
-            self._log_file_path = None
+        self._open_log_file(log_path)
         self._enqueue(f"Logging to: {log_path}")
 
         t = threading.Thread(
@@ -2508,13 +3109,14 @@ class ScanPanel(ttk.LabelFrame):
         t.start()
 
     def cancel_scan(self) -> None:
-        if self._proc is None:
+        if not self._procs:
             return
         self._stop_requested = True
-        try:
-            self._proc.terminate()
-        except Exception:
-            pass
+        for proc in list(self._procs):
+            try:
+                proc.terminate()
+            except Exception:
+                pass
 
 
 class ScanView(tk.Frame):
@@ -2769,33 +3371,34 @@ class RamifyPanel(tk.Frame):
         def worker() -> None:
             try:
                 total_files = total_audio = total_flips = failed = 0
+                paths: list[Path] = []
                 for target in targets:
                     if target.is_dir():
-                        iterator = iter_targets(target, recursive)
+                        paths.extend(iter_targets(target, recursive))
+                    else:
+                        paths.append(target)
+                for f, result in process_files(paths, inplace, dry):
+                    total_files += 1
+                    if isinstance(result, Exception):
+                        failed += 1
+                        self.after(0, self._log, f"[FAIL] {f} | {result}")
+                        continue
+                    audio_seen, flips, wrote = result
+                    total_audio += audio_seen
+                    total_flips += flips
+                    action = "DRY" if dry else ("INPLACE" if inplace else "OUT")
+                    if wrote:
+                        self.after(
+                            0,
+                            self._log,
+                            f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips} | wrote={wrote}",
+                        )
                     else:
-                        iterator = [target]
-                    for f in iterator:
-                        total_files += 1
-                        try:
-                            audio_seen, flips, wrote = process_file(f, inplace, dry)
-                            total_audio += audio_seen
-                            total_flips += flips
-                            action = "DRY" if dry else ("INPLACE" if inplace else "OUT")
-                            if wrote:
-                                self.after(
-                                    0,
-                                    self._log,
-                                    f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips} | wrote={wrote}",
-                                )
-                            else:
-                                self.after(
-                                    0,
-                                    self._log,
-                                    f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips}",
-                                )
-                        except Exception as e:
-                            failed += 1
-                            self.after(0, self._log, f"[FAIL] {f} | {e}")
+                        self.after(
+                            0,
+                            self._log,
+                            f"[{action}] {f} | AudioClips={audio_seen} | RamFlips={flips}",
+                        )
 
                 self.after(0, self._log, "")
                 self.after(
@@ -3054,6 +3657,45 @@ class InsightsPanel(tk.Frame):
         widget.bind("<Button-5>", _on_mousewheel)
 
 
+PREFS_PAYLOAD_PREFETCH = 8
+PREFS_PAYLOAD_CACHE_SIZE = 100
+PATH_EXISTS_TTL = 2.0
+PATH_EXISTS_CACHE_SIZE = 1024
+PREFS_RAW_LIMIT = 20000
+# Well-known Ableton path settings, listed first in the prefs summary.
+PREFS_KEY_FIELDS = (
+    "UserLibraryPath",
+    "LibraryPath",
+    "ProjectPath",
+    "LastProjectPath",
+    "PacksFolder",
+    "VstPlugInCustomFolder",
+    "Vst3PlugInCustomFolder",
+    "AuPlugInCustomFolder",
+)
+PREFS_PAYLOAD_CHUNK = 4096
+# Payloads ride along for the newest rows so the auto-selected entry needs no second query.
+PREFS_LIST_SQL = (
+    "SELECT kind, source, mtime, "
+    "CASE WHEN ROW_NUMBER() OVER (ORDER BY mtime DESC) <= :prefetch "
+    "THEN payload_json END "
+    "FROM ableton_prefs ORDER BY mtime DESC"
+)
+PREFS_PAYLOAD_SQL = (
+    "SELECT payload_json FROM ableton_prefs WHERE kind = :kind AND source = :source"
+)
+# Path-shaped strings under *Path*/*Folder* value keys, in document order.
+PREFS_PATH_HINTS_SQL = (
+    "SELECT v.value FROM ableton_prefs p, "
+    "json_each(p.payload_json, '$.values') k, json_each(k.value) v "
+    "WHERE p.kind = :kind AND p.source = :source "
+    "AND (k.key GLOB '*Path*' OR k.key GLOB '*Folder*') "
+    "AND v.type = 'text' "
+    "AND (substr(v.value, 1, 1) IN ('/', '~') OR substr(v.value, 2, 2) = ':\\') "
+    "LIMIT 50"
+)
+
+
 class PreferencesPanel(tk.Frame):
     def __init__(self, master: tk.Misc, app: "AbletoolsUI") -> None:
         super().__init__(master, bg=BG)
@@ -3061,6 +3703,11 @@ class PreferencesPanel(tk.Frame):
         self.show_raw_var = tk.BooleanVar(value=False)
         self.source_var = tk.StringVar(value="")
         self.source_items: list[tuple[str, str, int]] = []
+        self._payload_cache: dict[tuple[str, str], str] = {}
+        self._summary_cache: dict[tuple[str, str], tuple[list[tuple[str, str]], str]] = {}
+        self._payload_token = 0
+        self._listing_version: tuple | None = None
+        self._path_exists_cache: dict[str, tuple[bool, float]] = {}
         self._build()
 
     def _build(self) -> None:
@@ -3124,30 +3771,6 @@ class PreferencesPanel(tk.Frame):
         self.detail_frame = tk.Frame(right, bg=PANEL)
         self.detail_frame.grid(row=1, column=0, sticky="we", padx=12, pady=(0, 8))
         self.detail_rows: list[tuple[tk.Label, tk.Label]] = []
-        for _ in range(10):
-            label = tk.Label(
-                self.detail_frame,
-                text="",
-                font=BODY_FONT,
-                fg=MUTED,
-                bg=PANEL,
-                anchor="e",
-                width=12,
-            )
-            value = tk.Label(
-                self.detail_frame,
-                text="",
-                font=BODY_FONT,
-                fg=TEXT,
-                bg=PANEL,
-                anchor="w",
-                justify="left",
-                wraplength=260,
-            )
-            row = len(self.detail_rows)
-            label.grid(row=row, column=0, sticky="e", padx=(0, 6), pady=2)
-            value.grid(row=row, column=1, sticky="w", pady=2)
-            self.detail_rows.append((label, value))
 
         tk.Label(right, text="Parsed JSON", font=H2_FONT, fg=TEXT, bg=PANEL).grid(
             row=2, column=0, sticky="w", padx=12, pady=(6, 6)
@@ -3164,80 +3787,134 @@ class PreferencesPanel(tk.Frame):
         self.payload.grid(row=3, column=0, sticky="nsew", padx=12, pady=(0, 12))
         self.payload.configure(state="disabled")
 
-    def refresh(self) -> None:
+    def _clear_sources(self) -> None:
         self.sources_combo["values"] = []
         self.source_items = []
-        self._set_payload("No preferences loaded.")
+        self._listing_version = None
+        set_detail_fields(self.detail_rows, [], self.detail_frame, max_rows=10)
+
+    def refresh(self) -> None:
         self._set_status("")
-        set_detail_fields(self.detail_rows, [])
         db_path = self.app.resolve_prefs_db_path()
         if not db_path or not db_path.exists():
+            self._clear_sources()
             self._set_payload("Database not found. Run a scan or prefs refresh.")
             return
+        # Revisiting the tab with no DB write in between keeps what is already shown.
+        version = (self.app._db_pool.generation, db_file_signature(db_path))
+        if version == self._listing_version:
+            return
+        rows: list[tuple[str, str, int, str | None]] = []
         try:
-            with sqlite3.connect(db_path) as conn:
-                for row in conn.execute(
-                    "SELECT kind, source, mtime FROM ableton_prefs ORDER BY mtime DESC"
-                ):
-                    self.source_items.append((row[0], row[1], row[2]))
+            with self.app._db_pool.acquire(db_path) as conn:
+                rows.extend(
+                    conn.execute(PREFS_LIST_SQL, {"prefetch": PREFS_PAYLOAD_PREFETCH})
+                )
         except sqlite3.OperationalError as exc:
+            self._clear_sources()
             self._set_payload(f"Preferences table missing: {exc}")
             self._set_status(str(exc))
             self.app.log_ui_error(f"prefs refresh: {exc}")
             return
         except Exception as exc:
+            self._clear_sources()
             self._set_payload(f"Failed to load preferences: {exc}")
             self._set_status(str(exc))
             self.app.log_ui_error(f"prefs refresh: {exc}")
             return
 
-        display = [self._format_source_entry(*row) for row in self.source_items]
-        self.sources_combo["values"] = display
-        if display:
-            self.sources_combo.current(0)
-            self._on_select(None)
-
-    def _set_payload(self, text: str) -> None:
+        items = [(kind, source, mtime) for kind, source, mtime, _payload in rows]
+        # Only touch the combobox when the listing differs from what it shows.
+        changed = items != self.source_items
+        if changed:
+            self._payload_cache.clear()
+            self._summary_cache.clear()
+        for kind, source, _mtime, payload_json in rows:
+            if payload_json is not None:
+                self._cache_payload(kind, source, payload_json)
+        if changed:
+            idx = self.sources_combo.current()
+            selected = (
+                self.source_items[idx][:2] if 0 <= idx < len(self.source_items) else None
+            )
+            self.source_items = items
+            self.sources_combo["values"] = [
+                self._format_source_entry(*row) for row in items
+            ]
+            if items:
+                keys = [item[:2] for item in items]
+                self.sources_combo.current(
+                    keys.index(selected) if selected in keys else 0
+                )
+        self._listing_version = version
+        if not self.source_items:
+            set_detail_fields(self.detail_rows, [], self.detail_frame, max_rows=10)
+            self._set_payload("No preferences loaded.")
+            return
+        self._on_select(None)
+
+    def _set_payload(self, text: str, limit: int | None = None) -> None:
+        """Show text, inserting long payloads a chunk per idle turn up to limit chars."""
+        self._payload_token += 1
+        end = len(text) if limit is None else min(len(text), limit)
+        tail = ""
+        if end < len(text):
+            tail = "\n\n... (truncated, enable export if you need full payload)"
         self.payload.configure(state="normal")
         self.payload.delete("1.0", "end")
-        self.payload.insert("end", text)
         self.payload.configure(state="disabled")
+        self._append_payload(text, 0, end, tail, self._payload_token)
+
+    def _append_payload(
+        self, text: str, start: int, end: int, tail: str, token: int
+    ) -> None:
+        if token != self._payload_token:
+            return
+        stop = min(start + PREFS_PAYLOAD_CHUNK, end)
+        self.payload.configure(state="normal")
+        self.payload.insert("end", text[start:stop])
+        if stop >= end and tail:
+            self.payload.insert("end", tail)
+        self.payload.configure(state="disabled")
+        if stop < end:
+            self.after(0, self._append_payload, text, stop, end, tail, token)
 
     def _set_status(self, text: str) -> None:
         self.status_var.set(text)
 
+    def _cache_payload(self, kind: str, source: str, payload_text: str) -> None:
+        if len(self._payload_cache) >= PREFS_PAYLOAD_CACHE_SIZE:
+            self._payload_cache.clear()
+        self._payload_cache[(kind, source)] = payload_text
+
     def _on_select(self, _event: object) -> None:
         idx = self.sources_combo.current()
         if idx < 0 or idx >= len(self.source_items):
             return
         kind, source, mtime = self.source_items[idx]
-        db_path = self.app.resolve_prefs_db_path()
-        if not db_path or not db_path.exists():
-            self._set_payload("Database not found.")
-            return
-        try:
-            with sqlite3.connect(db_path) as conn:
-                row = conn.execute(
-                    "SELECT payload_json FROM ableton_prefs WHERE kind = ? AND source = ?",
-                    (kind, source),
-                ).fetchone()
-        except Exception as exc:
-            self._set_payload(f"Failed to load payload: {exc}")
-            self._set_status(str(exc))
-            self.app.log_ui_error(f"prefs select: {exc}")
-            return
-        if not row:
-            self._set_payload("No payload found.")
-            return
-        payload_text = row[0]
+        payload_text = self._payload_cache.get((kind, source))
+        if payload_text is None:
+            db_path = self.app.resolve_prefs_db_path()
+            if not db_path or not db_path.exists():
+                self._set_payload("Database not found.")
+                return
+            try:
+                with self.app._db_pool.acquire(db_path) as conn:
+                    row = conn.execute(
+                        PREFS_PAYLOAD_SQL, {"kind": kind, "source": source}
+                    ).fetchone()
+            except Exception as exc:
+                self._set_payload(f"Failed to load payload: {exc}")
+                self._set_status(str(exc))
+                self.app.log_ui_error(f"prefs select: {exc}")
+                return
+            if not row:
+                self._set_payload("No payload found.")
+                return
+            payload_text = row[0]
+            self._cache_payload(kind, source, payload_text)
         if self.show_raw_var.get():
-            limit = 20000
-            if len(payload_text) > limit:
-                payload_text = (
-                    payload_text[:limit]
-                    + "\n\n... (truncated, enable export if you need full payload)"
-                )
-            self._set_payload(payload_text)
+            self._set_payload(payload_text, limit=PREFS_RAW_LIMIT)
             set_detail_fields(
                 self.detail_rows,
                 [
@@ -3245,30 +3922,46 @@ class PreferencesPanel(tk.Frame):
                     ("Source", truncate_path(source, 80)),
                     ("Modified", format_mtime(mtime)),
                 ],
+                self.detail_frame,
+                max_rows=10,
             )
             return
-        try:
-            payload = json.loads(payload_text)
-        except Exception as exc:
-            self._set_payload(f"Failed to parse JSON: {exc}")
-            self._set_status(str(exc))
-            self.app.log_ui_error(f"prefs parse: {exc}")
-            return
+        cached = self._summary_cache.get((kind, source))
+        if cached is None:
+            try:
+                payload = json_loads(payload_text)
+            except Exception as exc:
+                self._set_payload(f"Failed to parse JSON: {exc}")
+                self._set_status(str(exc))
+                self.app.log_ui_error(f"prefs parse: {exc}")
+                return
+            # Keep the small summary, not the parsed tree, so reselecting skips the parse.
+            cached = (
+                self._extract_pref_fields(kind, source, mtime, payload),
+                self._summarize_payload(
+                    kind,
+                    source,
+                    payload,
+                    self._path_hint_candidates(kind, source)
+                    if isinstance(payload, dict)
+                    else None,
+                ),
+            )
+            if len(self._summary_cache) >= PREFS_PAYLOAD_CACHE_SIZE:
+                self._summary_cache.clear()
+            self._summary_cache[(kind, source)] = cached
 
-        fields = self._extract_pref_fields(kind, source, mtime, payload)
-        set_detail_fields(self.detail_rows, fields)
-        summary = self._summarize_payload(kind, source, payload)
+        fields, summary = cached
+        set_detail_fields(self.detail_rows, fields, self.detail_frame, max_rows=10)
         self._set_payload(summary)
 
     def _extract_pref_fields(
         self, kind: str, source: str, mtime: int, payload: dict
     ) -> list[tuple[str, str]]:
-        keys = []
         value_keys = ""
         lines_count = ""
         options_count = ""
         if isinstance(payload, dict):
-            keys = sorted(payload.keys())
             if "values" in payload and isinstance(payload["values"], dict):
                 value_keys = str(len(payload["values"]))
             if "lines" in payload and isinstance(payload["lines"], list):
@@ -3279,7 +3972,7 @@ class PreferencesPanel(tk.Frame):
             ("Kind", kind),
             ("Source", truncate_path(source, 80)),
             ("Modified", format_mtime(mtime)),
-            ("Keys", ", ".join(keys)[:120]),
+            ("Keys", join_keys_preview(payload, 120)),
         ]
         if value_keys:
             fields.append(("Value keys", value_keys))
@@ -3292,57 +3985,114 @@ class PreferencesPanel(tk.Frame):
     def _format_source_entry(self, kind: str, source: str, _mtime: int) -> str:
         return f"{kind} | {source}"
 
-    def _summarize_payload(self, kind: str, source: str, payload: dict) -> str:
+    def _path_hint_candidates(self, kind: str, source: str) -> list[str] | None:
+        """Let SQLite pick out path-shaped values; None falls back to the Python scan."""
+        db_path = self.app.resolve_prefs_db_path()
+        if not db_path or not db_path.exists():
+            return None
+        try:
+            with self.app._db_pool.acquire(db_path) as conn:
+                rows = conn.execute(
+                    PREFS_PATH_HINTS_SQL, {"kind": kind, "source": source}
+                ).fetchall()
+        except sqlite3.Error:
+            return None
+        return [row[0] for row in rows]
+
+    def _summarize_payload(
+        self,
+        kind: str,
+        source: str,
+        payload: dict,
+        hint_candidates: Iterable[object] | None = None,
+    ) -> str:
+        if not isinstance(payload, dict):
+            return f"Kind: {kind}\nSource: {source}\nPayload: {type(payload).__name__}"
         lines = [f"Kind: {kind}", f"Source: {source}"]
-        if isinstance(payload, dict):
-            lines.append(f"Keys: {', '.join(sorted(payload.keys()))}")
-            if "lines" in payload and isinstance(payload["lines"], list):
-                lines.append(f"Lines: {len(payload['lines'])}")
-            if "options" in payload and isinstance(payload["options"], list):
-                lines.append(f"Options: {len(payload['options'])}")
-            if "values" in payload and isinstance(payload["values"], dict):
-                values = payload["values"]
-                lines.append(f"Value keys: {len(values)}")
-
-                key_fields = [
-                    "UserLibraryPath",
-                    "LibraryPath",
-                    "ProjectPath",
-                    "LastProjectPath",
-                    "PacksFolder",
-                    "VstPlugInCustomFolder",
-                    "Vst3PlugInCustomFolder",
-                    "AuPlugInCustomFolder",
-                ]
-                for key in key_fields:
-                    if key in values and values[key]:
-                        first_val = values[key][0]
-                        if self._looks_like_path(first_val):
-                            lines.append(f"{key}: {first_val}")
-
-                hints = []
-                for key in values:
-                    if "Folder" in key or "Path" in key:
-                        for val in values.get(key, []):
-                            if self._looks_like_path(val):
-                                hints.append(val)
+        keys = _leading_keys(payload)[:PAYLOAD_SUMMARY_KEYS]
+        more = len(payload) - len(keys)
+        lines.append(
+            f"Keys: {', '.join(keys)} …(+{more})" if more else f"Keys: {', '.join(keys)}"
+        )
+        if "lines" in payload and isinstance(payload["lines"], list):
+            lines.append(f"Lines: {len(payload['lines'])}")
+        if "options" in payload and isinstance(payload["options"], list):
+            lines.append(f"Options: {len(payload['options'])}")
+        if "values" in payload and isinstance(payload["values"], dict):
+            values = payload["values"]
+            lines.append(f"Value keys: {len(values)}")
+
+            seen: set[str] = set()
+            for key in PREFS_KEY_FIELDS:
+                if key in values and values[key]:
+                    first_val = values[key][0]
+                    if self._looks_like_path(first_val):
+                        lines.append(f"{key}: {first_val}")
+                        seen.add(first_val)
+
+            if hint_candidates is None:
+                hint_candidates = self._iter_path_candidates(values)
+            hints = []
+            # One pass; values already listed above or repeated across keys are skipped.
+            for val in hint_candidates:
+                if not isinstance(val, str) or val in seen:
+                    continue
+                seen.add(val)
+                if self._looks_like_path(val):
+                    hints.append(val)
                     if len(hints) >= 5:
                         break
-                if hints:
-                    lines.append("Example paths:")
-                    lines.extend(f" - {item}" for item in hints[:5])
+            if hints:
+                lines.append("Example paths:")
+                lines.extend(f" - {item}" for item in hints[:5])
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _iter_path_candidates(values: dict) -> Iterator[object]:
+        for key, vals in values.items():
+            if "Folder" in key or "Path" in key:
+                yield from vals
+
+    # POSIX or home-relative paths; Windows drive paths are checked separately.
+    _PATH_PREFIXES = ("/", "~")
+    _CTRL_CHAR_RE = re.compile(r"[\x00-\x1f]")
+
     def _looks_like_path(self, value: object) -> bool:
-        if not isinstance(value, str):
+        if not isinstance(value, str) or not value:
             return False
-        if not value or any(ord(ch) < 32 for ch in value):
+        if not value.startswith(self._PATH_PREFIXES) and value[1:3] != ":\\":
             return False
-        if not (value.startswith("/") or value.startswith("~") or value[1:3] == ":\\"):
+        if self._CTRL_CHAR_RE.search(value):
             return False
-        path = Path(value).expanduser()
-        return path.exists()
+        now = time.monotonic()
+        cached = self._path_exists_cache.get(value)
+        if cached is not None and now - cached[1] < PATH_EXISTS_TTL:
+            return cached[0]
+        exists = os.path.exists(os.path.expanduser(value))
+        if len(self._path_exists_cache) >= PATH_EXISTS_CACHE_SIZE:
+            self._path_exists_cache.clear()
+        self._path_exists_cache[value] = (exists, now)
+        return exists
+
+MISSING_REFS_AUDIT_LIMIT = 500
+ZERO_TRACKS_AUDIT_LIMIT = 50
+
+# Limited per scope, so one large scope cannot crowd the other out of the audit.
+ZERO_TRACKS_SQL = " UNION ALL ".join(
+    f"""
+    SELECT * FROM (
+        SELECT
+            d.scope, d.path, d.tracks_total, d.clips_total, d.error,
+            (SELECT f.size FROM v_file_index_all f WHERE f.scope = d.scope AND f.path = d.path)
+        FROM v_ableton_docs_all d
+        WHERE d.tracks_total = 0 AND d.scope = '{scope}'
+        LIMIT {ZERO_TRACKS_AUDIT_LIMIT}
+    )
+    """
+    for scope in ("live_recordings", "user_library")
+)
+
 
 class AbletoolsUI(tk.Tk):
     def __init__(self) -> None:
@@ -3353,148 +4103,51 @@ class AbletoolsUI(tk.Tk):
 
         self.abletools_dir = ABLETOOLS_DIR
         self.active_root: Optional[Path] = None
+        # Built once; these are asked for on every refresh and selection.
+        self._catalog_db_path = self.catalog_dir() / "abletools_catalog.sqlite"
+        self._root_db_path: Path | None = None
         self.current_scope = "live_recordings"
         self.log_path: Optional[Path] = None
         self.logger = self._setup_logging()
+        self._worker = ScriptWorker(self.abletools_dir)
         self._db_refresh_lock = threading.Lock()
+        self._db_waiters_lock = threading.Lock()
+        self._db_waiters: list[Callable[[], None]] = []
+        self._jobs_lock = threading.Lock()
+        self._active_jobs: list[str] = []
+        self._db_pool = SQLiteConnectionPool()
+        self._known_sets_cache: dict[
+            str, tuple[tuple[int, ...], list[dict[str, str]]]
+        ] = {}
+        self._wal_checked: set[Path] = set()
+        self._pending_refresh: set[str] = set()
+        self._db_path_cache: tuple[Path | None, float] = (None, float("-inf"))
+        self._fts_cache: dict[Path, bool] = {}
+        self._db_result_cache: dict[tuple, tuple[tuple, object]] = {}
         self.targeted_detail_groups = {"struct", "clips", "devices", "routing", "refs"}
 
         self._nav_buttons: dict[str, tk.Button] = {}
         self._views: dict[str, tk.Frame] = {}
+        self._view_factories: dict[str, Callable[[], tk.Frame]] = {}
+        self._active_view: str | None = None
         self._icon_img: Optional[tk.PhotoImage] = None
 
         self._style()
         self._build()
         self._set_app_icon()
-        self._refresh_prefs_cache()
         self._init_active_root()
-        self._scan_app_log()
+        # Both do file/subprocess I/O; keep them off the path to the first frame.
+        self.after(100, self._start_prefs_refresh_async)
+        threading.Thread(target=self._scan_app_log, daemon=True).start()
 
     def _style(self) -> None:
         style = ttk.Style(self)
         try:
-            style.theme_use("clam")
-        except Exception:
+            if THEME_NAME not in style.theme_names():
+                style.theme_create(THEME_NAME, parent="clam", settings=THEME_SETTINGS)
+            style.theme_use(THEME_NAME)
+        except tk.TclError:
             pass
-        style.configure("TLabel", background=BG, foreground=TEXT)
-        style.configure("TFrame", background=BG)
-        style.configure("TLabelFrame", background=PANEL, foreground=TEXT, borderwidth=1)
-        style.configure("TLabelFrame.Label", background=PANEL, foreground=TEXT)
-        style.configure(
-            "TButton",
-            font=BODY_FONT,
-            foreground=TEXT,
-            background=PANEL_ALT,
-            borderwidth=1,
-            focusthickness=1,
-            focuscolor=ACCENT_SOFT,
-        )
-        style.map(
-            "TButton",
-            background=[("active", "#1b2736")],
-            foreground=[("active", TEXT)],
-        )
-        style.configure(
-            "Accent.TButton",
-            foreground="#001014",
-            background=ACCENT,
-            borderwidth=1,
-            focusthickness=1,
-            focuscolor=ACCENT_2,
-            padding=(10, 6),
-        )
-        style.map(
-            "Accent.TButton",
-            background=[("active", ACCENT_2)],
-            foreground=[("active", "#001014")],
-        )
-        style.configure(
-            "Ghost.TButton",
-            foreground=TEXT,
-            background=BG_NAV,
-            borderwidth=1,
-            focusthickness=1,
-            focuscolor=ACCENT_SOFT,
-            padding=(10, 6),
-        )
-        style.map(
-            "Ghost.TButton",
-            background=[("active", "#0f1a26")],
-            foreground=[("active", TEXT)],
-        )
-        style.configure(
-            "Nav.TButton",
-            foreground=MUTED,
-            background=BG_NAV,
-            borderwidth=1,
-            focusthickness=1,
-            focuscolor=ACCENT_SOFT,
-            padding=(6, 10),
-        )
-        style.map(
-            "Nav.TButton",
-            background=[("active", "#0f1a26")],
-            foreground=[("active", TEXT)],
-        )
-        style.configure(
-            "NavActive.TButton",
-            foreground="#001014",
-            background=ACCENT_2,
-            borderwidth=1,
-            focusthickness=1,
-            focuscolor=ACCENT,
-            padding=(6, 10),
-        )
-        style.map(
-            "NavActive.TButton",
-            background=[("active", ACCENT)],
-            foreground=[("active", "#001014")],
-        )
-        style.configure("TCheckbutton", background=PANEL, foreground=TEXT)
-        style.map(
-            "TCheckbutton",
-            foreground=[("active", TEXT)],
-            background=[("active", PANEL)],
-        )
-        style.configure("Panel.TFrame", background=PANEL)
-        style.configure("Panel.TLabel", background=PANEL, foreground=TEXT)
-        style.configure(
-            "Panel.TLabelframe",
-            background=PANEL,
-            foreground=TEXT,
-            borderwidth=1,
-        )
-        style.configure("Panel.TLabelframe.Label", background=PANEL, foreground=TEXT)
-        style.configure(
-            "Panel.TEntry",
-            fieldbackground=PANEL_ALT,
-            foreground=TEXT,
-            background=PANEL_ALT,
-            insertcolor=TEXT,
-        )
-        style.configure(
-            "Panel.TCombobox",
-            fieldbackground=PANEL_ALT,
-            foreground=TEXT,
-            background=PANEL_ALT,
-        )
-        style.map(
-            "Panel.TCombobox",
-            fieldbackground=[("readonly", PANEL_ALT)],
-            background=[("readonly", PANEL_ALT)],
-            foreground=[("readonly", TEXT)],
-        )
-        style.configure("Panel.TCheckbutton", background=PANEL, foreground=TEXT)
-        style.map(
-            "Panel.TCheckbutton",
-            foreground=[("active", TEXT)],
-            background=[("active", PANEL)],
-        )
-        style.configure(
-            "Panel.Horizontal.TProgressbar",
-            troughcolor=PANEL_ALT,
-            background=ACCENT,
-        )
 
     def _build(self) -> None:
         self.grid_rowconfigure(0, weight=1)
@@ -3517,16 +4170,16 @@ class AbletoolsUI(tk.Tk):
         content.grid_rowconfigure(0, weight=1)
         content.grid_columnconfigure(0, weight=1)
 
-        self._views["dashboard"] = DashboardPanel(content, self)
-        self._views["scan"] = ScanView(content, self)
-        self._views["catalog"] = CatalogPanel(content, self)
-        self._views["insights"] = InsightsPanel(content, self)
-        self._views["tools"] = RamifyPanel(content, self)
-        self._views["preferences"] = PreferencesPanel(content, self)
-        self._views["settings"] = SettingsPanel(content, self)
-
-        for view in self._views.values():
-            view.grid(row=0, column=0, sticky="nsew")
+        # Panels are built the first time they are shown; startup only pays for the dashboard.
+        self._view_factories = {
+            "dashboard": lambda: DashboardPanel(content, self),
+            "scan": lambda: ScanView(content, self),
+            "catalog": lambda: CatalogPanel(content, self),
+            "insights": lambda: InsightsPanel(content, self),
+            "tools": lambda: RamifyPanel(content, self),
+            "preferences": lambda: PreferencesPanel(content, self),
+            "settings": lambda: SettingsPanel(content, self),
+        }
 
         self.show_view("dashboard")
 
@@ -3580,21 +4233,26 @@ class AbletoolsUI(tk.Tk):
             row=0, column=1, sticky="w"
         )
 
+        self.jobs_var = tk.StringVar(value="")
+        tk.Label(top, textvariable=self.jobs_var, font=BODY_FONT, fg=ACCENT_2, bg=BG).grid(
+            row=0, column=2, padx=8
+        )
+
         ttk.Button(
             top,
             text="DB Folder",
             command=self._open_db_location,
             style="Ghost.TButton",
-        ).grid(row=0, column=2, padx=8)
+        ).grid(row=0, column=3, padx=8)
         ttk.Button(
             top,
             text="Scan Tab",
             command=lambda: self.show_view("scan"),
             style="Accent.TButton",
-        ).grid(row=0, column=3, padx=(0, 16))
+        ).grid(row=0, column=4, padx=(0, 16))
 
         tk.Frame(top, bg=ACCENT_SOFT, height=2).grid(
-            row=1, column=0, columnspan=4, sticky="ew"
+            row=1, column=0, columnspan=5, sticky="ew"
         )
 
     def _set_app_icon(self) -> None:
@@ -3622,7 +4280,12 @@ class AbletoolsUI(tk.Tk):
 
         png_path = ABLETOOLS_DIR / "resources" / "abletools_logo.png"
         svg_path = ABLETOOLS_DIR / "resources" / "abletools_logo.svg"
-        img = None
+        source_path = png_path if png_path.exists() else svg_path
+        disk_cache = self._logo_disk_cache_file(source_path, target_width)
+        img = self._read_logo_disk_cache(disk_cache)
+        if img is not None:
+            self._logo_cache[cache_key] = img
+            return img
 
         if png_path.exists():
             img = tk.PhotoImage(file=str(png_path))
@@ -3649,6 +4312,7 @@ class AbletoolsUI(tk.Tk):
         if scale > 1:
             img = img.subsample(scale, scale)
 
+        self._write_logo_disk_cache(img, disk_cache)
         self._logo_cache[cache_key] = img
         return img
 
@@ -3662,6 +4326,11 @@ class AbletoolsUI(tk.Tk):
         mark_path = ABLETOOLS_DIR / "resources" / "abletools_mark.png"
         if not mark_path.exists():
             return None
+        disk_cache = self._logo_disk_cache_file(mark_path, target_width)
+        img = self._read_logo_disk_cache(disk_cache)
+        if img is not None:
+            self._logo_cache[cache_key] = img
+            return img
         img = tk.PhotoImage(file=str(mark_path))
 
         width = max(1, img.width())
@@ -3669,15 +4338,46 @@ class AbletoolsUI(tk.Tk):
         if scale > 1:
             img = img.subsample(scale, scale)
 
+        self._write_logo_disk_cache(img, disk_cache)
         self._logo_cache[cache_key] = img
         return img
 
+    def _logo_disk_cache_file(self, source: Path, target_width: int) -> Path | None:
+        try:
+            mtime_ns = source.stat().st_mtime_ns
+        except OSError:
+            return None
+        key = hashlib.sha1(f"{source}:{mtime_ns}:{target_width}".encode()).hexdigest()
+        return self.catalog_dir() / "logo_cache" / f"{key}.png"
+
+    def _read_logo_disk_cache(self, cache_file: Path | None) -> tk.PhotoImage | None:
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            return tk.PhotoImage(file=str(cache_file))
+        except tk.TclError:
+            return None
+
+    def _write_logo_disk_cache(self, img: tk.PhotoImage, cache_file: Path | None) -> None:
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            img.write(str(cache_file), format="png")
+        except (OSError, tk.TclError):
+            pass
+
     def show_view(self, name: str) -> None:
         view = self._views.get(name)
-        if not view:
-            return
+        if view is None:
+            factory = self._view_factories.get(name)
+            if factory is None:
+                return
+            view = self._views[name] = factory()
+            view.grid(row=0, column=0, sticky="nsew")
         self._log_event("NAV", f"show_view={name}")
         view.tkraise()
+        self._active_view = name
         for key, btn in self._nav_buttons.items():
             if key == name:
                 btn.configure(style="NavActive.TButton")
@@ -3708,6 +4408,9 @@ class AbletoolsUI(tk.Tk):
                 insights.refresh()
 
     def refresh_dashboard(self) -> None:
+        # show_view("dashboard") refreshes on entry, so a hidden dashboard can skip its queries.
+        if self._active_view not in (None, "dashboard"):
+            return
         dashboard = self._views.get("dashboard")
         if isinstance(dashboard, DashboardPanel):
             dashboard.refresh()
@@ -3744,6 +4447,7 @@ class AbletoolsUI(tk.Tk):
 
     def set_active_root(self, root: Path) -> None:
         self.active_root = root
+        self._root_db_path = root / ".abletools_catalog" / "abletools_catalog.sqlite"
         self.active_root_var.set(f"Active root: {root}")
         try:
             set_scan_root(self.catalog_dir(), root)
@@ -3755,15 +4459,60 @@ class AbletoolsUI(tk.Tk):
             self.current_scope = scope
 
     def resolve_db_path(self) -> Optional[Path]:
-        if self.active_root:
-            return self.active_root / ".abletools_catalog" / "abletools_catalog.sqlite"
-        return self.catalog_dir() / "abletools_catalog.sqlite"
+        if self._root_db_path is not None:
+            return self._root_db_path
+        return self._catalog_db_path
 
     def resolve_catalog_db_path(self) -> Optional[Path]:
-        return self.catalog_dir() / "abletools_catalog.sqlite"
+        return self._catalog_db_path
+
+    def existing_catalog_db_path(self) -> Path | None:
+        """Catalog DB path if the file exists.
+
+        A found DB is trusted until a DB update resets the cache; a missing one is
+        re-checked at most every DB_EXISTS_TTL seconds so external scans show up.
+        """
+        path, checked_at = self._db_path_cache
+        if path is not None:
+            return path
+        now = time.monotonic()
+        if now - checked_at >= DB_EXISTS_TTL:
+            candidate = self.resolve_catalog_db_path()
+            path = candidate if candidate and candidate.exists() else None
+            self._db_path_cache = (path, now)
+        return path
+
+    def db_cached(self, name: str, load: Callable[[], _T]) -> _T:
+        """Reuse a loader's result until the catalog DB is updated or switched."""
+        db_path = self.existing_catalog_db_path()
+        key = (name, db_path)
+        # Writes from CLI runs never bump the pool generation; the file stats catch them.
+        version = (self._db_pool.generation, db_file_signature(db_path))
+        cached = self._db_result_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]  # type: ignore[return-value]
+        value = load()
+        self._db_result_cache[key] = (version, value)
+        return value
+
+    def catalog_fts_available(self, db_path: Path) -> bool:
+        """Whether the catalog DB carries the catalog_fts search index (cached per update)."""
+        cached = self._fts_cache.get(db_path)
+        if cached is None:
+            try:
+                with self._db_pool.acquire(db_path) as conn:
+                    cached = bool(
+                        conn.execute(
+                            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'catalog_fts'"
+                        ).fetchone()
+                    )
+            except sqlite3.Error:
+                cached = False
+            self._fts_cache[db_path] = cached
+        return cached
 
     def resolve_prefs_db_path(self) -> Optional[Path]:
-        return self.catalog_dir() / "abletools_catalog.sqlite"
+        return self._catalog_db_path
 
     def resolve_scan_summary(self) -> Optional[Path]:
         if self.active_root:
@@ -3772,127 +4521,39 @@ class AbletoolsUI(tk.Tk):
         return fallback if fallback.exists() else None
 
     def load_catalog_stats(self) -> CatalogStats:
-        db_path = self.resolve_catalog_db_path()
+        db_path = self.existing_catalog_db_path()
         stats = CatalogStats(last_scan=_now_iso())
-        if not db_path or not db_path.exists():
+        if not db_path:
             return stats
         try:
-            with sqlite3.connect(db_path) as conn:
-                stats.file_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM file_index "
-                    "UNION ALL SELECT COUNT(*) FROM file_index_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM file_index_preferences)"
-                ).fetchone()[0] or 0
-                stats.doc_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM ableton_docs "
-                    "UNION ALL SELECT COUNT(*) FROM ableton_docs_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM ableton_docs_preferences)"
-                ).fetchone()[0] or 0
-                stats.refs_count = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM refs_graph "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_user_library "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_preferences)"
-                ).fetchone()[0] or 0
-                stats.missing_refs = conn.execute(
-                    "SELECT SUM(cnt) FROM ("
-                    "SELECT COUNT(*) AS cnt FROM refs_graph WHERE ref_exists = 0 "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_user_library WHERE ref_exists = 0 "
-                    "UNION ALL SELECT COUNT(*) FROM refs_graph_preferences WHERE ref_exists = 0)"
-                ).fetchone()[0] or 0
+            with self._db_pool.acquire(db_path) as conn:
+                row = conn.execute(CATALOG_STATS_SQL).fetchone()
+            (
+                stats.file_count,
+                stats.doc_count,
+                stats.refs_count,
+                stats.missing_refs,
+            ) = (int(value or 0) for value in row)
         except Exception:
             return stats
         return stats
 
-    def load_top_devices(self, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT device_name, usage_count FROM device_usage "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY usage_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            if rows:
-                return [f"{name} ({count})" for name, count in rows]
-            rows = conn.execute(
-                "SELECT device_name, COUNT(*) FROM doc_device_hints "
-                "WHERE scope != 'preferences' "
-                "GROUP BY device_name "
-                "ORDER BY COUNT(*) DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-            return [f"{name} ({count})" for name, count in rows]
-        except Exception:
-            return []
-
-    def load_top_plugins(self, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT COALESCE(name, path) AS label, COALESCE(vendor, '') AS vendor, COUNT(*) "
-                    "FROM plugin_index "
-                    "WHERE scope != 'preferences' "
-                    "GROUP BY label, vendor "
-                    "ORDER BY COUNT(*) DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            results = []
-            for label, vendor, count in rows:
-                if vendor:
-                    results.append(f"{label} ({vendor}, {count})")
-                else:
-                    results.append(f"{label} ({count})")
-            return results
-        except Exception:
-            return []
-
-    def load_top_chains(self, limit: int = 6) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
-            return []
-        try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT chain, usage_count FROM device_chain_stats "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY usage_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            return [f"{chain} ({count})" for chain, count in rows]
-        except Exception:
-            return []
-
-    def load_missing_refs_paths(self, limit: int = 6) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
-            return []
+    def load_dashboard_extras(self) -> dict[str, list[str]]:
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
+            return dashboard_extras(None)
         try:
-            with sqlite3.connect(db_path) as conn:
-                rows = conn.execute(
-                    "SELECT ref_parent, missing_count FROM missing_refs_by_path "
-                    "WHERE scope != 'preferences' "
-                    "ORDER BY missing_count DESC LIMIT ?",
-                    (limit,),
-                ).fetchall()
-            return [f"{path} ({count})" for path, count in rows]
+            with self._db_pool.acquire(db_path) as conn:
+                return dashboard_extras(conn)
         except Exception:
-            return []
+            return dashboard_extras(None)
 
     def load_missing_hotspots(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT ref_parent, missing_count FROM missing_refs_by_path "
                     "WHERE scope = ? ORDER BY missing_count DESC LIMIT ?",
@@ -3903,11 +4564,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_chain_fingerprints(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT chain, usage_count FROM device_chain_stats "
                     "WHERE scope = ? ORDER BY usage_count DESC LIMIT ?",
@@ -3918,11 +4579,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_set_health(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT path, health_score, missing_refs_count, devices_count, samples_count "
                     "FROM set_health WHERE scope = ? "
@@ -3940,11 +4601,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_audio_footprint(self, scope: str) -> dict[str, int]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return {}
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 row = conn.execute(
                     "SELECT total_media_bytes, referenced_media_bytes, unreferenced_media_bytes "
                     "FROM audio_footprint WHERE scope = ?",
@@ -3961,11 +4622,11 @@ class AbletoolsUI(tk.Tk):
             return {}
 
     def load_set_storage_summary(self, scope: str) -> dict[str, int]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return {}
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 row = conn.execute(
                     "SELECT total_sets, total_set_bytes, non_backup_sets, non_backup_bytes "
                     "FROM set_storage_summary WHERE scope = ?",
@@ -3983,11 +4644,11 @@ class AbletoolsUI(tk.Tk):
             return {}
 
     def load_set_activity(self, scope: str) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT window_days, set_count, total_bytes "
                     "FROM set_activity_stats WHERE scope = ? "
@@ -4004,11 +4665,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_largest_sets(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT path, size_bytes FROM set_size_top "
                     "WHERE scope = ? ORDER BY size_bytes DESC LIMIT ?",
@@ -4019,11 +4680,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_unreferenced_audio(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT parent_path, file_count, total_bytes "
                     "FROM unreferenced_audio_by_path "
@@ -4038,11 +4699,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_quality_issues(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT issue, path, issue_value FROM quality_issues "
                     "WHERE scope = ? ORDER BY issue_value DESC LIMIT ?",
@@ -4063,11 +4724,11 @@ class AbletoolsUI(tk.Tk):
     def load_recent_device_usage(
         self, scope: str, window_days: int = 30, limit: int = 8
     ) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT device_name, usage_count FROM device_usage_recent "
                     "WHERE scope = ? AND window_days = ? "
@@ -4079,11 +4740,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_device_pairs(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT device_a, device_b, usage_count FROM device_cooccurrence "
                     "WHERE scope = ? ORDER BY usage_count DESC LIMIT ?",
@@ -4094,11 +4755,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_activity_delta(self, scope: str) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT window_days, current_sets, previous_sets, current_bytes, "
                     "previous_bytes, delta_bytes "
@@ -4121,11 +4782,11 @@ class AbletoolsUI(tk.Tk):
     def load_growth_by_parent(
         self, scope: str, window_days: int = 30, limit: int = 8
     ) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT parent_path, delta_bytes, current_sets "
                     "FROM set_growth_by_parent "
@@ -4141,11 +4802,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_sample_duplicates(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT sha1, file_count, total_bytes, example_path "
                     "FROM sample_duplicate_groups "
@@ -4165,11 +4826,11 @@ class AbletoolsUI(tk.Tk):
     def load_cold_samples(
         self, scope: str, cutoff_days: int = 90, limit: int = 8
     ) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 summary = conn.execute(
                     "SELECT sample_count, total_bytes FROM cold_samples_summary "
                     "WHERE scope = ? AND cutoff_days = ?",
@@ -4196,11 +4857,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_routing_anomalies(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT path, issue_value FROM routing_anomalies "
                     "WHERE scope = ? ORDER BY issue_value DESC LIMIT ?",
@@ -4214,11 +4875,11 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_rare_device_pairs(self, scope: str, limit: int = 8) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     "SELECT device_a, device_b, usage_count FROM device_pair_anomalies "
                     "WHERE scope = ? ORDER BY usage_count ASC LIMIT ?",
@@ -4229,8 +4890,8 @@ class AbletoolsUI(tk.Tk):
             return []
 
     def load_dashboard_focus(self, scope: str) -> dict[str, int]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return {}
         suffix = "" if scope == "live_recordings" else f"_{scope}"
         backup_clause = (
@@ -4253,7 +4914,7 @@ class AbletoolsUI(tk.Tk):
             "missing_sets": 0,
         }
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 result["set_count_total"] = (
                     conn.execute(
                         f"SELECT COUNT(*) FROM file_index{suffix} "
@@ -4301,8 +4962,8 @@ class AbletoolsUI(tk.Tk):
     def backup_catalog_files(
         self, scope: str, kind: str, dest_dir: Path
     ) -> tuple[int, int, Optional[Path]]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return 0, 0
         suffix = "" if scope == "live_recordings" else f"_{scope}"
         backup_clause = (
@@ -4323,7 +4984,7 @@ class AbletoolsUI(tk.Tk):
             where = "ext IN ('.als', '.alc')"
         active_root = self.active_root
         try:
-            with sqlite3.connect(db_path) as conn:
+            with self._db_pool.acquire(db_path) as conn:
                 rows = conn.execute(
                     f"SELECT path FROM file_index{suffix} WHERE {where} AND {backup_clause}",
                     backup_params,
@@ -4338,18 +4999,16 @@ class AbletoolsUI(tk.Tk):
         return cleanup_catalog_dir(self.catalog_dir(), options)
 
     def optimize_catalog_db(self) -> tuple[bool, str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return False, "No database found."
         script = self.abletools_dir / "abletools_maintenance.py"
         if not script.exists():
             return False, "Maintenance script missing."
-        proc = subprocess.run(
-            [sys.executable, str(script), str(db_path), "--analyze", "--optimize", "--vacuum"],
-            cwd=str(self.abletools_dir),
-            capture_output=True,
-            text=True,
-        )
+        self._db_pool.invalidate()
+        proc = self._worker.run(script, [str(db_path), "--analyze", "--optimize", "--vacuum"])
+        self._db_pool.invalidate()
+        self._fts_cache.clear()
         if proc.returncode != 0:
             return False, proc.stderr.strip() or "Maintenance failed."
         return True, ""
@@ -4359,19 +5018,17 @@ class AbletoolsUI(tk.Tk):
         if not script.exists():
             return False, "Catalog DB script missing."
         catalog_dir = self.catalog_dir()
-        proc = subprocess.run(
-            [sys.executable, str(script), str(catalog_dir), "--overwrite", "--vacuum"],
-            cwd=str(self.abletools_dir),
-            capture_output=True,
-            text=True,
-        )
+        self._db_pool.invalidate()
+        proc = self._worker.run(script, [str(catalog_dir), "--overwrite", "--vacuum"])
+        self._db_pool.invalidate()
+        self._fts_cache.clear()
         if proc.returncode != 0:
             return False, proc.stderr.strip() or "Rebuild failed."
         return True, ""
 
     def _open_db_location(self) -> None:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             messagebox.showinfo("Database", "No database found yet.")
             return
         folder = db_path.parent
@@ -4380,16 +5037,76 @@ class AbletoolsUI(tk.Tk):
         except Exception:
             messagebox.showwarning("Could not open folder", str(folder))
 
-    def refresh_catalog_db(self, background: bool = True) -> None:
+    def request_refresh(self, *keys: str) -> None:
+        """Coalesce "db" and "dashboard" refreshes requested within REFRESH_DEBOUNCE_MS."""
+        if not self._pending_refresh:
+            self.after(REFRESH_DEBOUNCE_MS, self._do_refresh)
+        self._pending_refresh.update(keys)
+
+    def _do_refresh(self) -> None:
+        keys, self._pending_refresh = self._pending_refresh, set()
+        if "db" not in keys:
+            self.refresh_dashboard()
+            return
+        self.refresh_catalog_db(on_done=lambda: self.after(0, self.refresh_dashboard))
+
+    def _begin_db_update(self, on_done: Callable[[], None] | None = None) -> bool:
+        """Claim the DB writer slot, or queue on_done behind the update in flight."""
+        with self._db_waiters_lock:
+            if self._db_refresh_lock.acquire(blocking=False):
+                return True
+            if on_done is not None:
+                self._db_waiters.append(on_done)
+            return False
+
+    def _end_db_update(self) -> None:
+        self._db_pool.invalidate()
+        self._known_sets_cache.clear()
+        self._fts_cache.clear()
+        self._db_path_cache = (None, float("-inf"))
+        with self._db_waiters_lock:
+            self._db_refresh_lock.release()
+            waiters, self._db_waiters = self._db_waiters, []
+        for callback in waiters:
+            callback()
+
+    def _job_started(self, label: str) -> None:
+        """Count a background DB job in the topbar; safe to call from any thread."""
+        with self._jobs_lock:
+            self._active_jobs.append(label)
+        self.after(0, self._update_jobs_label)
+
+    def _job_finished(self, label: str) -> None:
+        with self._jobs_lock:
+            if label in self._active_jobs:
+                self._active_jobs.remove(label)
+        self.after(0, self._update_jobs_label)
+
+    def _update_jobs_label(self) -> None:
+        with self._jobs_lock:
+            jobs = list(self._active_jobs)
+        if not jobs:
+            self.jobs_var.set("")
+        elif len(jobs) == 1:
+            self.jobs_var.set(f"{jobs[0]}...")
+        else:
+            self.jobs_var.set(f"{jobs[-1]}... (+{len(jobs) - 1} more)")
+
+    def refresh_catalog_db(
+        self, background: bool = True, on_done: Callable[[], None] | None = None
+    ) -> None:
         if background:
-            threading.Thread(target=self._refresh_catalog_db_worker, daemon=True).start()
+            threading.Thread(
+                target=self._refresh_catalog_db_worker, args=(on_done,), daemon=True
+            ).start()
             return
-        self._refresh_catalog_db_worker()
+        self._refresh_catalog_db_worker(on_done)
 
-    def _refresh_catalog_db_worker(self) -> None:
-        if not self._db_refresh_lock.acquire(blocking=False):
-            self._log_event("DB", "refresh_catalog_db skipped: already running")
+    def _refresh_catalog_db_worker(self, on_done: Callable[[], None] | None = None) -> None:
+        if not self._begin_db_update(on_done):
+            self._log_event("DB", "refresh_catalog_db: already running; queued after it")
             return
+        self._job_started("Updating DB")
         try:
             catalog_dir = self.catalog_dir()
             db_script = self.abletools_dir / "abletools_catalog_db.py"
@@ -4400,12 +5117,7 @@ class AbletoolsUI(tk.Tk):
             catalog_dir.mkdir(parents=True, exist_ok=True)
             self._log_event("DB", f"refresh_catalog_db: {catalog_dir}")
             try:
-                proc = subprocess.run(
-                    [sys.executable, str(db_script), str(catalog_dir), "--append"],
-                    cwd=str(self.abletools_dir),
-                    capture_output=True,
-                    text=True,
-                )
+                proc = self._worker.run(db_script, [str(catalog_dir), "--append"])
             except Exception as exc:
                 self.after(0, messagebox.showerror, "Catalog", f"Failed to update DB:\n{exc}")
                 self._log_event("ERROR", f"refresh_catalog_db: {exc}")
@@ -4419,16 +5131,18 @@ class AbletoolsUI(tk.Tk):
                 )
                 self._log_event("ERROR", f"refresh_catalog_db: {proc.stderr.strip()}")
         finally:
-            self._db_refresh_lock.release()
+            self._job_finished("Updating DB")
+            self._end_db_update()
+            if on_done is not None:
+                on_done()
 
     def run_analytics(self) -> None:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             messagebox.showinfo("Analytics", "No database found yet.")
             self._log_event("ANALYTICS", "db missing")
             return
         def _run() -> None:
-            self.refresh_catalog_db(background=False)
             analytics = self.abletools_dir / "abletools_analytics.py"
             if not analytics.exists():
                 self.after(
@@ -4439,17 +5153,15 @@ class AbletoolsUI(tk.Tk):
                 )
                 self._log_event("ERROR", f"run_analytics: script missing {analytics}")
                 return
+            self._job_started("Analytics")
             try:
-                proc = subprocess.run(
-                    [sys.executable, str(analytics), str(db_path)],
-                    cwd=str(self.abletools_dir),
-                    capture_output=True,
-                    text=True,
-                )
+                proc = self._worker.run(analytics, [str(db_path)])
             except Exception as exc:
                 self.after(0, messagebox.showerror, "Analytics", f"Failed:\n{exc}")
                 self._log_event("ERROR", f"run_analytics: {exc}")
                 return
+            finally:
+                self._job_finished("Analytics")
             if proc.returncode != 0:
                 self.after(
                     0,
@@ -4459,11 +5171,12 @@ class AbletoolsUI(tk.Tk):
                 )
                 self._log_event("ERROR", f"run_analytics: {proc.stderr.strip()}")
                 return
+            self._db_pool.invalidate()
             self._log_event("ANALYTICS", "completed")
             self.after(0, messagebox.showinfo, "Analytics", "Analytics updated.")
-            self.after(0, self.refresh_dashboard)
+            self.after(0, self.request_refresh, "dashboard")
 
-        threading.Thread(target=_run, daemon=True).start()
+        self.refresh_catalog_db(on_done=_run)
 
     def run_targeted_scan(self, scope: str, root: Path, details: list[str]) -> None:
         scan_script = self.scan_script_path()
@@ -4492,7 +5205,8 @@ class AbletoolsUI(tk.Tk):
                 proc = subprocess.run(
                     cmd,
                     cwd=str(self.abletools_dir),
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                 )
             except Exception as exc:
@@ -4508,119 +5222,129 @@ class AbletoolsUI(tk.Tk):
                     proc.stderr.strip() or "Scan failed.",
                 )
                 return
-            self.after(0, self.refresh_catalog_db)
-            self.after(0, self.refresh_dashboard)
+            self.after(0, self.request_refresh, "db")
             self.after(0, messagebox.showinfo, "Scan Selected", "Targeted scan completed.")
 
         threading.Thread(target=_run, daemon=True).start()
 
     def get_known_sets(self, scope: str) -> list[dict[str, str]]:
         db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        if not db_path:
+            return []
+        # WAL commits from a CLI scan only touch the -wal file, so key on both files.
+        signature = db_file_signature(db_path)
+        if signature[0] < 0:
             return []
         if scope == "all":
             scope = "live_recordings"
+        cached = self._known_sets_cache.get(scope)
+        if cached and cached[0] == signature:
+            return cached[1]
         suffix = "" if scope == "live_recordings" else f"_{scope}"
-        items: list[dict[str, str]] = []
+        # SQLite builds the row dicts as one JSON array; the name is the text after
+        # the last "/" (rtrim strips the basename, leaving the directory prefix).
         query = f"""
-            SELECT d.path, d.tracks_total, d.clips_total, f.mtime
-            FROM ableton_docs{suffix} d
-            JOIN file_index{suffix} f ON f.path = d.path
-            WHERE f.ext IN ('.als', '.alc')
-            ORDER BY f.mtime DESC
-            LIMIT 2000
+            SELECT json_group_array(
+                json_object(
+                    'path', path,
+                    'name', substr(path, length(rtrim(path, replace(path, '/', ''))) + 1),
+                    'mtime', mtime,
+                    'tracks', tracks_total,
+                    'clips', clips_total
+                )
+            )
+            FROM (
+                SELECT d.path, f.mtime, d.tracks_total, d.clips_total
+                FROM file_index{suffix} f
+                JOIN ableton_docs{suffix} d ON d.path = f.path
+                WHERE f.ext IN ('.als', '.alc')
+                ORDER BY f.mtime DESC
+                LIMIT 2000
+            )
         """
         try:
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                for row in conn.execute(query).fetchall():
-                    path = row["path"]
-                    items.append(
-                        {
-                            "path": path,
-                            "name": Path(path).name,
-                            "mtime": row["mtime"],
-                            "tracks": row["tracks_total"],
-                            "clips": row["clips_total"],
-                        }
-                    )
+            with self._db_pool.acquire(db_path) as conn:
+                (payload,) = conn.execute(query).fetchone()
+            items = json_loads(payload or "[]")
         except Exception as exc:
             self._log_event("ERROR", f"get_known_sets: {exc}")
+            return []
+        self._known_sets_cache[scope] = (signature, items)
         return items
 
     def audit_zero_tracks(self) -> list[str]:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             return []
-        issues: list[str] = []
         log_path = self.catalog_dir() / "audit_log.txt"
+        issues: list[str] = []
         try:
-            with sqlite3.connect(db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                for scope, suffix in (
-                    ("live_recordings", ""),
-                    ("user_library", "_user_library"),
-                ):
-                    rows = conn.execute(
-                        f"""
-                        SELECT d.path, d.tracks_total, d.clips_total, d.error, f.size
-                        FROM ableton_docs{suffix} d
-                        LEFT JOIN file_index{suffix} f ON f.path = d.path
-                        WHERE d.tracks_total = 0
-                        LIMIT 50
-                        """
-                    ).fetchall()
-                    for row in rows:
-                        reason = "no track tags found"
-                        if row["error"]:
-                            reason = f"parse error: {row['error']}"
-                        entry = (
-                            f"{scope}: {row['path']} "
-                            f"(tracks={row['tracks_total']}, clips={row['clips_total']}, "
-                            f"size={row['size']}, {reason})"
-                        )
-                        issues.append(entry)
-                        self._log_event("AUDIT", entry)
+            with self._db_pool.acquire(db_path) as conn:
+                rows = conn.execute(ZERO_TRACKS_SQL).fetchall()
+            for scope, path, tracks, clips, error, size in rows:
+                reason = f"parse error: {error}" if error else "no track tags found"
+                issues.append(
+                    f"{scope}: {path} "
+                    f"(tracks={tracks}, clips={clips}, size={size}, {reason})"
+                )
             if issues:
+                report = "\n".join(issues)
+                self._log_event("AUDIT", f"zero tracks: {len(issues)} issue(s)\n{report}")
                 with log_path.open("a", encoding="utf-8") as handle:
-                    handle.write(f"{datetime.now().isoformat()} audit_zero_tracks\n")
-                    for entry in issues:
-                        handle.write(f"{entry}\n")
+                    handle.write(
+                        f"{datetime.now().isoformat()} audit_zero_tracks\n{report}\n"
+                    )
         except Exception as exc:
             self._log_event("ERROR", f"audit_zero_tracks: {exc}")
         return issues
 
     def audit_missing_refs(self) -> None:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             messagebox.showinfo("Missing Refs", "No database found yet.")
             return
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         out_path = self.catalog_dir() / f"missing_refs_audit_{timestamp}.txt"
         try:
-            with sqlite3.connect(db_path) as conn, out_path.open("w", encoding="utf-8") as handle:
+            with self._db_pool.acquire(db_path) as conn, out_path.open(
+                "w", encoding="utf-8", buffering=1 << 20
+            ) as handle:
                 handle.write(f"missing refs audit {datetime.now().isoformat()}\n")
-                for scope, suffix in (
-                    ("live_recordings", ""),
-                    ("user_library", "_user_library"),
-                    ("preferences", "_preferences"),
-                ):
-                    handle.write(f"\n[{scope}]\n")
-                    cursor = conn.execute(
-                        f"""
-                        SELECT ref_path, COUNT(*) AS cnt, MIN(src) AS sample_src
-                        FROM refs_graph{suffix}
-                        WHERE ref_exists = 0
-                        GROUP BY ref_path
-                        ORDER BY cnt DESC
-                        """
-                    )
-                    rows_written = 0
-                    for ref_path, cnt, sample_src in cursor:
-                        rows_written += 1
-                        handle.write(f"{cnt}\t{ref_path}\t{sample_src}\n")
-                    if rows_written == 0:
-                        handle.write("no missing refs found\n")
+                conn.execute("BEGIN")
+                try:
+                    for scope, suffix in (
+                        ("live_recordings", ""),
+                        ("user_library", "_user_library"),
+                        ("preferences", "_preferences"),
+                    ):
+                        (total,) = conn.execute(
+                            f"SELECT COUNT(DISTINCT ref_path) FROM refs_graph{suffix} "
+                            "WHERE ref_exists = 0"
+                        ).fetchone()
+                        handle.write(f"\n[{scope}]\n")
+                        if not total:
+                            handle.write("no missing refs found\n")
+                            continue
+                        rows = conn.execute(
+                            f"""
+                            SELECT ref_path, COUNT(*) AS cnt, MIN(src) AS sample_src
+                            FROM refs_graph{suffix}
+                            WHERE ref_exists = 0
+                            GROUP BY ref_path
+                            ORDER BY cnt DESC
+                            LIMIT ?
+                            """,
+                            (MISSING_REFS_AUDIT_LIMIT,),
+                        ).fetchall()
+                        body = "".join(
+                            f"{cnt}\t{ref_path}\t{sample_src}\n"
+                            for ref_path, cnt, sample_src in rows
+                        )
+                        if total > len(rows):
+                            body += f"... and {total - len(rows)} more missing refs omitted\n"
+                        handle.write(body)
+                finally:
+                    conn.execute("COMMIT")
             self._log_event("AUDIT", f"missing refs -> {out_path}")
             messagebox.showinfo("Missing Refs", f"Saved audit to:\n{out_path}")
         except Exception as exc:
@@ -4628,8 +5352,8 @@ class AbletoolsUI(tk.Tk):
             messagebox.showerror("Missing Refs", f"Failed:\n{exc}")
 
     def run_maintenance(self) -> None:
-        db_path = self.resolve_catalog_db_path()
-        if not db_path or not db_path.exists():
+        db_path = self.existing_catalog_db_path()
+        if not db_path:
             messagebox.showinfo("Maintenance", "No database found yet.")
             self._log_event("MAINTENANCE", "db missing")
             return
@@ -4638,49 +5362,83 @@ class AbletoolsUI(tk.Tk):
             messagebox.showerror("Maintenance", f"Missing maintenance script:\n{maintenance}")
             self._log_event("ERROR", f"run_maintenance: script missing {maintenance}")
             return
-        try:
-            proc = subprocess.run(
-                [sys.executable, str(maintenance), str(db_path), "--analyze", "--optimize"],
-                cwd=str(self.abletools_dir),
-                capture_output=True,
-                text=True,
-            )
-        except Exception as exc:
-            messagebox.showerror("Maintenance", f"Failed to run maintenance:\n{exc}")
-            self._log_event("ERROR", f"run_maintenance: {exc}")
-            return
-        if proc.returncode != 0:
-            messagebox.showerror("Maintenance", proc.stderr.strip() or "Maintenance failed.")
-            self._log_event("ERROR", f"run_maintenance: {proc.stderr.strip()}")
-            return
-        self._log_event("MAINTENANCE", "completed")
-        messagebox.showinfo("Maintenance", "Database optimized.")
+        self._db_pool.invalidate()
+
+        def _run() -> None:
+            self._job_started("Optimizing DB")
+            try:
+                proc = self._worker.run(maintenance, [str(db_path), "--analyze", "--optimize"])
+            except Exception as exc:
+                self.after(
+                    0, messagebox.showerror, "Maintenance", f"Failed to run maintenance:\n{exc}"
+                )
+                self._log_event("ERROR", f"run_maintenance: {exc}")
+                return
+            finally:
+                # Readers opened while ANALYZE ran still hold the old schema state.
+                self._db_pool.invalidate()
+                self._job_finished("Optimizing DB")
+            if proc.returncode != 0:
+                self.after(
+                    0,
+                    messagebox.showerror,
+                    "Maintenance",
+                    proc.stderr.strip() or "Maintenance failed.",
+                )
+                self._log_event("ERROR", f"run_maintenance: {proc.stderr.strip()}")
+                return
+            self._log_event("MAINTENANCE", "completed")
+            self.after(0, messagebox.showinfo, "Maintenance", "Database optimized.")
+
+        threading.Thread(target=_run, daemon=True).start()
+
+    def _start_prefs_refresh_async(self) -> None:
+        threading.Thread(target=self._refresh_prefs_cache, daemon=True).start()
 
     def _refresh_prefs_cache(self) -> None:
+        """Re-import Ableton preferences into the prefs DB; runs on a worker thread."""
         catalog_dir = self.abletools_dir / ".abletools_catalog"
         db_script = self.abletools_dir / "abletools_catalog_db.py"
         if not db_script.exists():
             return
         catalog_dir.mkdir(parents=True, exist_ok=True)
         db_path = self.resolve_prefs_db_path()
-        cmd = [
-            sys.executable,
-            str(db_script),
-            str(catalog_dir),
-            "--append",
-            "--prefs-only",
-            "--db",
-            str(db_path),
-        ]
+        args = [str(catalog_dir), "--append", "--prefs-only", "--db", str(db_path)]
         try:
-            subprocess.run(
-                cmd,
-                cwd=str(self.abletools_dir),
-                capture_output=True,
-                text=True,
-            )
+            self._worker.run_shared(db_script, args)
         except Exception:
             pass
+        self._db_pool.invalidate()
+        self._warm_prefs_db()
+        self.after(0, self._on_prefs_refreshed)
+
+    def _on_prefs_refreshed(self) -> None:
+        if self._active_view == "preferences":
+            panel = self._views.get("preferences")
+            if isinstance(panel, PreferencesPanel):
+                panel.refresh()
+
+    def _warm_prefs_db(self) -> None:
+        db_path = self.resolve_prefs_db_path()
+        if not db_path or not db_path.exists():
+            return
+        self._ensure_wal(db_path)
+        try:
+            # Warms a pooled reader, so its page cache outlives this call.
+            with self._db_pool.acquire(db_path) as conn:
+                conn.execute("SELECT COUNT(*) FROM ableton_prefs").fetchone()
+        except Exception as exc:
+            self._log_event("DB", f"prefs warm-up skipped: {exc}")
+
+    def _ensure_wal(self, db_path: Path) -> None:
+        """Convert a pre-WAL DB once so UI readers never wait on the writer scripts."""
+        if db_path in self._wal_checked:
+            return
+        try:
+            ensure_wal_mode(db_path)
+            self._wal_checked.add(db_path)
+        except sqlite3.Error as exc:
+            self._log_event("DB", f"WAL check skipped: {exc}")
 
     def ensure_catalog_db(self) -> None:
         catalog_dir = self.catalog_dir()
@@ -4688,29 +5446,19 @@ class AbletoolsUI(tk.Tk):
         if not db_path:
             return
         if db_path.exists():
+            self._ensure_wal(db_path)
             return
         db_script = self.abletools_dir / "abletools_catalog_db.py"
         if not db_script.exists():
             return
         catalog_dir.mkdir(parents=True, exist_ok=True)
-        cmd = [
-            sys.executable,
-            str(db_script),
-            str(catalog_dir),
-            "--append",
-            "--prefs-only",
-            "--db",
-            str(db_path),
-        ]
+        args = [str(catalog_dir), "--append", "--prefs-only", "--db", str(db_path)]
         try:
-            subprocess.run(
-                cmd,
-                cwd=str(self.abletools_dir),
-                capture_output=True,
-                text=True,
-            )
+            self._worker.run_shared(db_script, args)
         except Exception as exc:
             self.log_ui_error(f"ensure_catalog_db: {exc}")
+        self._db_pool.invalidate()
+        self._db_path_cache = (None, float("-inf"))
 
     def _init_active_root(self) -> None:
         if self.active_root is None:
@@ -4726,42 +5474,43 @@ class AbletoolsUI(tk.Tk):
         self._rotate_log(self.log_path)
         logger = logging.getLogger("abletools")
         logger.setLevel(logging.INFO)
+        self._log_listener: logging.handlers.QueueListener | None = None
         if not logger.handlers:
             handler = logging.FileHandler(self.log_path, encoding="utf-8")
             formatter = logging.Formatter(
                 "%(asctime)s %(levelname)s %(message)s", "%Y-%m-%dT%H:%M:%S"
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
+            # The Tk thread only enqueues records; file writes happen on the listener.
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._log_listener = logging.handlers.QueueListener(log_queue, handler)
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)
         logger.info("App start")
         return logger
 
     def _rotate_log(self, path: Path, max_bytes: int = 5_000_000, backups: int = 3) -> None:
         try:
-            size = path.stat().st_size
-        except FileNotFoundError:
-            return
+            if os.path.getsize(path) <= max_bytes:
+                return
+            with os.scandir(path.parent) as entries:
+                existing = {entry.name for entry in entries}
         except OSError:
             return
-        if size <= max_bytes:
-            return
+        base = str(path)
         for idx in range(backups, 0, -1):
-            src = Path(f"{path}.{idx}")
-            dst = Path(f"{path}.{idx + 1}")
-            if not src.exists():
-                continue
-            if idx == backups:
-                try:
-                    src.unlink()
-                except OSError:
-                    pass
+            if f"{path.name}.{idx}" not in existing:
                 continue
             try:
-                src.replace(dst)
+                if idx == backups:
+                    os.remove(f"{base}.{idx}")
+                else:
+                    os.replace(f"{base}.{idx}", f"{base}.{idx + 1}")
             except OSError:
                 pass
         try:
-            path.replace(Path(f"{path}.1"))
+            os.replace(base, f"{base}.1")
         except OSError:
             pass
 
@@ -4773,10 +5522,14 @@ class AbletoolsUI(tk.Tk):
         if not self.log_path or not self.log_path.exists():
             return
         try:
-            lines = self.log_path.read_text(encoding="utf-8").splitlines()
+            with self.log_path.open("rb") as handle:
+                handle.seek(max(0, handle.seek(0, os.SEEK_END) - LOG_TAIL_BYTES))
+                tail = handle.read().decode("utf-8", errors="replace")
         except Exception:
             return
-        recent = [line for line in lines[-200:] if "ERROR" in line or "UI_ERROR" in line]
+        recent = [
+            line for line in tail.splitlines()[-200:] if "ERROR" in line or "UI_ERROR" in line
+        ]
         if recent:
             self._log_event("LOG_SCAN", f"Found {len(recent)} recent error lines.")
 
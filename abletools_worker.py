@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import sys
+import traceback
+
+# Scripts the worker may run in-process, mapped to their module names.
+SCRIPTS = {
+    "abletools_analytics.py": "abletools_analytics",
+    "abletools_catalog_db.py": "abletools_catalog_db",
+    "abletools_maintenance.py": "abletools_maintenance",
+    "abletools_schema_validate.py": "abletools_schema_validate",
+}
+
+
+def run_script(script: str, args: list[str]) -> dict:
+    module = importlib.import_module(SCRIPTS[script])
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [script, *args]
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            returncode = module.main(args)
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                returncode = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)
+                returncode = 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+        finally:
+            sys.argv = saved_argv
+    return {
+        "returncode": int(returncode or 0),
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def main() -> int:
+    out = sys.stdout
+    # Import every script module up front; this overlaps with whatever the UI
+    # is doing before it sends the first request.
+    for name in SCRIPTS.values():
+        # run_script reports the failure when the script is requested.
+        with contextlib.suppress(Exception):
+            importlib.import_module(name)
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+            script = str(request["script"])
+            args = [str(arg) for arg in request.get("args", [])]
+            if script not in SCRIPTS:
+                reply = {"returncode": 2, "stdout": "", "stderr": f"Unknown script: {script}"}
+            else:
+                reply = run_script(script, args)
+        except Exception as exc:
+            reply = {"returncode": 1, "stdout": "", "stderr": f"Bad request: {exc}"}
+        out.write(json.dumps(reply) + "\n")
+        out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
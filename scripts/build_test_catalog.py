@@ -48,6 +48,8 @@ def default_tests_for_file(path: str) -> list[str]:
         return ["pytest -q tests/test_prefs.py"]
     if path.endswith("abletools_catalog_db.py"):
         return ["pytest -q tests/test_catalog_db.py"]
+    if path.endswith("abletools_core.py") or path.endswith("abletools_worker.py"):
+        return ["pytest -q tests/test_core.py"]
     if path.endswith("abletools_schema_validate.py"):
         return ["python3 abletools_schema_validate.py --help"]
     if path.endswith("abletools_analytics.py"):
@@ -217,6 +219,8 @@ def main() -> int:
             "abletools_catalog_ops.py",
             "abletools_prefs.py",
             "abletools_ui.py",
+            "abletools_core.py",
+            "abletools_worker.py",
             "abletools_schema_validate.py",
             "abletools_analytics.py",
             "abletools_maintenance.py",
@@ -11,6 +11,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]
 SQL_RE = re.compile(r"\b(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
 SQL_STRIP_RE = re.compile(r"\s+")
+HUNK_RE = re.compile(r"@@ -\d+(?:,\d+)? \+(\d+)")
 TEST_ITEM_PREFIXES = (
     "abletools_",
     "ramify_core.py",
@@ -101,20 +102,24 @@ def load_coverage_map(path: Path) -> list[CoverageItem]:
 
 
 def git_diff(base: str | None, head: str | None) -> str:
-    if base and head:
-        cmd = ["git", "diff", "--unified=0", f"{base}...{head}"]
-    else:
-        cmd = ["git", "diff", "--unified=0", "HEAD~1...HEAD"]
+    """Raw status lines followed by the zero-context patch, from one git call."""
+    span = f"{base}...{head}" if base and head else "HEAD~1...HEAD"
+    cmd = ["git", "diff", "--raw", "--patch", "--unified=0", span]
     return subprocess.check_output(cmd, cwd=str(ROOT), text=True)
 
 
-def git_changed_files(base: str | None, head: str | None) -> list[str]:
-    if base and head:
-        cmd = ["git", "diff", "--name-only", f"{base}...{head}"]
-    else:
-        cmd = ["git", "diff", "--name-only", "HEAD~1...HEAD"]
-    output = subprocess.check_output(cmd, cwd=str(ROOT), text=True)
-    return [line.strip() for line in output.splitlines() if line.strip()]
+def changed_files_from_diff(diff_text: str) -> list[str]:
+    # ":<modes> <shas> <status>\t<path>[\t<new path>]" -- same paths as --name-only.
+    files = []
+    for line in diff_text.splitlines():
+        if not line.startswith(":"):
+            if line.startswith("diff "):
+                break
+            continue
+        path = line.rsplit("\t", 1)[-1].strip()
+        if path:
+            files.append(path)
+    return files
 
 
 def extract_added_defs(diff_text: str) -> set[str]:
@@ -131,134 +136,141 @@ def extract_added_defs(diff_text: str) -> set[str]:
     return defs
 
 
+SQL_CALLS = {"execute", "executemany", "executescript"}
+
+
+def _is_sql_snippet(value: str) -> bool:
+    upper = value.upper()
+    if "SELECT" in upper and "FROM" in upper:
+        return True
+    if "INSERT" in upper and "INTO" in upper:
+        return True
+    if "UPDATE" in upper and "SET" in upper:
+        return True
+    if "DELETE" in upper and "FROM" in upper:
+        return True
+    if upper.lstrip().startswith("WITH ") and "SELECT" in upper:
+        return True
+    return False
+
+
+def _extract_string(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.JoinedStr):
+        parts = []
+        for part in node.values:
+            if isinstance(part, ast.Constant) and isinstance(part.value, str):
+                parts.append(part.value)
+            else:
+                parts.append("{}")
+        return "".join(parts)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left = _extract_string(node.left)
+        right = _extract_string(node.right)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def _sql_from_call(node: ast.Call) -> str | None:
+    if isinstance(node.func, ast.Attribute):
+        func_name = node.func.attr
+    elif isinstance(node.func, ast.Name):
+        func_name = node.func.id
+    else:
+        return None
+    if func_name not in SQL_CALLS or not node.args:
+        return None
+    value = _extract_string(node.args[0])
+    if not value:
+        return None
+    value = value.strip()
+    # "WITH x" is the shortest statement worth a regex search.
+    if len(value) >= 6 and SQL_RE.search(value) and _is_sql_snippet(value):
+        return SQL_STRIP_RE.sub(" ", value)[:80]
+    return None
+
+
 def extract_sql_strings(text: str) -> list[tuple[str, int]]:
-    results: list[tuple[str, int]] = []
     try:
         tree = ast.parse(text)
     except SyntaxError:
-        return results
-
-    def is_sql_snippet(value: str) -> bool:
-        upper = value.upper()
-        if "SELECT" in upper and "FROM" in upper:
-            return True
-        if "INSERT" in upper and "INTO" in upper:
-            return True
-        if "UPDATE" in upper and "SET" in upper:
-            return True
-        if "DELETE" in upper and "FROM" in upper:
-            return True
-        if upper.lstrip().startswith("WITH ") and "SELECT" in upper:
-            return True
-        return False
-
-    def extract_string(node: ast.AST) -> str | None:
-        if isinstance(node, ast.Constant) and isinstance(node.value, str):
-            return node.value
-        if isinstance(node, ast.JoinedStr):
-            parts = []
-            for part in node.values:
-                if isinstance(part, ast.Constant) and isinstance(part.value, str):
-                    parts.append(part.value)
-                else:
-                    parts.append("{}")
-            return "".join(parts)
-        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
-            left = extract_string(node.left)
-            right = extract_string(node.right)
-            if left is not None and right is not None:
-                return left + right
-        return None
-
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.Call):
-            continue
-        func_name = None
-        if isinstance(node.func, ast.Attribute):
-            func_name = node.func.attr
-        elif isinstance(node.func, ast.Name):
-            func_name = node.func.id
-        if func_name not in {"execute", "executemany", "executescript"}:
-            continue
-        if not node.args:
-            continue
-        value = extract_string(node.args[0])
-        if not value:
-            continue
-        value = value.strip()
-        if SQL_RE.search(value) and is_sql_snippet(value):
-            line = getattr(node, "lineno", 1)
-            cleaned = SQL_STRIP_RE.sub(" ", value)
-            results.append((cleaned[:80], line))
-    return results
+        return []
+    _defs, queries = items_from_tree(tree)
+    return [(query["name"], query["line"]) for query in queries]
 
 
 def parse_changed_lines(diff_text: str) -> dict[str, set[int]]:
     file_lines: dict[str, set[int]] = {}
-    current_file = None
+    added: set[int] | None = None
     new_line = None
     for line in diff_text.splitlines():
-        if line.startswith("+++ b/"):
-            current_file = line.split("+++ b/")[1].strip()
-            file_lines.setdefault(current_file, set())
-            new_line = None
+        head = line[:1]
+        if head == "+":
+            if new_line is None and line.startswith("+++ b/"):
+                added = file_lines.setdefault(line[6:].strip(), set())
+            elif added is not None and new_line is not None:
+                added.add(new_line)
+                new_line += 1
             continue
-        if line.startswith("@@"):
-            parts = line.split()
-            for part in parts:
-                if part.startswith("+"):
-                    # format +start,count or +start
-                    span = part[1:].split(",")
-                    new_line = int(span[0])
-                    break
-            continue
-        if current_file is None or new_line is None:
-            continue
-        if line.startswith("+") and not line.startswith("+++"):
-            file_lines[current_file].add(new_line)
-            new_line += 1
+        if head == "d" and line.startswith("diff "):
+            # File headers follow; nothing counts until the next hunk.
+            new_line = None
             continue
-        if line.startswith("-") and not line.startswith("---"):
+        if head == "@":
+            if line.startswith("@@"):
+                match = HUNK_RE.match(line)
+                if match:
+                    new_line = int(match.group(1))
             continue
-        if line.startswith("\\"):
+        if head == "-" or head == "\\" or added is None or new_line is None:
             continue
         new_line += 1
     return file_lines
 
 
-def build_defs_for_file(path: Path) -> list[dict]:
-    try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        return []
-    try:
-        tree = ast.parse(text)
-    except SyntaxError:
-        return []
-    items = []
+def items_from_tree(tree: ast.AST) -> tuple[list[dict], list[dict]]:
+    """Functions/classes and SQL snippets of a module, collected in one ast.walk."""
+    defs: list[dict] = []
+    queries: list[dict] = []
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
-            end = getattr(node, "end_lineno", node.lineno)
-            items.append(
+            defs.append(
                 {
                     "name": node.name,
                     "line": node.lineno,
-                    "end_line": end,
+                    "end_line": getattr(node, "end_lineno", node.lineno),
                     "kind": "function" if isinstance(node, ast.FunctionDef) else "class",
                 }
             )
-    return items
+        elif isinstance(node, ast.Call):
+            snippet = _sql_from_call(node)
+            if snippet is not None:
+                queries.append(
+                    {"name": snippet, "line": getattr(node, "lineno", 1), "kind": "query"}
+                )
+    return defs, queries
+
+
+_ITEMS_CACHE: dict[tuple[Path, int], tuple[list[dict], list[dict]]] = {}
 
 
-def build_queries_for_file(path: Path) -> list[dict]:
+def build_items_for_file(path: Path) -> tuple[list[dict], list[dict]]:
+    """(defs, queries) for a Python file: one read, one parse, memoized on mtime."""
     try:
-        text = path.read_text(encoding="utf-8")
-    except Exception:
-        return []
-    queries = []
-    for snippet, line in extract_sql_strings(text):
-        queries.append({"name": snippet, "line": line, "kind": "query"})
-    return queries
+        key = (path, path.stat().st_mtime_ns)
+    except OSError:
+        return [], []
+    cached = _ITEMS_CACHE.get(key)
+    if cached is None:
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, SyntaxError, ValueError):
+            tree = None
+        cached = items_from_tree(tree) if tree is not None else ([], [])
+        _ITEMS_CACHE[key] = cached
+    return cached
 
 
 def detect_cli_changes(files: list[str], changed_lines: dict[str, set[int]]) -> list[str]:
@@ -315,32 +327,26 @@ def detect_changed_items(
                 matched.append(item)
 
     # detect changed functions/classes missing in the map
+    mapped = {(item.kind, item.name, item.file) for item in map_items}
     for file in changed_files:
         if not is_test_item_file(file):
             continue
         path = ROOT / file
         if not path.exists() or path.suffix != ".py":
             continue
-        defs = build_defs_for_file(path)
-        queries = build_queries_for_file(path)
+        defs, queries = build_items_for_file(path)
         lines = changed_lines.get(file, set())
         for d in defs:
-            if not any(line in lines for line in range(d["line"], d["end_line"] + 1)):
+            if lines.isdisjoint(range(d["line"], d["end_line"] + 1)):
                 continue
-            if not any(
-                item.kind == d["kind"] and item.name == d["name"] and item.file == file
-                for item in map_items
-            ):
+            if (d["kind"], d["name"], file) not in mapped:
                 missing.append(
                     {"file": file, "reason": f"{d['kind']} '{d['name']}' missing from coverage_map"}
                 )
         for q in queries:
             if q["line"] not in lines:
                 continue
-            if not any(
-                item.kind == "query" and item.name == q["name"] and item.file == file
-                for item in map_items
-            ):
+            if ("query", q["name"], file) not in mapped:
                 missing.append({"file": file, "reason": f"query '{q['name']}' missing from coverage_map"})
 
     tests = []
@@ -363,7 +369,7 @@ def main() -> int:
     args = parser.parse_args()
 
     diff_text = git_diff(args.base, args.head)
-    changed_files = git_changed_files(args.base, args.head)
+    changed_files = changed_files_from_diff(diff_text)
     changed_defs = extract_added_defs(diff_text)
     changed_lines = parse_changed_lines(diff_text)
     coverage = load_coverage_map(ROOT / args.map)
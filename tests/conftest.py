@@ -1,8 +1,33 @@
 from __future__ import annotations
 
+import sqlite3
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from abletools_catalog_db import create_schema  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def base_conn() -> Iterator[sqlite3.Connection]:
+    """In-memory catalog DB with the schema created once per test module."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def conn(base_conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """The shared schema DB; everything a test writes is rolled back afterwards."""
+    base_conn.execute("SAVEPOINT test")
+    yield base_conn
+    base_conn.execute("ROLLBACK TO test")
+    base_conn.execute("RELEASE test")
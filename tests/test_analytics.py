@@ -21,380 +21,299 @@ from abletools_analytics import (
     compute_quality_issues,
     compute_unreferenced_audio_by_path,
 )
-from abletools_catalog_db import create_schema
-
-
-def test_compute_set_health() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO doc_complexity (scope, path, tracks_total, clips_total, devices_count, samples_count, missing_refs_count, computed_at) "
-            "VALUES ('live_recordings', '/tmp/set.als', 2, 3, 5, 10, 1, 1)"
-        )
-        compute_set_health(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT health_score, missing_refs_count, devices_count, samples_count FROM set_health WHERE path = ?",
-            ("/tmp/set.als",),
-        ).fetchone()
-        assert row is not None
-        score, missing, devices, samples = row
-        assert missing == 1
-        assert devices == 5
-        assert samples == 10
-        assert score < 100
-    finally:
-        conn.close()
-
-
-def test_compute_audio_footprint() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('/tmp/a.wav', '.wav', 100, 1, 'media', 1)"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('/tmp/b.wav', '.wav', 200, 1, 'media', 1)"
-        )
-        conn.execute(
-            "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) VALUES ('/tmp/set.als', '/tmp/a.wav', 1)"
-        )
-        compute_audio_footprint(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT total_media_bytes, referenced_media_bytes, unreferenced_media_bytes FROM audio_footprint WHERE scope = ?",
-            ("live_recordings",),
-        ).fetchone()
-        assert row == (300, 100, 200)
-    finally:
-        conn.close()
-
-
-def test_compute_missing_refs_by_path() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO refs_graph (src, src_kind, ref_kind, ref_path, scanned_at, ref_exists) "
-            "VALUES ('/tmp/set.als', 'set', 'sample', '/Volumes/Drive/Samples/kick.wav', 1, 0)"
-        )
-        conn.execute(
-            "INSERT INTO refs_graph (src, src_kind, ref_kind, ref_path, scanned_at, ref_exists) "
-            "VALUES ('/tmp/set.als', 'set', 'sample', '/Volumes/Drive/Samples/snare.wav', 1, 0)"
-        )
-        compute_missing_refs_by_path(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT missing_count FROM missing_refs_by_path WHERE ref_parent = ?",
-            ("/Volumes/Drive/Samples",),
-        ).fetchone()
-        assert row == (2,)
-    finally:
-        conn.close()
-
-
-def test_compute_device_chains() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.executemany(
-            "INSERT INTO doc_device_sequence (doc_path, ord, device_name) VALUES (?, ?, ?)",
-            [
-                ("/tmp/set.als", 0, "EQ Eight"),
-                ("/tmp/set.als", 1, "Compressor"),
-                ("/tmp/set.als", 2, "Reverb"),
-            ],
-        )
-        compute_device_chains(conn, "live_recordings", 2)
-        row = conn.execute(
-            "SELECT usage_count FROM device_chain_stats WHERE chain = ? AND chain_len = ?",
-            ("EQ Eight > Compressor", 2),
-        ).fetchone()
-        assert row == (1,)
-    finally:
-        conn.close()
-
-
-def test_compute_set_storage_summary() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/A.als', '.als', 100, 1, 'ableton_doc', 1)"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Backup/Sets/B.als', '.als', 200, 1, 'ableton_doc', 1)"
-        )
-        compute_set_storage_summary(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT total_sets, total_set_bytes, non_backup_sets, non_backup_bytes "
-            "FROM set_storage_summary WHERE scope = ?",
-            ("live_recordings",),
-        ).fetchone()
-        assert row == (2, 300, 1, 100)
-    finally:
-        conn.close()
-
-
-def test_compute_set_activity_stats() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        now_ts = int(time.time())
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
-            (now_ts,),
-        )
-        compute_set_activity_stats(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT set_count FROM set_activity_stats "
-            "WHERE scope = ? AND window_days = 30",
-            ("live_recordings",),
-        ).fetchone()
-        assert row == (1,)
-    finally:
-        conn.close()
-
-
-def test_compute_set_size_top() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/A.als', '.als', 100, 1, 'ableton_doc', 1)"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/B.als', '.als', 300, 1, 'ableton_doc', 1)"
-        )
-        compute_set_size_top(conn, "live_recordings", limit=1)
-        row = conn.execute(
-            "SELECT path, size_bytes FROM set_size_top WHERE scope = ?",
-            ("live_recordings",),
-        ).fetchone()
-        assert row == ("Sets/B.als", 300)
-    finally:
-        conn.close()
-
-
-def test_compute_unreferenced_audio_by_path() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
-            "VALUES ('Audio/a.wav', '.wav', 100, 1, 'media', 1, '/root/Audio', 'a.wav')"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
-            "VALUES ('Audio/b.wav', '.wav', 200, 1, 'media', 1, '/root/Audio', 'b.wav')"
-        )
-        conn.execute(
-            "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) "
-            "VALUES ('Sets/A.als', '/root/Audio/a.wav', 1)"
-        )
-        compute_unreferenced_audio_by_path(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT file_count, total_bytes FROM unreferenced_audio_by_path "
-            "WHERE scope = ? AND parent_path = ?",
-            ("live_recordings", "/root/Audio"),
-        ).fetchone()
-        assert row == (1, 200)
-    finally:
-        conn.close()
-
-
-def test_compute_quality_issues() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO doc_complexity "
-            "(scope, path, tracks_total, clips_total, devices_count, samples_count, missing_refs_count, computed_at) "
-            "VALUES ('live_recordings', 'Sets/A.als', 0, 0, 2, 3, 1, 1)"
-        )
-        compute_quality_issues(conn, "live_recordings")
-        rows = conn.execute(
-            "SELECT issue FROM quality_issues WHERE scope = ? AND path = ?",
-            ("live_recordings", "Sets/A.als"),
-        ).fetchall()
-        issues = {row[0] for row in rows}
-        assert {"zero_tracks", "zero_clips", "missing_refs"}.issubset(issues)
-    finally:
-        conn.close()
-
-
-def test_compute_device_usage_recent() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        now_ts = int(time.time())
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
-            (now_ts,),
-        )
-        conn.execute(
-            "INSERT INTO doc_device_hints (doc_path, device_hint) "
-            "VALUES ('Sets/A.als', 'EQ Eight')"
-        )
-        compute_device_usage_recent(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT usage_count FROM device_usage_recent "
-            "WHERE scope = ? AND window_days = 30 AND device_name = ?",
-            ("live_recordings", "EQ Eight"),
-        ).fetchone()
-        assert row == (1,)
-    finally:
-        conn.close()
-
-
-def test_compute_set_activity_delta() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        now_ts = int(time.time())
-        past_ts = now_ts - (40 * 86400)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
-            (now_ts,),
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('Sets/B.als', '.als', 50, ?, 'ableton_doc', 1)",
-            (past_ts,),
-        )
-        compute_set_activity_delta(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT current_bytes, previous_bytes, delta_bytes "
-            "FROM set_activity_delta WHERE scope = ? AND window_days = 30",
-            ("live_recordings",),
-        ).fetchone()
-        assert row is not None
-        assert row[0] >= 100
-    finally:
-        conn.close()
-
-
-def test_compute_set_growth_by_parent() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        now_ts = int(time.time())
-        past_ts = now_ts - (40 * 86400)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent) "
-            "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1, '/root/Sets')",
-            (now_ts,),
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent) "
-            "VALUES ('Sets/B.als', '.als', 50, ?, 'ableton_doc', 1, '/root/Sets')",
-            (past_ts,),
-        )
-        compute_set_growth_by_parent(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT delta_bytes FROM set_growth_by_parent "
-            "WHERE scope = ? AND window_days = 30 AND parent_path = ?",
-            ("live_recordings", "/root/Sets"),
-        ).fetchone()
-        assert row is not None
-    finally:
-        conn.close()
-
-
-def test_compute_sample_duplicate_groups() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, sha1) "
-            "VALUES ('Audio/a.wav', '.wav', 100, 1, 'media', 1, 'abc')"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, sha1) "
-            "VALUES ('Audio/b.wav', '.wav', 100, 1, 'media', 1, 'abc')"
-        )
-        compute_sample_duplicate_groups(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT file_count FROM sample_duplicate_groups WHERE scope = ? AND sha1 = ?",
-            ("live_recordings", "abc"),
-        ).fetchone()
-        assert row == (2,)
-    finally:
-        conn.close()
-
-
-def test_compute_cold_samples() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        now_ts = int(time.time())
-        old_ts = now_ts - (200 * 86400)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
-            "VALUES ('/root/Audio/a.wav', '.wav', 100, ?, 'media', 1, '/root/Audio', 'a.wav')",
-            (old_ts,),
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('/root/Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
-            (old_ts,),
-        )
-        conn.execute(
-            "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) "
-            "VALUES ('/root/Sets/A.als', '/root/Audio/a.wav', 1)"
-        )
-        compute_cold_samples(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT sample_count FROM cold_samples_summary "
-            "WHERE scope = ? AND cutoff_days = 90",
-            ("live_recordings",),
-        ).fetchone()
-        assert row is not None
-        assert row[0] >= 1
-    finally:
-        conn.close()
-
-
-def test_compute_routing_anomalies() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO ableton_routing (doc_path, track_index, direction, value, meta_json) "
-            "VALUES ('/root/Sets/A.als', 0, 'input', '', '{}')"
-        )
-        compute_routing_anomalies(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT issue_value FROM routing_anomalies WHERE scope = ? AND path = ?",
-            ("live_recordings", "/root/Sets/A.als"),
-        ).fetchone()
-        assert row == (1,)
-    finally:
-        conn.close()
-
-
-def test_compute_device_pair_anomalies() -> None:
-    conn = sqlite3.connect(":memory:")
-    try:
-        create_schema(conn)
-        conn.execute(
-            "INSERT INTO device_cooccurrence (scope, device_a, device_b, usage_count, computed_at) "
-            "VALUES ('live_recordings', 'EQ Eight', 'Compressor', 1, 1)"
-        )
-        compute_device_pair_anomalies(conn, "live_recordings")
-        row = conn.execute(
-            "SELECT usage_count FROM device_pair_anomalies "
-            "WHERE scope = ? AND device_a = ? AND device_b = ?",
-            ("live_recordings", "EQ Eight", "Compressor"),
-        ).fetchone()
-        assert row == (1,)
-    finally:
-        conn.close()
+
+
+def test_compute_set_health(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO doc_complexity (scope, path, tracks_total, clips_total, devices_count, samples_count, missing_refs_count, computed_at) "
+        "VALUES ('live_recordings', '/tmp/set.als', 2, 3, 5, 10, 1, 1)"
+    )
+    compute_set_health(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT health_score, missing_refs_count, devices_count, samples_count FROM set_health WHERE path = ?",
+        ("/tmp/set.als",),
+    ).fetchone()
+    assert row is not None
+    score, missing, devices, samples = row
+    assert missing == 1
+    assert devices == 5
+    assert samples == 10
+    assert score < 100
+
+
+def test_compute_audio_footprint(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('/tmp/a.wav', '.wav', 100, 1, 'media', 1)"
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('/tmp/b.wav', '.wav', 200, 1, 'media', 1)"
+    )
+    conn.execute(
+        "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) VALUES ('/tmp/set.als', '/tmp/a.wav', 1)"
+    )
+    compute_audio_footprint(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT total_media_bytes, referenced_media_bytes, unreferenced_media_bytes FROM audio_footprint WHERE scope = ?",
+        ("live_recordings",),
+    ).fetchone()
+    assert row == (300, 100, 200)
+
+
+def test_compute_missing_refs_by_path(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO refs_graph (src, src_kind, ref_kind, ref_path, scanned_at, ref_exists) "
+        "VALUES ('/tmp/set.als', 'set', 'sample', '/Volumes/Drive/Samples/kick.wav', 1, 0)"
+    )
+    conn.execute(
+        "INSERT INTO refs_graph (src, src_kind, ref_kind, ref_path, scanned_at, ref_exists) "
+        "VALUES ('/tmp/set.als', 'set', 'sample', '/Volumes/Drive/Samples/snare.wav', 1, 0)"
+    )
+    compute_missing_refs_by_path(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT missing_count FROM missing_refs_by_path WHERE ref_parent = ?",
+        ("/Volumes/Drive/Samples",),
+    ).fetchone()
+    assert row == (2,)
+
+
+def test_compute_device_chains(conn: sqlite3.Connection) -> None:
+    conn.executemany(
+        "INSERT INTO doc_device_sequence (doc_path, ord, device_name) VALUES (?, ?, ?)",
+        [
+            ("/tmp/set.als", 0, "EQ Eight"),
+            ("/tmp/set.als", 1, "Compressor"),
+            ("/tmp/set.als", 2, "Reverb"),
+        ],
+    )
+    compute_device_chains(conn, "live_recordings", 2)
+    row = conn.execute(
+        "SELECT usage_count FROM device_chain_stats WHERE chain = ? AND chain_len = ?",
+        ("EQ Eight > Compressor", 2),
+    ).fetchone()
+    assert row == (1,)
+
+
+def test_compute_set_storage_summary(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/A.als', '.als', 100, 1, 'ableton_doc', 1)"
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Backup/Sets/B.als', '.als', 200, 1, 'ableton_doc', 1)"
+    )
+    compute_set_storage_summary(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT total_sets, total_set_bytes, non_backup_sets, non_backup_bytes "
+        "FROM set_storage_summary WHERE scope = ?",
+        ("live_recordings",),
+    ).fetchone()
+    assert row == (2, 300, 1, 100)
+
+
+def test_compute_set_activity_stats(conn: sqlite3.Connection) -> None:
+    now_ts = int(time.time())
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
+        (now_ts,),
+    )
+    compute_set_activity_stats(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT set_count FROM set_activity_stats "
+        "WHERE scope = ? AND window_days = 30",
+        ("live_recordings",),
+    ).fetchone()
+    assert row == (1,)
+
+
+def test_compute_set_size_top(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/A.als', '.als', 100, 1, 'ableton_doc', 1)"
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/B.als', '.als', 300, 1, 'ableton_doc', 1)"
+    )
+    compute_set_size_top(conn, "live_recordings", limit=1)
+    row = conn.execute(
+        "SELECT path, size_bytes FROM set_size_top WHERE scope = ?",
+        ("live_recordings",),
+    ).fetchone()
+    assert row == ("Sets/B.als", 300)
+
+
+def test_compute_unreferenced_audio_by_path(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
+        "VALUES ('Audio/a.wav', '.wav', 100, 1, 'media', 1, '/root/Audio', 'a.wav')"
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
+        "VALUES ('Audio/b.wav', '.wav', 200, 1, 'media', 1, '/root/Audio', 'b.wav')"
+    )
+    conn.execute(
+        "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) "
+        "VALUES ('Sets/A.als', '/root/Audio/a.wav', 1)"
+    )
+    compute_unreferenced_audio_by_path(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT file_count, total_bytes FROM unreferenced_audio_by_path "
+        "WHERE scope = ? AND parent_path = ?",
+        ("live_recordings", "/root/Audio"),
+    ).fetchone()
+    assert row == (1, 200)
+
+
+def test_compute_quality_issues(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO doc_complexity "
+        "(scope, path, tracks_total, clips_total, devices_count, samples_count, missing_refs_count, computed_at) "
+        "VALUES ('live_recordings', 'Sets/A.als', 0, 0, 2, 3, 1, 1)"
+    )
+    compute_quality_issues(conn, "live_recordings")
+    rows = conn.execute(
+        "SELECT issue FROM quality_issues WHERE scope = ? AND path = ?",
+        ("live_recordings", "Sets/A.als"),
+    ).fetchall()
+    issues = {row[0] for row in rows}
+    assert {"zero_tracks", "zero_clips", "missing_refs"}.issubset(issues)
+
+
+def test_compute_device_usage_recent(conn: sqlite3.Connection) -> None:
+    now_ts = int(time.time())
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
+        (now_ts,),
+    )
+    conn.execute(
+        "INSERT INTO doc_device_hints (doc_path, device_hint) "
+        "VALUES ('Sets/A.als', 'EQ Eight')"
+    )
+    compute_device_usage_recent(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT usage_count FROM device_usage_recent "
+        "WHERE scope = ? AND window_days = 30 AND device_name = ?",
+        ("live_recordings", "EQ Eight"),
+    ).fetchone()
+    assert row == (1,)
+
+
+def test_compute_set_activity_delta(conn: sqlite3.Connection) -> None:
+    now_ts = int(time.time())
+    past_ts = now_ts - (40 * 86400)
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
+        (now_ts,),
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('Sets/B.als', '.als', 50, ?, 'ableton_doc', 1)",
+        (past_ts,),
+    )
+    compute_set_activity_delta(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT current_bytes, previous_bytes, delta_bytes "
+        "FROM set_activity_delta WHERE scope = ? AND window_days = 30",
+        ("live_recordings",),
+    ).fetchone()
+    assert row is not None
+    assert row[0] >= 100
+
+
+def test_compute_set_growth_by_parent(conn: sqlite3.Connection) -> None:
+    now_ts = int(time.time())
+    past_ts = now_ts - (40 * 86400)
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent) "
+        "VALUES ('Sets/A.als', '.als', 100, ?, 'ableton_doc', 1, '/root/Sets')",
+        (now_ts,),
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent) "
+        "VALUES ('Sets/B.als', '.als', 50, ?, 'ableton_doc', 1, '/root/Sets')",
+        (past_ts,),
+    )
+    compute_set_growth_by_parent(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT delta_bytes FROM set_growth_by_parent "
+        "WHERE scope = ? AND window_days = 30 AND parent_path = ?",
+        ("live_recordings", "/root/Sets"),
+    ).fetchone()
+    assert row is not None
+
+
+def test_compute_sample_duplicate_groups(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, sha1) "
+        "VALUES ('Audio/a.wav', '.wav', 100, 1, 'media', 1, 'abc')"
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, sha1) "
+        "VALUES ('Audio/b.wav', '.wav', 100, 1, 'media', 1, 'abc')"
+    )
+    compute_sample_duplicate_groups(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT file_count FROM sample_duplicate_groups WHERE scope = ? AND sha1 = ?",
+        ("live_recordings", "abc"),
+    ).fetchone()
+    assert row == (2,)
+
+
+def test_compute_cold_samples(conn: sqlite3.Connection) -> None:
+    now_ts = int(time.time())
+    old_ts = now_ts - (200 * 86400)
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at, parent, name) "
+        "VALUES ('/root/Audio/a.wav', '.wav', 100, ?, 'media', 1, '/root/Audio', 'a.wav')",
+        (old_ts,),
+    )
+    conn.execute(
+        "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('/root/Sets/A.als', '.als', 100, ?, 'ableton_doc', 1)",
+        (old_ts,),
+    )
+    conn.execute(
+        "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) "
+        "VALUES ('/root/Sets/A.als', '/root/Audio/a.wav', 1)"
+    )
+    compute_cold_samples(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT sample_count FROM cold_samples_summary "
+        "WHERE scope = ? AND cutoff_days = 90",
+        ("live_recordings",),
+    ).fetchone()
+    assert row is not None
+    assert row[0] >= 1
+
+
+def test_compute_routing_anomalies(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO ableton_routing (doc_path, track_index, direction, value, meta_json) "
+        "VALUES ('/root/Sets/A.als', 0, 'input', '', '{}')"
+    )
+    compute_routing_anomalies(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT issue_value FROM routing_anomalies WHERE scope = ? AND path = ?",
+        ("live_recordings", "/root/Sets/A.als"),
+    ).fetchone()
+    assert row == (1,)
+
+
+def test_compute_device_pair_anomalies(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO device_cooccurrence (scope, device_a, device_b, usage_count, computed_at) "
+        "VALUES ('live_recordings', 'EQ Eight', 'Compressor', 1, 1)"
+    )
+    compute_device_pair_anomalies(conn, "live_recordings")
+    row = conn.execute(
+        "SELECT usage_count FROM device_pair_anomalies "
+        "WHERE scope = ? AND device_a = ? AND device_b = ?",
+        ("live_recordings", "EQ Eight", "Compressor"),
+    ).fetchone()
+    assert row == (1,)
@@ -1,93 +1,173 @@
 from __future__ import annotations
 
 import sqlite3
+from pathlib import Path
 
-from abletools_catalog_db import create_schema
+from abletools_catalog_db import (
+    create_catalog_fts,
+    create_schema,
+    ensure_file_index_columns,
+    ensure_query_indexes,
+    table_columns,
+)
 
 
-def _column_names(conn: sqlite3.Connection, table: str) -> set[str]:
-    return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+def test_schema_has_new_columns(conn: sqlite3.Connection) -> None:
+    cols = table_columns(conn, "file_index")
+    assert "path_hash" in cols
+    assert "audio_duration" in cols
+    assert "audio_codec" in cols
+    doc_cols = table_columns(conn, "ableton_docs")
+    assert "tempo" in doc_cols
 
 
-def test_schema_has_new_columns() -> None:
+def test_device_sequence_table_exists(conn: sqlite3.Connection) -> None:
+    cols = table_columns(conn, "doc_device_sequence")
+    assert "device_name" in cols
+
+
+def test_query_indexes_created_per_scope() -> None:
+    # ensure_query_indexes uses executescript, which commits; keep it off the shared conn.
     conn = sqlite3.connect(":memory:")
     try:
         create_schema(conn)
-        cols = _column_names(conn, "file_index")
-        assert "path_hash" in cols
-        assert "audio_duration" in cols
-        assert "audio_codec" in cols
-        doc_cols = _column_names(conn, "ableton_docs")
-        assert "tempo" in doc_cols
+        for scope in ("live_recordings", "user_library"):
+            ensure_query_indexes(conn, scope)
+        names = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        assert "idx_file_index_mtime" in names
+        assert "idx_refs_graph_missing_user_library" in names
+        plan = " ".join(
+            str(row[3])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT ref_path, COUNT(*), MIN(src) FROM refs_graph "
+                "WHERE ref_exists = 0 GROUP BY ref_path"
+            )
+        )
+        assert "idx_refs_graph_missing" in plan
     finally:
         conn.close()
 
 
-def test_device_sequence_table_exists() -> None:
+def test_catalog_docs_list_queries_use_indexes(conn: sqlite3.Connection) -> None:
+    plan = " ".join(
+        str(row[3])
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT path FROM catalog_docs "
+            "WHERE scope = 'live_recordings' ORDER BY scanned_at DESC LIMIT 500"
+        )
+    )
+    assert "idx_catalog_docs_scope_scanned" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_detail_count_queries_use_indexes() -> None:
     conn = sqlite3.connect(":memory:")
     try:
         create_schema(conn)
-        cols = _column_names(conn, "doc_device_sequence")
-        assert "device_name" in cols
+        ensure_query_indexes(conn, "live_recordings")
+        expected = {
+            "SELECT COUNT(*) FROM doc_sample_refs WHERE doc_path = ?": "COVERING INDEX",
+            "SELECT COUNT(*) FROM doc_device_hints WHERE doc_path = ?": "COVERING INDEX",
+            "SELECT COUNT(*) FROM refs_graph WHERE src = ? AND ref_exists = 0": (
+                "idx_refs_graph_src_missing"
+            ),
+        }
+        for sql, needle in expected.items():
+            plan = " ".join(
+                str(row[3]) for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", ("/a.als",))
+            )
+            assert needle in plan, plan
     finally:
         conn.close()
 
 
-def test_analytics_tables_exist() -> None:
-    conn = sqlite3.connect(":memory:")
+def test_catalog_fts_tracks_catalog_docs(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO catalog_docs (scope, path, scanned_at) VALUES (?, ?, 0)",
+        ("live_recordings", "/Music/DrumLoops/Kick Heavy.als"),
+    )
+    match = (
+        "SELECT path FROM catalog_docs WHERE path LIKE ?1 "
+        "AND rowid IN (SELECT rowid FROM catalog_fts WHERE path LIKE ?1)"
+    )
+    for term in ("kick", "loop", "ick", "C/DRUM", "y.a"):
+        assert conn.execute(match, (f"%{term}%",)).fetchall() == [
+            ("/Music/DrumLoops/Kick Heavy.als",)
+        ], term
+    assert conn.execute(match, ("%snare%",)).fetchall() == []
+    conn.execute("DELETE FROM catalog_docs")
+    assert conn.execute(match, ("%kick%",)).fetchall() == []
+
+
+def test_create_catalog_fts_replaces_word_token_index(tmp_path: Path) -> None:
+    conn = sqlite3.connect(tmp_path / "catalog.sqlite")
     try:
         create_schema(conn)
-        assert "catalog_docs" in {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
-        assert "device_cooccurrence" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "device_usage_recent" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "doc_complexity" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "library_growth" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "missing_refs_by_path" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "set_health" in {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
-        assert "audio_footprint" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "set_storage_summary" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "set_activity_stats" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "set_size_top" in {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
-        assert "unreferenced_audio_by_path" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "quality_issues" in {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
-        assert "set_activity_delta" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "set_growth_by_parent" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "sample_duplicate_groups" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "cold_samples_summary" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "cold_samples_by_path" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "routing_anomalies" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
-        assert "device_pair_anomalies" in {
-            row[0] for row in conn.execute("SELECT name FROM sqlite_master")
-        }
+        conn.executescript(
+            """
+            DROP TABLE catalog_fts;
+            CREATE VIRTUAL TABLE catalog_fts USING fts5(
+                path, content='catalog_docs', content_rowid='rowid'
+            );
+            INSERT INTO catalog_docs (scope, path, scanned_at)
+                VALUES ('live_recordings', '/Music/DrumLoops/Kick.als', 0);
+            """
+        )
+        assert create_catalog_fts(conn)
+        rows = conn.execute(
+            "SELECT rowid FROM catalog_fts WHERE path LIKE '%loop%'"
+        ).fetchall()
+        assert len(rows) == 1
     finally:
         conn.close()
+
+
+def test_scope_views_union_scopes(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT INTO ableton_docs_user_library (path, ext, kind, scanned_at, tracks_total) "
+        "VALUES ('/u.als', '.als', 'ableton_doc', 1, 0)"
+    )
+    rows = conn.execute("SELECT scope, path FROM v_ableton_docs_all").fetchall()
+    assert rows == [("user_library", "/u.als")]
+    assert conn.execute("SELECT COUNT(*) FROM v_file_index_all").fetchone()[0] == 0
+
+
+def test_analytics_tables_exist(conn: sqlite3.Connection) -> None:
+    names = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")
+    }
+    expected = {
+        "catalog_docs",
+        "device_cooccurrence",
+        "device_usage_recent",
+        "doc_complexity",
+        "library_growth",
+        "missing_refs_by_path",
+        "set_health",
+        "audio_footprint",
+        "set_storage_summary",
+        "set_activity_stats",
+        "set_size_top",
+        "unreferenced_audio_by_path",
+        "quality_issues",
+        "set_activity_delta",
+        "set_growth_by_parent",
+        "sample_duplicate_groups",
+        "cold_samples_summary",
+        "cold_samples_by_path",
+        "routing_anomalies",
+        "device_pair_anomalies",
+    }
+    assert expected <= names, expected - names
+
+
+def test_ensure_file_index_columns_migrates_legacy_table(conn: sqlite3.Connection) -> None:
+    conn.execute("CREATE TABLE legacy_index (path TEXT PRIMARY KEY, ext TEXT)")
+    ensure_file_index_columns(conn, "legacy_index")
+    cols = table_columns(conn, "legacy_index")
+    assert {"path", "path_hash", "audio_codec"} <= cols
+    ensure_file_index_columns(conn, "legacy_index")
+    assert table_columns(conn, "legacy_index") == cols
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import sqlite3
+import zipfile
+from collections.abc import Iterator
 from pathlib import Path
 
 from abletools_catalog_db import create_schema
@@ -9,6 +11,7 @@ from abletools_catalog_ops import (
     cleanup_catalog_dir,
     prune_db_file_index,
     prune_file_index_jsonl,
+    prune_file_index_rows,
 )
 
 
@@ -44,26 +47,44 @@ def test_backup_files_zips_and_cleans(tmp_path: Path) -> None:
     root = tmp_path / "root"
     root.mkdir()
     f1 = root / "set.als"
-    f2 = root / "song.als"
     f1.write_text("data", encoding="utf-8")
-    f2.write_text("data", encoding="utf-8")
+    (root / "Samples").mkdir()
+    f2 = root / "Samples" / "kick.wav"
+    f2.write_text("data" * 100, encoding="utf-8")
 
     dest = tmp_path / "dest"
     copied, skipped, archive = backup_files(
-        [f1, f2],
+        [f1, f2, f1],
         dest,
         root,
         "sets",
         timestamp="20260101_000000",
     )
     assert copied == 2
-    assert skipped == 0
+    assert skipped == 1
     assert archive
     assert archive.exists()
+    with zipfile.ZipFile(archive) as zf:
+        info = {item.filename: item.compress_type for item in zf.infolist()}
+    assert info == {"set.als": zipfile.ZIP_STORED, "Samples/kick.wav": zipfile.ZIP_DEFLATED}
     folder = dest / "Abletools Backup" / "sets_20260101_000000"
     assert not folder.exists()
 
 
+def test_backup_files_removes_partial_archive(tmp_path: Path) -> None:
+    src = tmp_path / "set.als"
+    src.write_text("data", encoding="utf-8")
+
+    def _paths() -> Iterator[Path]:
+        yield src
+        raise OSError("volume went away")
+
+    dest = tmp_path / "dest"
+    result = backup_files(_paths(), dest, tmp_path, "sets", timestamp="20260101_000000")
+    assert result == (0, 0, None)
+    assert list((dest / "Abletools Backup").iterdir()) == []
+
+
 def test_prune_file_index_jsonl(tmp_path: Path) -> None:
     catalog = tmp_path / ".abletools_catalog"
     catalog.mkdir()
@@ -88,27 +109,27 @@ def test_prune_file_index_jsonl(tmp_path: Path) -> None:
     assert "\"c.txt\"" not in contents
 
 
-def test_prune_db_file_index(tmp_path: Path) -> None:
+def test_prune_file_index_rows(tmp_path: Path) -> None:
     db_path = tmp_path / "catalog.sqlite"
     conn = sqlite3.connect(db_path)
     try:
         create_schema(conn)
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('/tmp/a.als', '.als', 1, 1, 'ableton_doc', 1)"
-        )
-        conn.execute(
-            "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
-            "VALUES ('/tmp/b.txt', '.txt', 1, 1, 'other', 1)"
-        )
-        conn.commit()
-    finally:
-        conn.close()
-    removed, _ = prune_db_file_index(db_path)
-    assert removed == 1
-    conn = sqlite3.connect(db_path)
-    try:
-        count = conn.execute("SELECT COUNT(*) FROM file_index").fetchone()[0]
+        with conn:
+            conn.executemany(
+                "INSERT INTO file_index (path, ext, size, mtime, kind, scanned_at) "
+                "VALUES (?, ?, 1, 1, ?, 1)",
+                [
+                    ("/tmp/a.als", ".als", "ableton_doc"),
+                    ("/tmp/b.txt", ".txt", "other"),
+                ],
+            )
+            conn.execute(
+                "INSERT INTO file_index_user_library (path, ext, size, mtime, kind, scanned_at) "
+                "VALUES ('/u/c.txt', '.txt', 1, 1, 'other', 1)"
+            )
+        assert prune_file_index_rows(conn) == 2
+        assert conn.execute("SELECT COUNT(*) FROM file_index").fetchone()[0] == 1
     finally:
         conn.close()
-    assert count == 1
+    assert prune_db_file_index(db_path) == (0, 0)
+    assert prune_db_file_index(tmp_path / "missing.sqlite") == (0, 0)
@@ -58,3 +58,82 @@ def test_detect_cli_changes(tmp_path: Path) -> None:
         assert "./scripts/test_full_scan.sh" in tests
     finally:
         detect.ROOT = original_root
+
+
+def test_detect_changed_items_reports_unmapped_defs_and_queries(tmp_path: Path) -> None:
+    original_root = detect.ROOT
+    try:
+        detect.ROOT = tmp_path
+        (tmp_path / "abletools_demo.py").write_text(
+            "def mapped():\n"
+            "    return 1\n"
+            "def fresh(conn):\n"
+            "    conn.execute(\"SELECT name FROM demo\")\n",
+            encoding="utf-8",
+        )
+        items = [detect.CoverageItem("function", "mapped", "abletools_demo.py", 1, ["t1"])]
+        result = detect.detect_changed_items(
+            items, ["abletools_demo.py"], set(), {"abletools_demo.py": {1, 3, 4}}
+        )
+    finally:
+        detect.ROOT = original_root
+    assert result["tests"] == ["t1"]
+    assert [m["reason"] for m in result["missing"]] == [
+        "function 'fresh' missing from coverage_map",
+        "query 'SELECT name FROM demo' missing from coverage_map",
+    ]
+
+
+def test_build_items_for_file_collects_defs_and_queries(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_text(
+        "class Box:\n"
+        "    def load(self, conn):\n"
+        "        return conn.execute(\"SELECT x FROM box\")\n",
+        encoding="utf-8",
+    )
+    defs, queries = detect.build_items_for_file(path)
+    assert [(d["kind"], d["name"]) for d in defs] == [("class", "Box"), ("function", "load")]
+    assert queries == [{"name": "SELECT x FROM box", "line": 3, "kind": "query"}]
+    assert detect.build_items_for_file(path) is detect.build_items_for_file(path)
+
+
+def test_parse_changed_lines_multiple_files_and_edge_lines() -> None:
+    diff_text = (
+        "diff --git a/a.py b/a.py\n"
+        "--- a/a.py\n"
+        "+++ b/a.py\n"
+        "@@ -1,3 +1,3 @@\n"
+        " keep\n"
+        "--- removed comment line\n"
+        "+++ added line starting with ++\n"
+        " keep\n"
+        "\\ No newline at end of file\n"
+        "diff --git a/b.py b/b.py\n"
+        "new file mode 100644\n"
+        "--- /dev/null\n"
+        "+++ b/b.py\n"
+        "@@ -0,0 +5 @@\n"
+        "+x = 1\n"
+    )
+    lines = detect.parse_changed_lines(diff_text)
+    assert lines == {"a.py": {2}, "b.py": {5}}
+
+
+def test_changed_files_from_raw_diff() -> None:
+    diff_text = (
+        ":100644 100644 1111111 2222222 M\tabletools_scan.py\n"
+        ":100644 000000 3333333 0000000 D\told.py\n"
+        ":100644 100644 4444444 5555555 R090\tbefore.py\tafter.py\n"
+        "\n"
+        "diff --git a/abletools_scan.py b/abletools_scan.py\n"
+        "+++ b/abletools_scan.py\n"
+        "@@ -1,0 +2 @@\n"
+        "+:100644 not a raw line\n"
+    )
+    assert detect.changed_files_from_diff(diff_text) == [
+        "abletools_scan.py",
+        "old.py",
+        "after.py",
+    ]
+    assert detect.parse_changed_lines(diff_text) == {"abletools_scan.py": {2}}
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from abletools_catalog_db import create_schema
+from abletools_core import (
+    CatalogService,
+    ScriptWorker,
+    SQLiteConnectionPool,
+    dashboard_extras,
+    db_file_signature,
+    ensure_wal_mode,
+)
+
+
+def _make_db(tmp_path: Path) -> Path:
+    db_path = tmp_path / "catalog.sqlite"
+    conn = sqlite3.connect(db_path)
+    try:
+        create_schema(conn)
+        conn.commit()
+    finally:
+        conn.close()
+    return db_path
+
+
+def test_pool_reuses_readonly_connection(tmp_path: Path) -> None:
+    db_path = _make_db(tmp_path)
+    pool = SQLiteConnectionPool()
+    with pool.acquire(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        assert conn.isolation_level is None
+        assert conn.execute("SELECT COUNT(*) FROM file_index").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM file_index")
+        first = conn
+    with pool.acquire(db_path) as conn:
+        assert conn is first
+        assert conn.row_factory is None
+    pool.invalidate()
+
+
+def test_pool_invalidate_drops_checked_out_connection(tmp_path: Path) -> None:
+    db_path = _make_db(tmp_path)
+    pool = SQLiteConnectionPool()
+    with pool.acquire(db_path) as conn:
+        first = conn
+        pool.invalidate()
+    assert pool.generation == 1
+    with pool.acquire(db_path) as conn:
+        assert conn is not first
+    pool.invalidate()
+
+
+def test_script_worker_runs_scripts_in_one_process(tmp_path: Path) -> None:
+    db_path = _make_db(tmp_path)
+    abletools_dir = Path(__file__).resolve().parents[1]
+    worker = ScriptWorker(abletools_dir)
+    try:
+        worker.start()
+        assert worker._proc is not None
+        pid = worker._proc.pid
+        proc = worker.run(abletools_dir / "abletools_maintenance.py", [str(db_path)])
+        assert proc.returncode == 0
+        assert worker._proc.pid == pid
+        proc = worker.run(
+            abletools_dir / "abletools_maintenance.py", [str(tmp_path / "missing.sqlite")]
+        )
+        assert proc.returncode == 1
+        assert "DB not found" in proc.stderr
+        assert worker._proc is not None and worker._proc.pid == pid
+    finally:
+        worker.close()
+
+
+def test_script_worker_does_not_rerun_job_after_worker_dies(tmp_path: Path) -> None:
+    runs = tmp_path / "runs.txt"
+    (tmp_path / "abletools_worker.py").write_text(
+        "import sys\n"
+        "sys.stdin.readline()\n"
+        f"open({str(runs)!r}, 'a').write('run\\n')\n"
+        "sys.exit(3)\n",
+        encoding="utf-8",
+    )
+    script = tmp_path / "abletools_job.py"
+    script.write_text("", encoding="utf-8")
+    worker = ScriptWorker(tmp_path)
+    try:
+        proc = worker.run(script, ["--overwrite"])
+    finally:
+        worker.close()
+    assert proc.returncode == 1
+    assert "abletools_job.py" in proc.stderr
+    assert runs.read_text(encoding="utf-8") == "run\n"
+
+
+def test_ensure_wal_mode_converts_rollback_journal(tmp_path: Path) -> None:
+    db_path = tmp_path / "plain.sqlite"
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+    finally:
+        conn.close()
+    ensure_wal_mode(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_script_worker_run_shared_joins_inflight_job(tmp_path: Path) -> None:
+    db_path = _make_db(tmp_path)
+    abletools_dir = Path(__file__).resolve().parents[1]
+    script = abletools_dir / "abletools_maintenance.py"
+    worker = ScriptWorker(abletools_dir)
+    calls: list[list[str]] = []
+    run = worker.run
+
+    def _slow_run(script: Path, args: list[str]):
+        calls.append(args)
+        time.sleep(0.2)
+        return run(script, args)
+
+    worker.run = _slow_run  # type: ignore[method-assign]
+    results = []
+    try:
+        threads = [
+            threading.Thread(target=lambda: results.append(worker.run_shared(script, [str(db_path)])))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        worker.close()
+    assert len(calls) == 1
+    assert [proc.returncode for proc in results] == [0, 0, 0]
+
+
+def test_catalog_service_reads_through_readonly_wal_connection(tmp_path: Path) -> None:
+    db_path = tmp_path / "abletools_catalog.sqlite"
+    conn = sqlite3.connect(db_path)
+    try:
+        create_schema(conn)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.execute(
+            "INSERT INTO catalog_docs (scope, path, ext, scanned_at) VALUES (?, ?, ?, 1)",
+            ("live_recordings", "/sets/Song.als", ".als"),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    catalog = CatalogService(tmp_path)
+    rows = catalog.query_catalog("live_recordings")
+    assert [row["name"] for row in rows] == ["Song.als"]
+    with catalog._connect() as first:
+        pass
+    with catalog._connect() as conn:
+        assert conn is first
+    catalog.invalidate()
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        conn.close()
+
+
+def test_db_file_signature_changes_on_external_commit(tmp_path: Path) -> None:
+    db_path = _make_db(tmp_path)
+    ensure_wal_mode(db_path)
+    before = db_file_signature(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "INSERT INTO catalog_docs (scope, path, ext, scanned_at) VALUES ('live_recordings', '/a.als', '.als', 1)"
+        )
+        conn.commit()
+        assert db_file_signature(db_path) != before
+    finally:
+        conn.close()
+    assert db_file_signature(None) == ()
+
+
+def test_dashboard_extras_reads_all_lists_on_one_connection() -> None:
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.executemany(
+        "INSERT INTO device_usage (scope, device_name, usage_count, computed_at) VALUES (?, ?, ?, 0)",
+        [("live_recordings", "Reverb", 3), ("preferences", "Hidden", 9)],
+    )
+    conn.execute(
+        "INSERT INTO plugin_index (scope, path, name, vendor, scanned_at) "
+        "VALUES ('live_recordings', '/p/Serum.vst3', 'Serum', 'Xfer', 0)"
+    )
+    conn.execute(
+        "INSERT INTO missing_refs_by_path (scope, ref_parent, missing_count, computed_at) "
+        "VALUES ('live_recordings', '/samples', 2, 0)"
+    )
+    conn.execute("DROP TABLE device_chain_stats")
+    extras = dashboard_extras(conn)
+    conn.close()
+    assert extras == {
+        "devices": ["Reverb (3)"],
+        "plugins": ["Serum (Xfer, 1)"],
+        "chains": [],
+        "missing_paths": ["/samples (2)"],
+    }
+    assert dashboard_extras(None)["devices"] == []
@@ -3,7 +3,13 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from abletools_prefs import get_scan_root, load_plugin_payloads, parse_preferences, set_scan_root
+from abletools_prefs import (
+    get_scan_root,
+    load_plugin_payloads,
+    parse_preferences,
+    read_preference_values,
+    set_scan_root,
+)
 
 
 def test_parse_preferences_values(tmp_path: Path) -> None:
@@ -13,6 +19,17 @@ def test_parse_preferences_values(tmp_path: Path) -> None:
     assert data["values"]["UserLibraryPath"][0] == "/Users/test/Music"
 
 
+def test_read_preference_values_matches_full_parse(tmp_path: Path) -> None:
+    prefs = tmp_path / "Preferences.cfg"
+    prefs.write_text(
+        "# comment\n  UserLibraryPath = /Users/test/Music\nUserLibraryPathOld=/old\n"
+        "ProjectPath\t/Users/test/Live\nUserLibraryPath=/Volumes/Ext\nnoise\n"
+    )
+    keys = ["UserLibraryPath", "ProjectPath", "PacksFolder"]
+    full = parse_preferences(prefs)["values"]
+    assert read_preference_values(prefs, keys) == {k: full[k] for k in keys if k in full}
+
+
 def test_load_plugin_payloads(tmp_path: Path) -> None:
     plugin_dir = tmp_path / "Plugins"
     bundle = plugin_dir / "TestFX.component"
@@ -49,7 +66,10 @@ def test_load_plugin_payloads(tmp_path: Path) -> None:
     payloads = load_plugin_payloads(cache_dir)
     assert payloads
     plugins = payloads[0]["plugins"]
-    assert any(p["name"] == "TestFX" for p in plugins)
+    plugin = next(p for p in plugins if p["name"] == "TestFX")
+    assert plugin["bundle_id"] == "com.example.testfx"
+    assert plugin["version"] == "1.2.3"
+    assert plugin["vendor"] == "ExampleCo"
 
 
 def test_scan_root_cache(tmp_path: Path) -> None:
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from ramify_core import (
+    _flip_ram_flags_tree,
+    flip_ram_flags,
+    iter_targets,
+    process_file,
+    process_files,
+    read_als_like,
+    write_als_like,
+)
+
+SET_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<Ableton MajorVersion="5">
+\t<AudioClip Id="0">
+\t\t<Ram Value="false" />
+\t\t<SampleRef><Ram Value="true" /></SampleRef>
+\t</AudioClip>
+\t<MidiClip Id="1"><Ram Value="false" /></MidiClip>
+\t<AudioClip Id="2"><Ram Value="FALSE" /></AudioClip>
+\t<AudioClip Id="3" />
+</Ableton>
+"""
+
+
+def test_flip_ram_flags_only_touches_audio_clips() -> None:
+    new_xml, clips, flips = flip_ram_flags(SET_XML)
+    assert (clips, flips) == (3, 2)
+    assert new_xml.startswith(b'<?xml version="1.0"')
+    root = ET.fromstring(new_xml)
+    assert [ram.get("Value") for ram in root.iter("Ram")] == ["true", "true", "false", "true"]
+
+
+def test_flip_ram_flags_returns_input_when_nothing_to_flip() -> None:
+    xml = b'<Ableton><AudioClip><Ram Value="true" /></AudioClip></Ableton>'
+    new_xml, clips, flips = flip_ram_flags(xml)
+    assert new_xml is xml
+    assert (clips, flips) == (1, 0)
+
+
+def test_flip_ram_flags_skips_sets_without_ram_tags() -> None:
+    xml = b'<Ableton><AudioClip Id="0" /><AudioClip>\n</AudioClip><AudioClipSlot /></Ableton>'
+    new_xml, clips, flips = flip_ram_flags(xml)
+    assert new_xml is xml
+    assert (clips, flips) == (2, 0)
+
+
+def test_flip_ram_flags_rejects_malformed_clip() -> None:
+    with pytest.raises(ValueError):
+        flip_ram_flags(b'<Ableton><AudioClip><Ram Value="false" /></Ableton>')
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        b'<Ableton><AudioClip Id="1"><Ram Value="false" /></AudioClip><Broken',
+        b'<Ableton><AudioClip Id="1"><Ram Value="false" /></AudioClip>',
+        b'<Ableton><AudioClip><Ram Value="false" /></AudioClip></Ableton></Extra>',
+    ],
+)
+def test_flip_ram_flags_rejects_truncated_sets(xml: bytes) -> None:
+    with pytest.raises(ValueError):
+        flip_ram_flags(xml)
+
+
+def test_process_file_round_trips_gzip_sets(tmp_path: Path) -> None:
+    path = tmp_path / "Song.als"
+    write_als_like(path, SET_XML)
+    assert read_als_like(path) == SET_XML
+    assert process_file(path, in_place=True, dry_run=False) == (3, 2, str(path))
+    assert b'<Ram Value="false"' not in read_als_like(path).split(b"<MidiClip")[0]
+    assert (tmp_path / "Song.als.bak").exists()
+    plain = tmp_path / "Plain.als"
+    plain.write_bytes(SET_XML)
+    assert read_als_like(plain) == SET_XML
+
+
+def test_flip_ram_flags_tree_fallback_handles_namespaces() -> None:
+    xml = (
+        b'<a:Ableton xmlns:a="urn:x"><a:AudioClip><a:Ram Value="false" />'
+        b'</a:AudioClip><a:Ram Value="false" /></a:Ableton>'
+    )
+    new_xml, clips, flips = _flip_ram_flags_tree(xml)
+    assert (clips, flips) == (1, 1)
+    assert new_xml.count(b'Value="true"') == 1
+
+
+def test_iter_targets_walks_sets_and_skips_other_files(tmp_path: Path) -> None:
+    (tmp_path / "A.als").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+    nested = tmp_path / "Project" / "Sub"
+    nested.mkdir(parents=True)
+    (nested / "B.ALC").write_bytes(b"")
+    (tmp_path / "Folder.als").mkdir()
+    found = sorted(p.relative_to(tmp_path).as_posix() for p in iter_targets(tmp_path, True))
+    assert found == ["A.als", "Project/Sub/B.ALC"]
+    assert [p.name for p in iter_targets(tmp_path, False)] == ["A.als"]
+    assert list(iter_targets(tmp_path / "A.als", False)) == [tmp_path / "A.als"]
+
+
+def test_write_als_like_is_deterministic(tmp_path: Path) -> None:
+    first = tmp_path / "a.als"
+    second = tmp_path / "b.als"
+    write_als_like(first, SET_XML)
+    write_als_like(second, SET_XML)
+    assert first.read_bytes() == second.read_bytes()
+
+
+def test_process_files_keeps_order_and_reports_failures(tmp_path: Path) -> None:
+    paths = []
+    for idx in range(3):
+        path = tmp_path / f"{idx}.als"
+        write_als_like(path, SET_XML)
+        paths.append(path)
+    broken = tmp_path / "broken.als"
+    broken.write_bytes(b"not xml")
+    paths.insert(1, broken)
+    results = list(process_files(paths, in_place=False, dry_run=True, workers=2))
+    assert [path for path, _ in results] == paths
+    assert isinstance(results[1][1], ValueError)
+    assert [result for _, result in results if not isinstance(result, Exception)] == [
+        (3, 2, None)
+    ] * 3
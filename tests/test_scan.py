@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import gzip
 import wave
 from pathlib import Path
 
+import pytest
+
 from abletools_scan import (
     analyze_audio,
     iter_ableton_xml_nodes,
     iter_files,
     parse_ableton_doc,
     parse_ableton_xml,
+    read_text_maybe_gzip,
 )
 
 
@@ -39,13 +43,13 @@ def test_analyze_audio_wav(tmp_path: Path) -> None:
         wf.setnchannels(2)
         wf.setsampwidth(2)
         wf.setframerate(48000)
-        wf.writeframes(b"\x00\x00" * 48000)
+        wf.writeframes(bytes(96000))
 
     info = analyze_audio(path, ".wav")
     assert info["audio_channels"] == 2
     assert info["audio_sample_rate"] == 48000
     assert info["audio_bit_depth"] == 16
-    assert info["audio_duration"]
+    assert info["audio_duration"] == 0.5
 
 
 def test_parse_ableton_xml_structured() -> None:
@@ -78,6 +82,18 @@ def test_iter_ableton_xml_nodes() -> None:
     assert any(node["tag"] == "AudioTrack" for node in nodes)
 
 
+def test_iter_ableton_xml_nodes_keeps_paths_after_detaching_siblings() -> None:
+    text = "<Ableton><A><B>one</B><B>two</B></A><A /></Ableton>"
+    nodes = [(n["path"], n["depth"], n["text"]) for n in iter_ableton_xml_nodes(text)]
+    assert nodes == [
+        ("Ableton/A/B", 3, "one"),
+        ("Ableton/A/B", 3, "two"),
+        ("Ableton/A", 2, ""),
+        ("Ableton/A", 2, ""),
+        ("Ableton", 1, ""),
+    ]
+
+
 def test_iter_files_skips_backup_dir(tmp_path: Path) -> None:
     backup_dir = tmp_path / "Backup"
     backup_dir.mkdir()
@@ -88,7 +104,7 @@ def test_iter_files_skips_backup_dir(tmp_path: Path) -> None:
     dir_updates: dict[str, int] = {}
     skipped_dirs = [0]
     paths = [
-        Path(entry.path).name
+        entry.name
         for entry in iter_files(tmp_path, dir_state, dir_updates, False, skipped_dirs)
     ]
     assert "keep.als" in paths
@@ -105,10 +121,25 @@ def test_iter_files_include_backups(tmp_path: Path) -> None:
     dir_updates: dict[str, int] = {}
     skipped_dirs = [0]
     paths = [
-        Path(entry.path).name
+        entry.name
         for entry in iter_files(
             tmp_path, dir_state, dir_updates, False, skipped_dirs, skip_backups=False
         )
     ]
     assert "keep.als" in paths
     assert "Set [2026-01-19 123456].als" in paths
+
+
+def test_read_text_maybe_gzip_handles_gzip_plain_and_empty(tmp_path: Path) -> None:
+    xml = '<Ableton><Tempo Value="120" /></Ableton>'
+    packed = tmp_path / "Song.als"
+    packed.write_bytes(gzip.compress(xml.encode("utf-8")))
+    plain = tmp_path / "Plain.als"
+    plain.write_text(xml, encoding="utf-8")
+    empty = tmp_path / "Empty.als"
+    empty.write_bytes(b"")
+    assert read_text_maybe_gzip(packed) == xml
+    assert read_text_maybe_gzip(plain) == xml
+    assert read_text_maybe_gzip(empty) == ""
+    with pytest.raises(RuntimeError):
+        read_text_maybe_gzip(packed, max_bytes=10)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from abletools_schema_validate import _load_schema, validate_json, validate_jsonl
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -18,22 +20,25 @@ def _fixture_path(schema_name: str) -> Path:
     return FIXTURE_DIR / f"{base}.jsonl"
 
 
-def test_schema_fixtures_cover_all() -> None:
-    schema_files = sorted(SCHEMA_DIR.glob("*.schema.json"))
-    assert schema_files, "no schemas found"
-    for schema in schema_files:
-        fixture = _fixture_path(schema.name)
-        assert fixture.exists(), f"missing fixture for {schema.name}"
-
-
-def test_schema_fixtures_validate() -> None:
-    schema_files = sorted(SCHEMA_DIR.glob("*.schema.json"))
-    for schema in schema_files:
-        fixture = _fixture_path(schema.name)
-        schema_obj = _load_schema(schema)
-        if fixture.suffix == ".jsonl":
-            errors, _ = validate_jsonl(fixture, schema_obj, max_errors=10)
-            assert not errors, f"{schema.name} fixture errors: {errors}"
-        else:
-            errors = validate_json(fixture, schema_obj)
-            assert not errors, f"{schema.name} fixture errors: {errors}"
+SCHEMA_FILES = sorted(SCHEMA_DIR.glob("*.schema.json"))
+
+
+def test_schema_files_found() -> None:
+    assert SCHEMA_FILES, "no schemas found"
+
+
+@pytest.mark.parametrize("schema", SCHEMA_FILES, ids=lambda path: path.name)
+def test_schema_fixture_exists(schema: Path) -> None:
+    fixture = _fixture_path(schema.name)
+    assert fixture.exists(), f"missing fixture for {schema.name}"
+
+
+@pytest.mark.parametrize("schema", SCHEMA_FILES, ids=lambda path: path.name)
+def test_schema_fixture_validates(schema: Path) -> None:
+    fixture = _fixture_path(schema.name)
+    schema_obj = _load_schema(schema)
+    if fixture.suffix == ".jsonl":
+        errors, _ = validate_jsonl(fixture, schema_obj, max_errors=10)
+    else:
+        errors = validate_json(fixture, schema_obj)
+    assert not errors, f"{schema.name} fixture errors: {errors}"
@@ -1,6 +1,28 @@
+import json
+import os
+import sqlite3
 from datetime import datetime
-
-from abletools_ui import format_mtime, is_backup_path, set_detail_fields, truncate_path
+from pathlib import Path
+from types import SimpleNamespace
+
+from abletools_catalog_db import create_schema
+from abletools_ui import (
+    PREFS_LIST_SQL,
+    PREFS_PATH_HINTS_SQL,
+    ZERO_TRACKS_AUDIT_LIMIT,
+    ZERO_TRACKS_SQL,
+    ScanPanel,
+    _path_name,
+    _safe_read_json,
+    catalog_detail_sql,
+    format_catalog_rows,
+    format_mtime,
+    fts_can_narrow,
+    is_backup_path,
+    join_keys_preview,
+    set_detail_fields,
+    truncate_path,
+)
 
 
 class DummyLabel:
@@ -11,6 +33,22 @@ class DummyLabel:
         self.text = text
 
 
+class DummyProgress(dict):
+    def stop(self) -> None:
+        pass
+
+    def configure(self, **options: object) -> None:
+        self.update(options)
+
+
+class DummyVar:
+    def __init__(self) -> None:
+        self.value = ""
+
+    def set(self, value: str) -> None:
+        self.value = value
+
+
 def test_truncate_path_no_change() -> None:
     assert truncate_path("short", max_len=10) == "short"
 
@@ -43,9 +81,166 @@ def test_set_detail_fields() -> None:
 
 def test_is_backup_path_backup_dir() -> None:
     assert is_backup_path("/Users/test/Music/Backup/Set.als")
+    assert is_backup_path("C:\\Music\\Backup\\Set.als")
+    assert not is_backup_path("/Users/test/Music/Backups/Set.als")
 
 
 def test_is_backup_path_timestamp_name() -> None:
     assert is_backup_path("/Users/test/Music/Set [2026-01-19 123456].als")
     assert is_backup_path("/Users/test/Music/Set [20260119_123456].als")
     assert not is_backup_path("/Users/test/Music/Set [notes].als")
+
+
+def test_join_keys_preview_sorted_and_bounded() -> None:
+    payload = {"b": 1, "a": 2, "c": 3}
+    assert join_keys_preview(payload, 120) == "a, b, c"
+    assert join_keys_preview(payload, 4) == "a, b"
+
+
+def test_join_keys_preview_large_or_non_dict() -> None:
+    payload = {f"key{idx:04d}": idx for idx in range(1000)}
+    preview = join_keys_preview(payload, 120)
+    assert preview.startswith("key0000, key0001")
+    assert len(preview) <= 120
+    assert join_keys_preview(["a", "b"], 120) == ""
+
+
+def test_safe_read_json_reuses_unchanged_file(tmp_path: Path) -> None:
+    path = tmp_path / "scan_summary.json"
+    path.write_text('{"files_scanned": 1}', encoding="utf-8")
+    first = _safe_read_json(path)
+    assert first == {"files_scanned": 1}
+    assert _safe_read_json(path) is first
+    path.write_text('{"files_scanned": 22}', encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert _safe_read_json(path) == {"files_scanned": 22}
+    assert _safe_read_json(tmp_path / "missing.json") == {}
+
+
+def test_format_catalog_rows_only_requested_columns() -> None:
+    row = ("/sets/My Song.als", ".als", 2048, 0, 4, None, 1, 0, 1, 0, "live_recordings")
+    (values,) = format_catalog_rows("live_recordings", [row], ["name", "size", "clips"])
+    assert values == {
+        "name": "My Song.als",
+        "size": "2.0 KB",
+        "clips": "",
+        "path_full": "/sets/My Song.als",
+        "scope": "live_recordings",
+    }
+    (pref,) = format_catalog_rows("preferences", [("options", "/prefs/Options.txt", 0, 0)], ["kind"])
+    assert pref == {"kind": "options", "scope": "preferences"}
+
+
+def test_path_name_handles_both_separators() -> None:
+    assert _path_name("/sets/My Song.als") == "My Song.als"
+    assert _path_name("C:\\Sets\\Other.als") == "Other.als"
+    assert _path_name("/sets/" + "x" * 80 + ".als") == truncate_path("x" * 80 + ".als")
+
+
+def test_fts_can_narrow_needs_three_literal_chars() -> None:
+    assert fts_can_narrow("ick")
+    assert fts_can_narrow("my song.als")
+    assert not fts_can_narrow("ab")
+    assert not fts_can_narrow("a_b%c")
+
+
+def test_catalog_detail_sql_returns_counts_in_one_row() -> None:
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.execute(
+        "INSERT INTO ableton_docs (path, ext, kind, scanned_at, tracks_total) "
+        "VALUES ('/s/A.als', '.als', 'set', 1, 4)"
+    )
+    conn.execute(
+        "INSERT INTO doc_sample_refs (doc_path, sample_path, scanned_at) VALUES "
+        "('/s/A.als', '/a.wav', 1), ('/s/A.als', '/b.wav', 1)"
+    )
+    conn.execute(
+        "INSERT INTO refs_graph (src, src_kind, ref_kind, ref_path, scanned_at, ref_exists) "
+        "VALUES ('/s/A.als', 'set', 'sample', '/a.wav', 1, 0)"
+    )
+    row = conn.execute(catalog_detail_sql("", True), ("/s/A.als",)).fetchone()
+    assert row[:2] == ("/s/A.als", 4)
+    assert row[4] == 0
+    assert row[-3:] == (2, 0, 1)
+    row = conn.execute(catalog_detail_sql("", False), ("/s/A.als",)).fetchone()
+    assert len(row) == 14
+    assert row[8:11] == (None, None, None)
+    conn.close()
+
+
+def test_prefs_list_sql_prefetches_newest_payloads() -> None:
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.executemany(
+        "INSERT INTO ableton_prefs (kind, source, mtime, scanned_at, payload_json) "
+        "VALUES ('cfg', ?, ?, 0, ?)",
+        [(f"/p/{idx}.cfg", idx, f'{{"n": {idx}}}') for idx in range(3)],
+    )
+    rows = conn.execute(PREFS_LIST_SQL, {"prefetch": 2}).fetchall()
+    assert [row[2] for row in rows] == [2, 1, 0]
+    assert [row[3] for row in rows] == ['{"n": 2}', '{"n": 1}', None]
+    conn.close()
+
+
+def test_prefs_path_hints_sql_returns_path_values() -> None:
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    payload = {
+        "values": {
+            "UserLibraryPath": ["/Users/me/Music/Ableton", "7"],
+            "PacksFolder": ["C:\\Packs"],
+            "pathless": ["/not/a/hint"],
+            "Tempo": ["/ignored"],
+            "ProjectPath": [3],
+        }
+    }
+    conn.execute(
+        "INSERT INTO ableton_prefs (kind, source, mtime, scanned_at, payload_json) "
+        "VALUES ('cfg', '/p/a.cfg', 1, 0, ?)",
+        (json.dumps(payload),),
+    )
+    rows = conn.execute(
+        PREFS_PATH_HINTS_SQL, {"kind": "cfg", "source": "/p/a.cfg"}
+    ).fetchall()
+    assert [row[0] for row in rows] == ["/Users/me/Music/Ableton", "C:\\Packs"]
+    conn.close()
+
+
+def test_handle_progress_line_averages_parallel_scopes() -> None:
+    panel = SimpleNamespace(
+        progress=DummyProgress(),
+        status_var=DummyVar(),
+        _progress_total=None,
+        _scope_progress=dict.fromkeys(("live_recordings", "user_library"), 0.0),
+    )
+    ScanPanel._handle_progress_line(panel, "[live_recordings] [progress] percent=50")
+    assert panel.progress["value"] == 25.0
+    ScanPanel._handle_progress_line(panel, "[user_library] [progress] scanned=3 total=4")
+    assert panel.progress["value"] == 62.5
+    ScanPanel._handle_progress_line(panel, "[progress] percent=10")
+    assert panel.progress["value"] == 10.0
+    assert panel.status_var.value == "Running... 10.0%"
+
+
+def test_zero_tracks_sql_limits_each_scope() -> None:
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    conn.executemany(
+        "INSERT INTO ableton_docs (path, ext, kind, scanned_at, tracks_total) "
+        "VALUES (?, '.als', 'set', 1, 0)",
+        [(f"/live/{idx}.als",) for idx in range(ZERO_TRACKS_AUDIT_LIMIT + 10)],
+    )
+    conn.execute(
+        "INSERT INTO ableton_docs_user_library (path, ext, kind, scanned_at, tracks_total) "
+        "VALUES ('/lib/A.als', '.als', 'set', 1, 0)"
+    )
+    conn.execute(
+        "INSERT INTO file_index_user_library (path, ext, size, mtime, kind, scanned_at) "
+        "VALUES ('/lib/A.als', '.als', 42, 1, 'ableton_doc', 1)"
+    )
+    rows = conn.execute(ZERO_TRACKS_SQL).fetchall()
+    conn.close()
+    scopes = [row[0] for row in rows]
+    assert scopes.count("live_recordings") == ZERO_TRACKS_AUDIT_LIMIT
+    assert ("user_library", "/lib/A.als", 0, None, None, 42) in rows